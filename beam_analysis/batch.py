@@ -0,0 +1,217 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from beam_analysis.design import (
+    CHECKS, DesignCriteria, DesignDemand, SectionCatalog, select_sections
+)
+from beam_analysis.beam import Beam
+from beam_analysis.model_io import model_from_dict
+from beam_analysis.result_cache import AnalysisResult, ResultCache, analyze
+
+# Result caches of a worker process, reused across the chunks it analyzes
+_worker_caches: Dict[Tuple[int, str | None], ResultCache | None] = {}
+
+
+def make_cache(
+    cache_size: int = 1024, cache_path: Path | None = None
+) -> ResultCache | None:
+    """Creates a result cache for the given settings (None if both tiers are off)."""
+    if cache_size == 0 and cache_path is None:
+        return None
+    return ResultCache(max_entries=cache_size, path=cache_path)
+
+
+def analyze_model(
+    data: Dict[str, Any], cache: ResultCache | None = None
+) -> Dict[str, Any]:
+    """
+    Analyzes one model dictionary and returns a JSON-serializable result.
+
+    Invalid models do not raise; the error is reported in the result instead
+    so that one bad model does not stop a batch. Models identical to one in
+    `cache` are not analyzed again.
+
+    Returns:
+        Dict[str, Any]: {"id", "reactions", "max_shear", "max_moment"} or
+            {"id", "error"}. Inputs that are not objects get a null id.
+    """
+    return _analyze_model(data, cache)[0]
+
+
+def _analyze_model(
+    data: Dict[str, Any], cache: ResultCache | None
+) -> Tuple[Dict[str, Any], Tuple[Beam, AnalysisResult] | None]:
+    """`analyze_model`, also returning the beam and its analysis (None on errors)."""
+    if not isinstance(data, dict):
+        return {"id": None, "error": "Invalid model: expected an object."}, None
+    model_id = data.get("id")
+    try:
+        beam, loads = model_from_dict(data)
+        result = analyze(beam, loads, cache=cache)
+    except (ValueError, TypeError, KeyError, AttributeError) as exc:
+        return {"id": model_id, "error": str(exc)}, None
+
+    reactions = result.reactions
+    (max_v, x_v), (max_m, x_m) = result.max_shear, result.max_moment
+    return {
+        "id": model_id,
+        "reactions": [
+            {"location": loc, "fy": rx['fy'], "m": rx['m']}
+            for loc, rx in reactions.items()
+        ],
+        "max_shear": {"value": max_v, "location": x_v},
+        "max_moment": {"value": max_m, "location": x_m},
+    }, (beam, result)
+
+
+def add_design(
+    results: List[Dict[str, Any]],
+    analyses: List[Tuple[Beam, AnalysisResult] | None],
+    catalog: SectionCatalog,
+    criteria: DesignCriteria | None = None,
+):
+    """
+    Adds the lightest passing section of each model to its result.
+
+    The demand comes from the analyses the results were made from (cached
+    ones included), so no model is analyzed again. All valid models are
+    checked against the whole catalog in one vectorized pass. The result gets
+    a "design" entry: {"section", "mass", "utilization": {"bending", "shear",
+    "deflection"}}, with a null section if no section passes.
+
+    Args:
+        results (List[Dict[str, Any]]): Results of `analyze_model`.
+        analyses (List[Tuple[Beam, AnalysisResult] | None]): The beam and
+            analysis of each result, None for invalid models.
+    """
+    valid = [
+        (result, analysis)
+        for result, analysis in zip(results, analyses)
+        if analysis is not None
+    ]
+    if not valid:
+        return
+    demand = DesignDemand.from_results(analysis for _, analysis in valid)
+    design = select_sections(demand, catalog, criteria)
+    for i, (result, _) in enumerate(valid):
+        if design.section[i] < 0:
+            result["design"] = {"section": None}
+            continue
+        result["design"] = {
+            "section": design.names[i],
+            "mass": float(design.mass[i]),
+            "utilization": dict(zip(CHECKS, design.utilization[i].tolist())),
+        }
+
+
+def analyze_chunk(
+    models: List[Dict[str, Any]],
+    cache_size: int = 1024,
+    cache_path: Path | None = None,
+    catalog: SectionCatalog | None = None,
+    criteria: DesignCriteria | None = None,
+) -> List[Dict[str, Any]]:
+    """Analyzes a chunk of models (the unit of work sent to a worker)."""
+    key = (cache_size, None if cache_path is None else str(cache_path))
+    if key not in _worker_caches:
+        _worker_caches[key] = make_cache(cache_size, cache_path)
+    if catalog is None:
+        return [analyze_model(data, _worker_caches[key]) for data in models]
+    results, analyses = _analyze_models(models, _worker_caches[key])
+    add_design(results, analyses, catalog, criteria)
+    return results
+
+
+def run_batch(
+    models: Iterable[Dict[str, Any]],
+    workers: int = 1,
+    chunk_size: int = 64,
+    cache_size: int = 1024,
+    cache_path: Path | None = None,
+    catalog: SectionCatalog | None = None,
+    criteria: DesignCriteria | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Analyzes models and yields one result per model as soon as it is ready.
+
+    With more than one worker, chunks of models are fanned out across a
+    process pool and results arrive in completion order. At most two chunks
+    per worker are in flight, so memory stays bounded however long the input
+    is. Models without an "id" get their position in the input as id.
+
+    Duplicate models are served from a result cache: an in-memory LRU per
+    process and, with `cache_path`, a SQLite file shared by all workers and
+    later runs.
+
+    Args:
+        models (Iterable[Dict[str, Any]]): Model dictionaries, read lazily.
+        workers (int): Number of worker processes (1 runs in-process).
+        chunk_size (int): Number of models per task.
+        cache_size (int): Results kept in memory per process (0 disables it).
+        cache_path (Path | None): SQLite file of the persistent cache tier.
+        catalog (SectionCatalog | None): If given, the lightest passing
+            section of every model is selected, one chunk at a time (see
+            `add_design`).
+        criteria (DesignCriteria | None): Parameters of the section check.
+
+    Yields:
+        Dict[str, Any]: The result of each model, see `analyze_model`.
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be positive.")
+    if cache_size < 0:
+        raise ValueError("Cache size cannot be negative.")
+
+    if workers == 1:
+        cache = make_cache(cache_size, cache_path)
+        try:
+            if catalog is None:
+                for data in _with_ids(models):
+                    yield analyze_model(data, cache)
+                return
+            for chunk in _chunks(_with_ids(models), chunk_size):
+                results, analyses = _analyze_models(chunk, cache)
+                add_design(results, analyses, catalog, criteria)
+                yield from results
+        finally:
+            if cache is not None:
+                cache.close()
+        return
+
+    chunks = _chunks(_with_ids(models), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in islice(chunks, 2 * workers):
+            pending.add(pool.submit(
+                analyze_chunk, chunk, cache_size, cache_path, catalog, criteria
+            ))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+                for chunk in islice(chunks, 1):
+                    pending.add(pool.submit(
+                        analyze_chunk, chunk, cache_size, cache_path, catalog, criteria
+                    ))
+
+
+def _analyze_models(
+    models: List[Dict[str, Any]], cache: ResultCache | None
+) -> Tuple[List[Dict[str, Any]], List[Tuple[Beam, AnalysisResult] | None]]:
+    pairs = [_analyze_model(data, cache) for data in models]
+    return [result for result, _ in pairs], [analysis for _, analysis in pairs]
+
+
+def _with_ids(models: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+    for i, data in enumerate(models):
+        if isinstance(data, dict) and data.get("id") is None:
+            data = {**data, "id": i}
+        yield data
+
+
+def _chunks(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
@@ -26,14 +26,24 @@ class Beam:
     Attributes:
         length (float): The total length of the beam in meters.
         supports (List[Support]): The list of supports on the beam.
+        E (float | None): Modulus of elasticity in kN/m^2. Only needed for
+                          deflections.
+        I (float | None): Second moment of area in m^4. Only needed for
+                          deflections.
     """
 
     length: float
     supports: List[Support]
+    E: float | None = None
+    I: float | None = None  # noqa: E741
 
     def __post_init__(self):
         if self.length <= 0:
             raise ValueError("Length must be positive.")
+        if self.E is not None and self.E <= 0:
+            raise ValueError("Modulus of elasticity must be positive.")
+        if self.I is not None and self.I <= 0:
+            raise ValueError("Second moment of area must be positive.")
 
         for support in self.supports:
             if support.location < 0 or support.location > self.length:
@@ -41,6 +51,13 @@ class Beam:
                     f"Support location must be within beam limits (0 to {self.length})."
                 )
 
+    @property
+    def EI(self) -> float | None:
+        """Flexural rigidity in kNm^2, or None if E or I is not set."""
+        if self.E is None or self.I is None:
+            return None
+        return self.E * self.I
+
     def __str__(self):
         supports_str = ", ".join([str(s) for s in self.supports])
         return f"Beam(length={self.length} m, supports=[{supports_str}])"
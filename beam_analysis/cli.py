@@ -1,25 +1,53 @@
+import os
+import sys
 import typer
-import inquirer
-import numpy as np
-from rich.console import Console
-from rich.table import Table
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from beam_analysis import instrumentation
 from beam_analysis.beam import Beam, Support, SupportType
-from beam_analysis.loads import PointLoad, UDL, PointMoment
-from beam_analysis.plotter import ASCIIPlotter
+
+# numpy, rich, inquirer, the load classes and the analysis modules are imported
+# where they are used, so that `--help` and short scripted calls start quickly.
 
 app = typer.Typer(
     help="Beam Analysis CLI - Saha Mühendisleri için Pratik Kiriş Analiz Aracı"
 )
-console = Console()
 
 
-def display_input_summary(beam, loads):
+class _LazyConsole:
+    """A rich Console that is only created (and imported) on first use."""
+
+    def __init__(self, **kwargs):
+        self._kwargs = kwargs
+        self._console = None
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+
+# Panels of `result_panels`, in display order
+RESULT_PANELS = ("reactions", "extrema", "schematic", "shear", "moment")
+
+
+def input_summary_table(beam, loads):
+    from rich.table import Table
+    from beam_analysis.loads import (
+        PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad,
+    )
+
     table = Table(title="Girdi Özeti")
     table.add_column("Parametre", style="cyan")
     table.add_column("Değer", style="magenta")
 
     table.add_row("Kiriş Uzunluğu", f"{beam.length} m")
-    
+
     for i, support in enumerate(beam.supports):
         table.add_row(f"Mesnet {i+1}", f"{support.type.name} @ {support.location}m")
 
@@ -40,57 +68,132 @@ def display_input_summary(beam, loads):
                 f"Yük {i+1} (Moment)",
                 f"Miktar: {load.moment} kNm, Konum: {load.location} m",
             )
+        elif isinstance(load, TrapezoidalLoad):
+            end_str = f"{load.end} m" if load.end is not None else "Kiriş Sonu"
+            table.add_row(
+                f"Yük {i+1} (Trapez)",
+                f"Miktar: {load.start_magnitude} → {load.end_magnitude} kN/m, "
+                f"Aralık: {load.start} - {end_str}",
+            )
+        elif isinstance(load, TabulatedLoad):
+            table.add_row(
+                f"Yük {i+1} (Tablo)",
+                f"{len(load.x)} nokta, "
+                f"Miktar: {load.q.min():g} .. {load.q.max():g} kN/m, "
+                f"Aralık: {load.start} - {load.end} m",
+            )
+
+    return table
+
+
+def display_input_summary(beam, loads):
+    console.print(input_summary_table(beam, loads))
+
+
+def result_panels(engine, panels=RESULT_PANELS) -> Dict[str, Any]:
+    """
+    Builds the requested result panels (see `RESULT_PANELS`) of an analysis.
+
+    Only the data needed by the requested panels is computed.
+
+    Returns:
+        Dict[str, Any]: Panel name -> rich renderable, in display order.
+    """
+    import numpy as np
+    from rich.table import Table
+    from beam_analysis.plotter import ASCIIPlotter
+
+    rendered: Dict[str, Any] = {}
+    if "shear" in panels or "moment" in panels:
+        with instrumentation.phase("cli.sample"):
+            x_points = np.linspace(0, engine.beam.length, 200)
+            v_points = engine.shear_at(x_points)
+            m_points = engine.moment_at(x_points)
+
+    with instrumentation.phase("cli.render"):
+        if "reactions" in panels:
+            r_table = Table(title="Mesnet Reaksiyonları")
+            r_table.add_column("Konum (m)", style="cyan")
+            r_table.add_column("Kuvvet (kN)", style="green")
+            r_table.add_column("Moment (kNm)", style="magenta")
+            for loc, rx in engine.calculate_reactions().items():
+                r_table.add_row(f"{loc}", f"{rx['fy']:.2f}", f"{rx['m']:.2f}")
+            rendered["reactions"] = r_table
+
+        if "extrema" in panels:
+            max_v, x_v = engine.get_max_shear_info()
+            max_m, x_m = engine.get_max_moment_info()
+            m_table = Table(title="Kritik Değerler")
+            m_table.add_column("Parametre", style="cyan")
+            m_table.add_column("Değer", style="magenta")
+            m_table.add_column("Konum (m)", style="yellow")
+            m_table.add_row(
+                "Maksimum Kesme (Vmax)", f"{abs(max_v):.2f} kN", f"{x_v:.2f}"
+            )
+            m_table.add_row(
+                "Maksimum Moment (Mmax)", f"{max_m:.2f} kNm", f"{x_m:.2f}"
+            )
+            rendered["extrema"] = m_table
+
+        # Diagrams
+        plotter = ASCIIPlotter(width=console.width - 10 if console.width > 20 else 60)
+        if "schematic" in panels:
+            rendered["schematic"] = plotter.plot_beam_schematic(
+                engine.beam, engine.loads
+            )
+        if "shear" in panels:
+            rendered["shear"] = plotter.plot(
+                x_points, v_points, title="Kesme Kuvveti Diyagramı (SFD) [kN]"
+            )
+        if "moment" in panels:
+            rendered["moment"] = plotter.plot(
+                x_points, m_points, title="Eğilme Momenti Diyagramı (BMD) [kNm]"
+            )
 
-    console.print(table)
+    return rendered
 
 
 def display_results(engine):
-    console.print("\n[bold]Analiz Sonuçları[/bold]")
-
-    # Reactions
-    reactions = engine.calculate_reactions()
-    r_table = Table(title="Mesnet Reaksiyonları")
-    r_table.add_column("Konum (m)", style="cyan")
-    r_table.add_column("Kuvvet (kN)", style="green")
-    r_table.add_column("Moment (kNm)", style="magenta")
-    for loc, rx in reactions.items():
-        r_table.add_row(f"{loc}", f"{rx['fy']:.2f}", f"{rx['m']:.2f}")
-    console.print(r_table)
-
-    # Max Values
-    max_v, x_v = engine.get_max_shear_info()
-    max_m, x_m = engine.get_max_moment_info()
-
-    m_table = Table(title="Kritik Değerler")
-    m_table.add_column("Parametre", style="cyan")
-    m_table.add_column("Değer", style="magenta")
-    m_table.add_column("Konum (m)", style="yellow")
-
-    m_table.add_row("Maksimum Kesme (Vmax)", f"{abs(max_v):.2f} kN", f"{x_v:.2f}")
-    m_table.add_row("Maksimum Moment (Mmax)", f"{max_m:.2f} kNm", f"{x_m:.2f}")
-
-    console.print(m_table)
-
-    # Diagrams
-    plotter = ASCIIPlotter(width=console.width - 10 if console.width > 20 else 60)
-    
-    # Beam Schematic
-    console.print(plotter.plot_beam_schematic(engine.beam, engine.loads))
-    
-    x_points = np.linspace(0, engine.beam.length, 200)
-
-    v_points = np.array([engine.get_shear_force(x) for x in x_points])
-    console.print(
-        plotter.plot(x_points, v_points, title="Kesme Kuvveti Diyagramı (SFD) [kN]")
-    )
+    # Analysis
+    engine.calculate_reactions()
+    engine.get_diagrams()
 
-    m_points = np.array([engine.get_bending_moment(x) for x in x_points])
-    console.print(
-        plotter.plot(x_points, m_points, title="Eğilme Momenti Diyagramı (BMD) [kNm]")
-    )
+    panels = result_panels(engine)
+    with instrumentation.phase("cli.render"):
+        console.print("\n[bold]Analiz Sonuçları[/bold]")
+        for panel in panels.values():
+            console.print(panel)
+
+
+def display_profile(output: Optional[Path] = None):
+    """Prints the collected timers and counters, or writes them as JSON."""
+    data = instrumentation.report()
+    if output is not None:
+        import json
+
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        return
+
+    from rich.console import Console
+    from rich.table import Table
+
+    # stderr keeps stdout clean for commands that write results there
+    err_console = Console(stderr=True)
+    p_table = Table(title="Profil")
+    p_table.add_column("Aşama", style="cyan")
+    p_table.add_column("Çağrı", style="yellow", justify="right")
+    p_table.add_column("Süre (ms)", style="magenta", justify="right")
+    for name, entry in data["phases"].items():
+        p_table.add_row(name, str(entry["calls"]), f"{entry['seconds'] * 1000:.2f}")
+    for name, value in data["counters"].items():
+        p_table.add_row(name, str(value), "")
+    err_console.print(p_table)
 
 
 def get_beam_info():
+    import inquirer
+
     q_length = [
         inquirer.Text(
             "length",
@@ -102,7 +205,7 @@ def get_beam_info():
     length = float(ans_length["length"])
 
     console.print("\n[bold]Mesnet Bilgilerini Girin[/bold]")
-    
+
     q_count = [
         inquirer.Text(
             "count",
@@ -112,7 +215,7 @@ def get_beam_info():
     ]
     ans_count = inquirer.prompt(q_count)
     count = int(ans_count["count"])
-    
+
     supports = []
     support_choices = [
         ("Sabit Mesnet (Pinned) - X,Y Tutulu", SupportType.PINNED),
@@ -123,16 +226,20 @@ def get_beam_info():
     for i in range(count):
         console.print(f"\n[cyan]--- {i+1}. Mesnet ---[/cyan]")
         q_support = [
-            inquirer.List("type", message=f"{i+1}. mesnet tipini seçin", choices=support_choices),
+            inquirer.List(
+                "type", message=f"{i+1}. mesnet tipini seçin", choices=support_choices
+            ),
             inquirer.Text(
-                "location", 
-                message=f"{i+1}. mesnet konumunu girin (0 - {length} m arası)", 
+                "location",
+                message=f"{i+1}. mesnet konumunu girin (0 - {length} m arası)",
                 validate=lambda _, x: 0 <= float(x) <= length
             )
         ]
         ans_support = inquirer.prompt(q_support)
-        supports.append(Support(location=float(ans_support["location"]), type=ans_support["type"]))
-    
+        supports.append(
+            Support(location=float(ans_support["location"]), type=ans_support["type"])
+        )
+
     # Sort supports by location to prevent confusion
     supports.sort(key=lambda s: s.location)
 
@@ -140,6 +247,9 @@ def get_beam_info():
 
 
 def get_loads(beam_length: float):
+    import inquirer
+    from beam_analysis.loads import PointLoad, UDL, PointMoment
+
     loads = []
     while True:
         choices = [
@@ -192,7 +302,7 @@ def get_loads(beam_length: float):
                 )
             ]
             ans_mag = inquirer.prompt(q_udl_mag)
-            
+
             q_udl_loc = [
                 inquirer.Text(
                     "start",
@@ -204,11 +314,13 @@ def get_loads(beam_length: float):
                     "end",
                     message=f"Bitiş konumunu girin (Start - {beam_length} m arası)",
                     default=str(beam_length),
-                    validate=lambda answers, x: float(answers["start"]) < float(x) <= beam_length,
+                    validate=lambda answers, x: (
+                        float(answers["start"]) < float(x) <= beam_length
+                    ),
                 )
             ]
             ans_loc = inquirer.prompt(q_udl_loc)
-            
+
             loads.append(UDL(
                 magnitude=float(ans_mag["magnitude"]),
                 start=float(ans_loc["start"]),
@@ -243,6 +355,31 @@ def get_loads(beam_length: float):
     return loads
 
 
+@app.callback(invoke_without_command=True)
+def cli(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False, "--profile", help="Aşama sürelerini ve sayaçları yazdırır"
+    ),
+    profile_output: Optional[Path] = typer.Option(
+        None,
+        "--profile-output",
+        help="Profil sonuçlarını JSON olarak bu dosyaya yazar (--profile gerekmez)",
+    ),
+):
+    """
+    Alt komut verilmezse kiriş analiz sihirbazını başlatır.
+    """
+    if profile or profile_output is not None:
+        # Only the main process is recorded (not batch workers)
+        instrumentation.reset()
+        instrumentation.enable()
+        ctx.call_on_close(lambda: display_profile(profile_output))
+
+    if ctx.invoked_subcommand is None:
+        main()
+
+
 @app.command()
 def main():
     """
@@ -271,5 +408,274 @@ def main():
     display_results(engine)
 
 
+def _parse_number(text: str, option: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        raise typer.BadParameter(f"Sayı bekleniyordu: '{text}'", param_hint=option)
+
+
+def _split_at(text: str, option: str) -> List[str]:
+    """Splits 'VALUE@POSITION' into its two parts."""
+    parts = text.split("@")
+    if len(parts) != 2:
+        raise typer.BadParameter(
+            f"'DEĞER@KONUM' bekleniyordu: '{text}'", param_hint=option
+        )
+    return parts
+
+
+def parse_support(text: str) -> Dict[str, Any]:
+    """Parses 'X' or 'X:TYPE' (e.g. '0:pinned') into a support dictionary."""
+    location, _, kind = text.partition(":")
+    kind = (kind or "ROLLER").upper()
+    if kind not in SupportType.__members__:
+        raise typer.BadParameter(
+            f"Bilinmeyen mesnet tipi: '{kind}'", param_hint="--support"
+        )
+    return {"location": _parse_number(location, "--support"), "type": kind}
+
+
+def parse_point(text: str) -> Dict[str, Any]:
+    """Parses 'FORCE@X' (e.g. '10@5') into a point load dictionary."""
+    force, location = _split_at(text, "--point")
+    return {
+        "type": "point",
+        "force": _parse_number(force, "--point"),
+        "location": _parse_number(location, "--point"),
+    }
+
+
+def parse_moment(text: str) -> Dict[str, Any]:
+    """Parses 'MOMENT@X' (e.g. '20@3') into a point moment dictionary."""
+    moment, location = _split_at(text, "--moment")
+    return {
+        "type": "moment",
+        "moment": _parse_number(moment, "--moment"),
+        "location": _parse_number(location, "--moment"),
+    }
+
+
+def parse_udl(text: str) -> Dict[str, Any]:
+    """Parses 'Q' (whole beam) or 'Q@START:END' (e.g. '5@0:4') into a UDL dictionary."""
+    magnitude, _, extent = text.partition("@")
+    load = {"type": "udl", "magnitude": _parse_number(magnitude, "--udl")}
+    if extent:
+        start, sep, end = extent.partition(":")
+        if not sep:
+            raise typer.BadParameter(
+                f"'Q@BAŞLANGIÇ:BİTİŞ' bekleniyordu: '{text}'", param_hint="--udl"
+            )
+        load["start"] = _parse_number(start, "--udl")
+        load["end"] = _parse_number(end, "--udl")
+    return load
+
+
+@app.command()
+def analyze(
+    length: float = typer.Option(..., "--length", "-l", help="Kiriş uzunluğu (m)"),
+    supports: List[str] = typer.Option(
+        ..., "--support", "-s",
+        help="Mesnet: KONUM[:TİP], örn. 0:pinned, 10:roller, 0:fixed",
+    ),
+    points: List[str] = typer.Option(
+        [], "--point", "-p",
+        help="Tekil yük: KUVVET@KONUM (kN, aşağı pozitif), örn. 10@5",
+    ),
+    udls: List[str] = typer.Option(
+        [], "--udl", "-u",
+        help="Yayılı yük: Q veya Q@BAŞLANGIÇ:BİTİŞ (kN/m), örn. 5@0:4",
+    ),
+    moments: List[str] = typer.Option(
+        [], "--moment", "-m", help="Tekil moment: MOMENT@KONUM (kNm, saat yönü pozitif)"
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="Tablolar yerine JSON sonucu yazdırır"
+    ),
+):
+    """
+    Kirişi seçeneklerle verilen mesnet ve yüklerle etkileşimsiz analiz eder.
+
+    Örnek: analyze -l 10 -s 0:pinned -s 10:roller -p 10@5 -u 2
+    """
+    data = {
+        "length": length,
+        "supports": [parse_support(text) for text in supports],
+        "loads": [parse_point(text) for text in points]
+        + [parse_udl(text) for text in udls]
+        + [parse_moment(text) for text in moments],
+    }
+
+    if as_json:
+        import json
+        from beam_analysis.batch import analyze_model
+
+        result = analyze_model(data)
+        typer.echo(json.dumps(result))
+        if "error" in result:
+            raise typer.Exit(code=1)
+        return
+
+    from beam_analysis.engine import AnalysisEngine
+    from beam_analysis.model_io import model_from_dict
+
+    try:
+        beam, loads = model_from_dict(data)
+        engine = AnalysisEngine(beam)
+        for load in loads:
+            engine.add_load(load)
+        engine.calculate_reactions()
+    except ValueError as exc:
+        console.print(f"[red]Hata: {exc}[/red]")
+        raise typer.Exit(code=1)
+
+    display_input_summary(beam, loads)
+    display_results(engine)
+
+
+@app.command()
+def batch(
+    inputs: List[Path] = typer.Argument(
+        ...,
+        help="Model dosyaları (.json, .jsonl veya .csv)",
+        exists=True,
+        dir_okay=False,
+    ),
+    output: Optional[Path] = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Sonuçların yazılacağı JSONL dosyası (varsayılan: stdout)",
+    ),
+    workers: int = typer.Option(
+        os.cpu_count() or 1, "--workers", "-w", min=1, help="Paralel işçi süreç sayısı"
+    ),
+    chunk_size: int = typer.Option(
+        64, "--chunk-size", min=1, help="Bir işçiye tek seferde gönderilen model sayısı"
+    ),
+    cache_size: int = typer.Option(
+        1024,
+        "--cache-size",
+        min=0,
+        help="Süreç başına bellekte tutulan sonuç sayısı (0: bellek önbelleği kapalı)",
+    ),
+    cache_path: Optional[Path] = typer.Option(
+        None,
+        "--cache",
+        help="Çalıştırmalar arasında korunan SQLite sonuç önbelleği dosyası",
+        dir_okay=False,
+    ),
+    catalog_path: Optional[Path] = typer.Option(
+        None,
+        "--catalog",
+        help="Kesit kataloğu CSV dosyası (name,mass,W,Av,I); "
+        "her model için en hafif uygun kesit seçilir",
+        exists=True,
+        dir_okay=False,
+    ),
+    fy: float = typer.Option(235.0, "--fy", min=0.0, help="Akma dayanımı (MPa)"),
+    deflection_limit: float = typer.Option(
+        250.0, "--deflection-limit", min=1.0, help="Sehim sınırı L / değer"
+    ),
+):
+    """
+    Model dosyalarındaki kirişleri etkileşimsiz olarak toplu analiz eder.
+
+    Her model için bir JSON satırı, analiz biter bitmez yazılır. Aynı
+    modeller önbellekten okunur ve yeniden çözülmez.
+    """
+    import json
+    from itertools import chain
+    from beam_analysis.batch import run_batch
+    from beam_analysis.design import DesignCriteria, SectionCatalog
+    from beam_analysis.model_io import read_models
+
+    catalog = None
+    if catalog_path is not None:
+        try:
+            catalog = SectionCatalog.read(catalog_path)
+        except ValueError as exc:
+            console.print(f"[red]Hata: {exc}[/red]")
+            raise typer.Exit(code=1)
+    criteria = DesignCriteria(fy=fy * 1e3, deflection_limit=deflection_limit)
+
+    models = chain.from_iterable(read_models(path) for path in inputs)
+    out = open(output, "w", encoding="utf-8") if output else sys.stdout
+    try:
+        results = run_batch(
+            models,
+            workers=workers,
+            chunk_size=chunk_size,
+            cache_size=cache_size,
+            cache_path=cache_path,
+            catalog=catalog,
+            criteria=criteria,
+        )
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+    finally:
+        if output:
+            out.close()
+
+
+def display_update(update):
+    """Prints what changed in a watched model and redraws its changed panels."""
+    if update.error is not None:
+        console.print(f"[red]{update.name}: Hata: {update.error}[/red]")
+        return
+    if update.deleted:
+        console.print(f"[yellow]{update.name}: model kaldırıldı[/yellow]")
+        return
+    if not update.panels:
+        console.print(f"[dim]{update.name}: sonuçlar değişmedi[/dim]")
+        return
+
+    if update.rebuilt:
+        change = "yeniden çözüldü"
+    else:
+        change = f"+{update.added} / -{update.removed} yük (artımlı güncelleme)"
+    console.rule(f"[bold]{update.name}[/bold] — {change}")
+    if "summary" in update.panels:
+        display_input_summary(update.beam, update.loads)
+    for panel in result_panels(update.engine, update.panels).values():
+        console.print(panel)
+
+
+@app.command()
+def watch(
+    paths: List[Path] = typer.Argument(
+        ...,
+        help="İzlenecek model dosyaları (.json, .jsonl, .csv) veya klasörler",
+        exists=True,
+    ),
+    interval: float = typer.Option(
+        0.5, "--interval", "-i", min=0.05, help="Dosyaların kontrol aralığı (s)"
+    ),
+    once: bool = typer.Option(
+        False, "--once", help="Dosyaları bir kez analiz edip çıkar"
+    ),
+):
+    """
+    Model dosyalarını izler ve değiştiklerinde analizi yeniler.
+
+    Kiriş aynı kaldıysa yalnızca değişen yükler hesaba katılır ve yalnızca
+    içeriği değişen paneller yeniden çizilir. Çıkmak için Ctrl+C.
+    """
+    import time
+    from beam_analysis.watch import ModelWatcher
+
+    watcher = ModelWatcher(paths)
+    try:
+        while True:
+            for update in watcher.poll():
+                display_update(update)
+            if once:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        console.print("[yellow]İzleme durduruldu.[/yellow]")
+
+
 if __name__ == "__main__":
     app()
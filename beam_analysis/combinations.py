@@ -0,0 +1,218 @@
+import itertools
+import re
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple
+from beam_analysis.beam import Beam
+from beam_analysis.load_cases import LoadCaseResults, analyze_load_cases
+from beam_analysis.loads import Load
+
+_TERM = re.compile(r"([+-]?)(?:(\d+(?:\.\d*)?|\.\d+)\*?)?([A-Za-z_]\w*)")
+
+
+@dataclass
+class LoadCombination:
+    """
+    A factored combination of named load cases.
+
+    A factor may be a sequence of alternatives (e.g. (1.0, 1.35) for a
+    permanent load that can be favourable or unfavourable). Such a rule
+    expands into one combination per choice of factors.
+
+    Attributes:
+        name (str): The name of the combination (e.g. "ULS").
+        factors (Mapping[str, float | Sequence[float]]): Partial factor(s) per
+            load case name. Cases that are not listed get a factor of 0.
+    """
+
+    name: str
+    factors: Mapping[str, float | Sequence[float]]
+
+    @classmethod
+    def from_expression(cls, name: str, expression: str) -> "LoadCombination":
+        """
+        Creates a combination from an expression such as "1.4G + 1.6Q".
+
+        Raises:
+            ValueError: If the expression cannot be parsed.
+        """
+        compact = expression.replace(" ", "")
+        factors: Dict[str, float] = {}
+        position = 0
+        while position < len(compact):
+            match = _TERM.match(compact, position)
+            if match is None or (position > 0 and not match.group(1)):
+                raise ValueError(f"Invalid combination expression: {expression!r}")
+            sign, factor, case = match.groups()
+            value = float(factor) if factor else 1.0
+            factors[case] = factors.get(case, 0.0) + (-value if sign == "-" else value)
+            position = match.end()
+        if not factors:
+            raise ValueError(f"Invalid combination expression: {expression!r}")
+        return cls(name=name, factors=factors)
+
+    def expand(self) -> List[Tuple[str, Dict[str, float]]]:
+        """
+        Expands the alternative factors into plain combinations.
+
+        Returns:
+            List[Tuple[str, Dict[str, float]]]: (name, factors) of every variant.
+        """
+        cases = list(self.factors)
+        options = [
+            [self.factors[case]] if np.isscalar(self.factors[case])
+            else list(self.factors[case])
+            for case in cases
+        ]
+        if all(len(option) == 1 for option in options):
+            return [(self.name, {case: float(f[0]) for case, f in zip(cases, options)})]
+
+        variants = []
+        for choice in itertools.product(*options):
+            label = "+".join(f"{factor:g}{case}" for case, factor in zip(cases, choice))
+            variants.append(
+                (f"{self.name} ({label})", dict(zip(cases, map(float, choice))))
+            )
+        return variants
+
+
+@dataclass
+class Bounds:
+    """
+    Maximum and minimum of a response over all combinations.
+
+    Also used for other families of results, e.g. the positions of a moving
+    load; the governing indices then refer to that family.
+
+    Attributes:
+        maximum (np.ndarray): Largest value at each station/support.
+        minimum (np.ndarray): Smallest value at each station/support.
+        max_governing (np.ndarray): Index of the combination giving `maximum`.
+        min_governing (np.ndarray): Index of the combination giving `minimum`.
+    """
+
+    maximum: np.ndarray
+    minimum: np.ndarray
+    max_governing: np.ndarray
+    min_governing: np.ndarray
+
+    @classmethod
+    def over_first_axis(cls, values: np.ndarray) -> "Bounds":
+        """Builds the bounds of a (combinations x ...) array."""
+        max_governing = np.argmax(values, axis=0)
+        min_governing = np.argmin(values, axis=0)
+        return cls(
+            maximum=np.take_along_axis(values, max_governing[None], axis=0)[0],
+            minimum=np.take_along_axis(values, min_governing[None], axis=0)[0],
+            max_governing=max_governing,
+            min_governing=min_governing,
+        )
+
+
+@dataclass
+class Envelope:
+    """
+    Min/max envelopes of a beam over a set of load combinations.
+
+    Attributes:
+        combinations (List[str]): Names of the (expanded) combinations; the
+            governing indices of every `Bounds` refer to this list.
+        factors (np.ndarray): (combinations x cases) matrix of partial factors.
+        stations (np.ndarray): Positions where shear and moment were sampled.
+        support_locations (np.ndarray): Support positions.
+        reactions (Bounds): Envelope of the (supports x 2) [fy, m] reactions.
+        shear (Bounds): Envelope of the shear force at each station.
+        moment (Bounds): Envelope of the bending moment at each station.
+    """
+
+    combinations: List[str]
+    factors: np.ndarray
+    stations: np.ndarray
+    support_locations: np.ndarray
+    reactions: Bounds
+    shear: Bounds
+    moment: Bounds
+
+    def governing(self, indices: np.ndarray) -> List[str]:
+        """Maps governing combination indices to combination names."""
+        return [self.combinations[i] for i in np.ravel(indices)]
+
+
+def factor_matrix(
+    case_names: List[str], combinations: List[LoadCombination]
+) -> Tuple[List[str], np.ndarray]:
+    """
+    Builds the (combinations x cases) partial factor matrix.
+
+    Raises:
+        KeyError: If a combination refers to an unknown load case.
+
+    Returns:
+        Tuple[List[str], np.ndarray]: Expanded combination names and factors.
+    """
+    column = {name: i for i, name in enumerate(case_names)}
+    names = []
+    rows = []
+    for combination in combinations:
+        for name, factors in combination.expand():
+            row = np.zeros(len(case_names))
+            for case, factor in factors.items():
+                if case not in column:
+                    raise KeyError(f"Unknown load case in {name}: {case}")
+                row[column[case]] = factor
+            names.append(name)
+            rows.append(row)
+    return names, np.array(rows).reshape(len(rows), len(case_names))
+
+
+def envelope(
+    results: LoadCaseResults, combinations: List[LoadCombination]
+) -> Envelope:
+    """
+    Computes envelopes by superposing per-case results.
+
+    The analysis is linear, so every combination is a factor-weighted sum of
+    the case results; all combinations are formed with one matrix product.
+
+    Args:
+        results (LoadCaseResults): Per-case results of the beam.
+        combinations (List[LoadCombination]): The combination rules.
+
+    Returns:
+        Envelope: Envelopes of reactions, shear and moment.
+    """
+    names, factors = factor_matrix(results.names, combinations)
+    if not names:
+        raise ValueError("At least one load combination is required.")
+
+    reactions = np.einsum("kc,csr->ksr", factors, results.reactions)
+    return Envelope(
+        combinations=names,
+        factors=factors,
+        stations=results.stations,
+        support_locations=results.support_locations,
+        reactions=Bounds.over_first_axis(reactions),
+        shear=Bounds.over_first_axis(factors @ results.shear),
+        moment=Bounds.over_first_axis(factors @ results.moment),
+    )
+
+
+def analyze_combinations(
+    beam: Beam,
+    load_cases: Mapping[str, List[Load]],
+    combinations: List[LoadCombination],
+    stations: np.ndarray | int = 201,
+) -> Envelope:
+    """
+    Analyzes the load cases once and returns the envelope of the combinations.
+
+    Args:
+        beam (Beam): The beam to be analyzed.
+        load_cases (Mapping[str, List[Load]]): Loads of each named case.
+        combinations (List[LoadCombination]): The combination rules.
+        stations (np.ndarray | int): Sample positions or their number.
+
+    Returns:
+        Envelope: Envelopes of reactions, shear and moment.
+    """
+    return envelope(analyze_load_cases(beam, load_cases, stations), combinations)
@@ -0,0 +1,240 @@
+import csv
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, List, Sequence, Tuple
+import numpy as np
+from beam_analysis.beam import Beam
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+from beam_analysis.result_cache import AnalysisResult, ResultCache, analyze
+
+# Columns of `utilizations`
+BENDING, SHEAR, DEFLECTION = 0, 1, 2
+CHECKS = ("bending", "shear", "deflection")
+
+
+@dataclass
+class DesignCriteria:
+    """
+    Material and serviceability parameters of the section check.
+
+    Attributes:
+        fy (float): Yield strength in kN/m^2 (235e3 = S235).
+        E (float): Modulus of elasticity in kN/m^2.
+        gamma_m0 (float): Partial factor of the cross-section resistance.
+        deflection_limit (float): Allowed deflection as a span ratio (L / limit).
+    """
+
+    fy: float = 235.0e3
+    E: float = 2.1e8
+    gamma_m0: float = 1.0
+    deflection_limit: float = 250.0
+
+
+class SectionCatalog:
+    """
+    A table of steel sections (e.g. IPE, HEA or W shapes) stored as arrays.
+
+    Attributes:
+        names (np.ndarray): Section designations.
+        mass (np.ndarray): Mass per length in kg/m.
+        W (np.ndarray): Section modulus about the bending axis in m^3.
+        Av (np.ndarray): Shear area in m^2.
+        I (np.ndarray): Second moment of area in m^4.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        mass: Sequence[float],
+        W: Sequence[float],
+        Av: Sequence[float],
+        I: Sequence[float],  # noqa: E741
+    ):
+        self.names = np.asarray(names, dtype=str)
+        self.mass = np.asarray(mass, dtype=float)
+        self.W = np.asarray(W, dtype=float)
+        self.Av = np.asarray(Av, dtype=float)
+        self.I = np.asarray(I, dtype=float)  # noqa: E741
+        columns = (self.names, self.mass, self.W, self.Av, self.I)
+        if len({len(column) for column in columns}) != 1:
+            raise ValueError("All catalog columns must have the same length.")
+        if any(np.any(column <= 0) for column in columns[1:]):
+            raise ValueError("Section properties must be positive.")
+
+    @classmethod
+    def read(cls, path: Path) -> "SectionCatalog":
+        """
+        Reads a catalog from a CSV file with the columns name, mass, W, Av
+        and I, in the units of steel tables: kg/m, cm^3, cm^2 and cm^4.
+        """
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+        try:
+            return cls(
+                names=[row["name"] for row in rows],
+                mass=[float(row["mass"]) for row in rows],
+                W=[float(row["W"]) * 1e-6 for row in rows],
+                Av=[float(row["Av"]) * 1e-4 for row in rows],
+                I=[float(row["I"]) * 1e-8 for row in rows],
+            )
+        except (KeyError, TypeError) as exc:
+            raise ValueError(f"Invalid section catalog: missing column {exc}") from exc
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass
+class DesignDemand:
+    """
+    The action effects of one or more beams, one entry per beam.
+
+    Attributes:
+        moment (np.ndarray): Maximum absolute bending moment in kNm.
+        shear (np.ndarray): Maximum absolute shear force in kN.
+        length (np.ndarray): Beam length in m (span of the deflection limit).
+        flexibility (np.ndarray): Maximum absolute deflection times EI in
+            kNm^3; the deflection of a section is flexibility / (E * I).
+    """
+
+    moment: np.ndarray
+    shear: np.ndarray
+    length: np.ndarray
+    flexibility: np.ndarray
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Tuple[Beam, AnalysisResult]]
+    ) -> "DesignDemand":
+        """
+        Collects the demand of (beam, result) pairs that are already analyzed.
+
+        Reactions, moments and shears of a prismatic beam do not depend on EI
+        and its deflections scale with 1 / EI, so the unit-EI deflection of
+        one analysis (`AnalysisResult.flexibility`) serves every section of
+        the catalog.
+        """
+        rows = [
+            (
+                abs(result.max_moment[0]),
+                abs(result.max_shear[0]),
+                beam.length,
+                result.flexibility,
+            )
+            for beam, result in results
+        ]
+        moment, shear, length, flexibility = (
+            np.array(rows, dtype=float).reshape(-1, 4).T
+        )
+        return cls(moment, shear, length, flexibility)
+
+    @classmethod
+    def from_models(
+        cls,
+        models: Iterable[Tuple[Beam, Iterable[Load] | LoadSet]],
+        cache: ResultCache | None = None,
+    ) -> "DesignDemand":
+        """Analyzes (beam, loads) pairs once each (see `from_results`)."""
+        return cls.from_results(
+            (beam, analyze(beam, loads, cache=cache)) for beam, loads in models
+        )
+
+    def __len__(self) -> int:
+        return len(self.moment)
+
+
+@dataclass
+class DesignResult:
+    """
+    The lightest passing section of each beam.
+
+    Attributes:
+        section (np.ndarray): Catalog index of the section, -1 if none passes.
+        names (List[str | None]): Section designations (None if none passes).
+        mass (np.ndarray): Mass per length in kg/m (NaN if none passes).
+        utilization (np.ndarray): (beams x 3) bending, shear and deflection
+            utilization of the selected section (NaN if none passes).
+    """
+
+    section: np.ndarray
+    names: List[str | None]
+    mass: np.ndarray
+    utilization: np.ndarray
+
+
+def utilizations(
+    demand: DesignDemand,
+    catalog: SectionCatalog,
+    criteria: DesignCriteria | None = None,
+) -> np.ndarray:
+    """
+    Checks every beam against every section in one vectorized pass.
+
+    Bending uses the elastic resistance W * fy / gamma_m0, shear the plastic
+    shear resistance Av * fy / (sqrt(3) * gamma_m0) and deflection the limit
+    L / deflection_limit.
+
+    Returns:
+        np.ndarray: (beams x sections x 3) utilizations, in the order of
+            `CHECKS`. A section passes if all three are at most 1.
+    """
+    criteria = criteria or DesignCriteria()
+    fy_d = criteria.fy / criteria.gamma_m0
+    result = np.empty((len(demand), len(catalog), 3))
+    result[:, :, BENDING] = demand.moment[:, None] / (catalog.W * fy_d)
+    result[:, :, SHEAR] = demand.shear[:, None] / (catalog.Av * fy_d / np.sqrt(3.0))
+    result[:, :, DEFLECTION] = (
+        demand.flexibility[:, None] / (criteria.E * catalog.I)
+    ) / (demand.length[:, None] / criteria.deflection_limit)
+    return result
+
+
+def select_sections(
+    demand: DesignDemand,
+    catalog: SectionCatalog,
+    criteria: DesignCriteria | None = None,
+    chunk_size: int = 4096,
+) -> DesignResult:
+    """
+    Finds the lightest passing section of every beam.
+
+    Beams are checked in chunks, so memory stays bounded for large batches
+    (chunk_size x sections x 3 utilizations at a time).
+
+    Args:
+        demand (DesignDemand): Action effects of the beams.
+        catalog (SectionCatalog): Candidate sections.
+        criteria (DesignCriteria | None): Material and deflection limits.
+        chunk_size (int): Number of beams checked at once.
+
+    Returns:
+        DesignResult: The selected section of each beam.
+    """
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    if len(catalog) == 0:
+        raise ValueError("Section catalog is empty.")
+    by_mass = np.argsort(catalog.mass, kind="stable")
+    n = len(demand)
+    section = np.full(n, -1, dtype=np.int64)
+    utilization = np.full((n, 3), np.nan)
+
+    for start in range(0, n, chunk_size):
+        rows = slice(start, start + chunk_size)
+        part = DesignDemand(
+            demand.moment[rows], demand.shear[rows],
+            demand.length[rows], demand.flexibility[rows],
+        )
+        util = utilizations(part, catalog, criteria)[:, by_mass]
+        passes = np.all(util <= 1.0, axis=2)
+        first = np.argmax(passes, axis=1)
+        found = passes[np.arange(len(first)), first]
+        chunk_section = np.where(found, by_mass[first], -1)
+        section[rows] = chunk_section
+        utilization[rows][found] = util[found, first[found]]
+
+    found = section >= 0
+    mass = np.where(found, catalog.mass[section], np.nan)
+    names = [str(catalog.names[i]) if i >= 0 else None for i in section]
+    return DesignResult(section, names, mass, utilization)
@@ -0,0 +1,275 @@
+import numpy as np
+from typing import Dict, Iterable, Tuple
+from beam_analysis.beam import Beam, SupportType
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+
+
+class PiecewisePolynomial:
+    """
+    A piecewise polynomial diagram (e.g. shear or moment) along the beam.
+
+    Segment i covers [breaks[i], breaks[i+1]) and is evaluated in the local
+    coordinate t = x - breaks[i]. The last segment starts at the beam end and
+    has zero width; it holds the values right of every action at the end, so
+    that the diagram is right-continuous everywhere, like `get_shear_force`.
+
+    Attributes:
+        breaks (np.ndarray): Sorted segment start positions, shape (n,).
+        coeffs (np.ndarray): Polynomial coefficients in increasing powers of t,
+                             shape (n, degree + 1).
+    """
+
+    def __init__(self, breaks: np.ndarray, coeffs: np.ndarray):
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.coeffs = np.asarray(coeffs, dtype=float)
+        self.widths = np.append(np.diff(self.breaks), 0.0)
+
+    def __call__(self, xs: np.ndarray, left: np.ndarray | bool = False) -> np.ndarray:
+        """
+        Evaluates the diagram at `xs` (right limits at discontinuities, left
+        limits where `left` is True).
+        """
+        xs = np.asarray(xs, dtype=float)
+        idx = np.searchsorted(self.breaks, xs, side="right") - 1
+        if np.any(left):
+            idx = np.where(left, np.searchsorted(self.breaks, xs, side="left") - 1, idx)
+        idx = np.clip(idx, 0, len(self.breaks) - 1)
+        return self._evaluate(idx, xs - self.breaks[idx])
+
+    def _evaluate(self, idx: np.ndarray, t: np.ndarray) -> np.ndarray:
+        """Evaluates segments `idx` at local coordinates `t` (Horner)."""
+        result = np.zeros(np.shape(t))
+        for power in range(self.coeffs.shape[1] - 1, -1, -1):
+            result = result * t + self.coeffs[idx, power]
+        return result
+
+    def left_limits(self) -> np.ndarray:
+        """Returns the value just left of every break (zero at the first one)."""
+        idx = np.arange(len(self.breaks) - 1)
+        return np.concatenate(([0.0], self._evaluate(idx, self.widths[:-1])))
+
+    def right_limits(self) -> np.ndarray:
+        """Returns the value just right of every break."""
+        return self.coeffs[:, 0].copy()
+
+    def derivative(self) -> "PiecewisePolynomial":
+        """Returns the derivative diagram."""
+        powers = np.arange(1, self.coeffs.shape[1])
+        coeffs = self.coeffs[:, 1:] * powers
+        if coeffs.shape[1] == 0:
+            coeffs = np.zeros((len(self.breaks), 1))
+        return PiecewisePolynomial(self.breaks, coeffs)
+
+    def antiderivative(self) -> "PiecewisePolynomial":
+        """Returns the integral from 0, continuous across the breaks."""
+        powers = np.arange(1, self.coeffs.shape[1] + 1)
+        coeffs = np.zeros((len(self.breaks), self.coeffs.shape[1] + 1))
+        coeffs[:, 1:] = self.coeffs / powers
+        # Integral over each segment, accumulated into the segment constants
+        segment_integrals = PiecewisePolynomial(self.breaks, coeffs)._evaluate(
+            np.arange(len(self.breaks)), self.widths
+        )
+        coeffs[:, 0] = _exclusive_cumsum(segment_integrals)
+        return PiecewisePolynomial(self.breaks, coeffs)
+
+    def stationary_points(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the interior points where the derivative vanishes.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (segment indices, local coordinates t).
+        """
+        seg, t = _real_roots(self.derivative().coeffs)
+        inside = (t > 0.0) & (t < self.widths[seg])
+        return seg[inside], t[inside]
+
+    def extremum(self) -> Tuple[float, float]:
+        """
+        Finds the value with the largest magnitude and its location.
+
+        Candidates are the left and right limits at every break and the
+        interior stationary points, so the result is exact.
+
+        Returns:
+            Tuple[float, float]: (value, location_x)
+        """
+        seg, t = self.stationary_points()
+        values = np.concatenate(
+            (self.right_limits(), self.left_limits(), self._evaluate(seg, t))
+        )
+        locations = np.concatenate((self.breaks, self.breaks, self.breaks[seg] + t))
+        idx = np.argmax(np.abs(values))
+        return float(values[idx]), float(locations[idx])
+
+
+def compile_diagrams(
+    beam: Beam,
+    loads: Iterable[Load] | LoadSet,
+    reactions: Dict[float, Dict[str, float]],
+) -> Tuple[PiecewisePolynomial, PiecewisePolynomial]:
+    """
+    Compiles the shear and moment diagrams of a solved beam.
+
+    Between consecutive event points (supports, point loads, moments and the
+    ends of distributed load pieces) the load intensity is linear, so shear is
+    at most quadratic and moment cubic. The intensity, shear and moment at
+    every break are accumulated with prefix sums (the cumulative trapezoid of
+    the load), so compiling is O(segments + loads) and evaluating V or M at
+    any x is one binary search plus a polynomial.
+
+    Args:
+        beam (Beam): The analyzed beam.
+        loads (Iterable[Load] | LoadSet): The applied loads.
+        reactions (Dict[float, Dict[str, float]]): Support reactions as returned
+            by `AnalysisEngine.calculate_reactions`.
+
+    Returns:
+        Tuple[PiecewisePolynomial, PiecewisePolynomial]: (shear, moment)
+    """
+    length = beam.length
+    loads = LoadSet.coerce(loads)
+
+    # Concentrated actions: upward forces and clockwise moments
+    n_points, n_moments = len(loads.point_forces), len(loads.moment_values)
+    locations = np.concatenate((
+        list(reactions), loads.point_locations, loads.moment_locations
+    ))
+    forces = np.concatenate((
+        [rx['fy'] for rx in reactions.values()],
+        -loads.point_forces,
+        np.zeros(n_moments),
+    ))
+    moments = np.concatenate((
+        [rx['m'] for rx in reactions.values()], np.zeros(n_points), loads.moment_values
+    ))
+    starts, ends, q_starts, q_ends = loads.distributed_segments(length)
+
+    on_beam = locations <= length
+    locations, forces, moments = locations[on_beam], forces[on_beam], moments[on_beam]
+
+    breaks = np.unique(np.concatenate(([0.0, length], locations, starts, ends)))
+    n = len(breaks)
+    widths = np.append(np.diff(breaks), 0.0)
+
+    # Jumps at the breaks
+    idx = np.searchsorted(breaks, locations)
+    jump_v = np.bincount(idx, weights=forces, minlength=n)
+    jump_m = np.bincount(idx, weights=moments, minlength=n)
+
+    # Distributed load on each segment, q(t) = q + slope * t (positive
+    # downwards): slopes and intensity jumps are summed at the piece ends
+    first, last = np.searchsorted(breaks, starts), np.searchsorted(breaks, ends)
+    slopes = (q_ends - q_starts) / (ends - starts)
+    slope = np.cumsum(
+        np.bincount(first, weights=slopes, minlength=n + 1)
+        - np.bincount(last, weights=slopes, minlength=n + 1)
+    )[:n]
+    jump_q = np.bincount(first, weights=q_starts, minlength=n + 1) - np.bincount(
+        last, weights=q_ends, minlength=n + 1
+    )
+    q = np.cumsum(jump_q[:n]) + _exclusive_cumsum(slope * widths)
+
+    # V and M just right of each break
+    load_on_segment = q * widths + slope * widths**2 / 2.0
+    v_right = np.cumsum(jump_v) - _exclusive_cumsum(load_on_segment)
+    area_on_segment = v_right * widths - q * widths**2 / 2.0 - slope * widths**3 / 6.0
+    m_right = np.cumsum(jump_m) + _exclusive_cumsum(area_on_segment)
+
+    shear = np.column_stack((v_right, -q, -slope / 2.0))
+    moment = np.column_stack((m_right, v_right, -q / 2.0, -slope / 6.0))
+    if not slope.any():
+        shear, moment = shear[:, :2], moment[:, :3]  # Uniform loads only
+    return PiecewisePolynomial(breaks, shear), PiecewisePolynomial(breaks, moment)
+
+
+def deflection_from_moment(
+    beam: Beam, moment: PiecewisePolynomial, EI: float = 1.0
+) -> PiecewisePolynomial:
+    """
+    Integrates a moment diagram twice into the deflection diagram.
+
+    The moment diagram of the solved beam already satisfies equilibrium, so
+    the two integration constants follow from the support conditions (zero
+    deflection at every support, zero rotation at fixed ones). No stiffness
+    solve is needed.
+
+    Args:
+        beam (Beam): The analyzed beam.
+        moment (PiecewisePolynomial): Its bending moment diagram.
+        EI (float): Flexural rigidity in kNm^2.
+
+    Returns:
+        PiecewisePolynomial: Deflection in m, positive downwards.
+    """
+    # Upward deflection y'' = M / EI, up to a + b x
+    rotation = PiecewisePolynomial(moment.breaks, moment.coeffs / EI).antiderivative()
+    y = rotation.antiderivative()
+
+    locations = np.array([s.location for s in beam.supports], dtype=float)
+    fixed = np.array(
+        [s.location for s in beam.supports if s.type == SupportType.FIXED]
+    )
+    A = np.vstack((
+        np.column_stack((np.ones_like(locations), locations)),
+        np.column_stack((np.zeros_like(fixed), np.ones_like(fixed))),
+    ))
+    rhs = -np.concatenate((y(locations), rotation(fixed)))
+    (a, b), *_ = np.linalg.lstsq(A, rhs, rcond=None)
+
+    coeffs = y.coeffs.copy()
+    coeffs[:, 0] += a + b * y.breaks
+    coeffs[:, 1] += b
+    return PiecewisePolynomial(y.breaks, -coeffs)
+
+
+def _real_roots(coeffs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Finds the real roots of many polynomials at once.
+
+    Polynomials are grouped by their effective degree. Linear and quadratic
+    ones are solved in closed form, higher degrees through the eigenvalues of
+    a stack of companion matrices.
+
+    Args:
+        coeffs (np.ndarray): (n x k) coefficients in increasing powers.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (row indices, roots), one entry per root.
+    """
+    nonzero = coeffs != 0.0
+    highest = coeffs.shape[1] - 1 - np.argmax(nonzero[:, ::-1], axis=1)
+    degree = np.where(nonzero.any(axis=1), highest, 0)
+
+    rows, roots = [np.array([], dtype=int)], [np.array([])]
+    for d in range(1, coeffs.shape[1]):
+        idx = np.nonzero(degree == d)[0]
+        if len(idx) == 0:
+            continue
+        c = coeffs[idx, : d + 1]
+        if d == 1:
+            found = (-c[:, 0] / c[:, 1])[:, None]
+        elif d == 2:
+            disc = c[:, 1] ** 2 - 4.0 * c[:, 2] * c[:, 0]
+            sqrt_disc = np.sqrt(np.where(disc >= 0.0, disc, np.nan))
+            found = np.stack(
+                [(-c[:, 1] + sqrt_disc), (-c[:, 1] - sqrt_disc)], axis=1
+            ) / (2.0 * c[:, 2:3])
+        else:
+            # Companion matrix of the monic polynomial
+            companion = np.zeros((len(idx), d, d))
+            companion[:, 1:, :-1] = np.eye(d - 1)
+            companion[:, :, -1] = -c[:, :d] / c[:, d:]
+            eig = np.linalg.eigvals(companion)
+            real = np.abs(eig.imag) <= 1e-9 * (1.0 + np.abs(eig.real))
+            found = np.where(real, eig.real, np.nan)
+        valid = np.isfinite(found)
+        rows.append(np.broadcast_to(idx[:, None], found.shape)[valid])
+        roots.append(found[valid])
+
+    return np.concatenate(rows), np.concatenate(roots)
+
+
+def _exclusive_cumsum(values: np.ndarray) -> np.ndarray:
+    """Cumulative sum that excludes the current element."""
+    return np.concatenate(([0.0], np.cumsum(values)[:-1]))
@@ -1,9 +1,17 @@
 import numpy as np
-from typing import List, Dict, Tuple
-from beam_analysis.beam import Beam
-from beam_analysis.loads import Load, PointLoad, UDL, PointMoment
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+from beam_analysis import instrumentation
+from beam_analysis.beam import Beam, SupportType
+from beam_analysis.diagram import PiecewisePolynomial, compile_diagrams
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
 from beam_analysis.solver import MatrixBeamSolver
 
+# Load edits kept as separate correction diagrams before the compiled
+# diagrams are rebuilt
+MAX_PENDING_EDITS = 16
+
 
 class AnalysisEngine:
     """
@@ -11,92 +19,170 @@ class AnalysisEngine:
 
     Attributes:
         beam (Beam): The beam to be analyzed.
-        loads (List[Load]): A list of loads applied to the beam.
+        loads (LoadSet): The loads applied to the beam. It can be read like a
+            list of load objects or through its NumPy arrays.
+        solve_count (int): Number of times the reactions were actually solved.
+            Queries served from the reaction cache do not increase it.
+
+    Reactions and internal forces are linear in the loads. Once the reactions
+    are solved, `add_load`, `remove_load` and `update_load` only analyze the
+    edited load: its reactions are added to the cached ones (by statics, or
+    with a stiffness factorization kept for the support layout) and its
+    shear and moment diagrams are kept as a small correction that point
+    queries add on top of the compiled diagrams.
     """
 
     def __init__(self, beam: Beam):
         self.beam = beam
-        self.loads: List[Load] = []
+        self.loads = LoadSet()
+        self.solve_count = 0
+        self._reactions: Dict[float, Dict[str, float]] | None = None
+        self._diagrams: Tuple[PiecewisePolynomial, PiecewisePolynomial] | None = None
+        self._solver: (
+            Tuple[MatrixBeamSolver, Dict[float, Dict[str, float]]] | None
+        ) = None
+        self._deflection: PiecewisePolynomial | None = None
+        self._pending: List[Tuple[PiecewisePolynomial, PiecewisePolynomial]] = []
+        self._topology: MatrixBeamSolver | None = None
 
     def add_load(self, load: Load):
         """Adds a load to the beam for analysis."""
         self.loads.append(load)
+        if self._reactions is None:
+            self.invalidate()  # Nothing solved yet, nothing to update
+        else:
+            self._apply_edit(LoadSet([load]))
+
+    def add_loads(self, loads: Iterable[Load] | LoadSet):
+        """
+        Adds many loads at once.
+
+        Passing a `LoadSet` (e.g. built with `LoadSet.add_point_loads` or read
+        with `LoadSet.read`) copies its arrays without creating load objects.
+        """
+        loads = LoadSet.coerce(loads)
+        self.loads.extend(loads)
+        self._apply_edit(loads)
+
+    def remove_load(self, load: int | Load) -> Load:
+        """
+        Removes a load.
+
+        Args:
+            load (int | Load): Index of the load, or a load equal to it (the
+                first match is removed).
+
+        Returns:
+            Load: The removed load.
+        """
+        index = self._index_of(load)
+        removed = self.loads[index]
+        del self.loads[index]
+        self._apply_edit(LoadSet([removed]).scaled(-1.0))
+        return removed
+
+    def update_load(self, load: int | Load, new_load: Load):
+        """
+        Replaces a load, keeping its position in `loads`.
+
+        Args:
+            load (int | Load): Index of the load, or a load equal to it.
+            new_load (Load): The replacement.
+        """
+        index = self._index_of(load)
+        delta = LoadSet([new_load])
+        delta.extend(LoadSet([self.loads[index]]).scaled(-1.0))
+        self.loads[index] = new_load
+        self._apply_edit(delta)
+
+    def _index_of(self, load: int | Load) -> int:
+        if isinstance(load, Load):
+            return self.loads.index(load)
+        return range(len(self.loads))[load]
+
+    def _apply_edit(self, delta: LoadSet):
+        """
+        Updates the cached results by the effect of a load change.
+
+        Args:
+            delta (LoadSet): The added loads, with removed loads negated.
+        """
+        self._solver = None
+        self._deflection = None
+        if self._reactions is None:
+            self._diagrams = None
+            return
+
+        if len(self.beam.supports) in (1, 2):
+            delta_reactions = solve_reactions(self.beam, delta)
+        else:
+            if self._topology is None:
+                self._topology = MatrixBeamSolver(self.beam, [])
+            delta_reactions = self._topology.solve_load_cases([delta])[0]
+        for location, rx in delta_reactions.items():
+            self._reactions[location]['fy'] += rx['fy']
+            self._reactions[location]['m'] += rx['m']
+        instrumentation.count("engine.incremental_updates")
+
+        if self._diagrams is not None:
+            if len(self._pending) < MAX_PENDING_EDITS:
+                self._pending.append(
+                    compile_diagrams(self.beam, delta, delta_reactions)
+                )
+            else:
+                self._diagrams = None
+                self._pending = []
+
+    def invalidate(self):
+        """
+        Discards cached analysis results.
+
+        Called by every method that mutates the loads. Call it manually after
+        changing `beam` (length or supports) in place.
+        """
+        self._reactions = None
+        self._diagrams = None
+        self._solver = None
+        self._deflection = None
+        self._pending = []
+        self._topology = None
 
     def calculate_reactions(self) -> Dict[float, Dict[str, float]]:
         """
         Calculates the reaction forces and moments at the supports.
-        
+
+        The result is computed once and reused until the model changes.
+
         Returns:
             Dict[float, Dict[str, float]]: A dictionary mapping support location 
                                            to a dict of reactions {'fy': force, 'm': moment}.
         """
-        from beam_analysis.beam import SupportType
-        
-        if len(self.beam.supports) == 1:
-            support = self.beam.supports[0]
-            if support.type != SupportType.FIXED:
-                raise ValueError("Single support must be FIXED.")
-            
-            total_vertical_force = 0.0
-            total_moment_at_support = 0.0
-            
-            for load in self.loads:
-                if isinstance(load, PointLoad):
-                    total_vertical_force += load.force
-                    total_moment_at_support += load.force * (load.location - support.location)
-                elif isinstance(load, UDL):
-                    start = load.start
-                    end = load.end if load.end is not None else self.beam.length
-                    end = min(end, self.beam.length)
-                    span_len = end - start
-                    if span_len > 0:
-                        total_load = load.magnitude * span_len
-                        centroid = start + (span_len / 2.0)
-                        total_vertical_force += total_load
-                        total_moment_at_support += total_load * (centroid - support.location)
-                elif isinstance(load, PointMoment):
-                    total_moment_at_support += load.moment
-            
-            # Reaction moment is opposite to the applied moment
-            return {support.location: {'fy': total_vertical_force, 'm': -total_moment_at_support}}
-
-        if len(self.beam.supports) != 2:
-            # Use the general matrix stiffness solver for other cases (e.g. indeterminate beams)
-            solver = MatrixBeamSolver(self.beam, self.loads)
-            return solver.solve_reactions()
-
-        s1, s2 = sorted(self.beam.supports, key=lambda s: s.location)
-        x1, x2 = s1.location, s2.location
-        l_span = x2 - x1
-
-        total_moment_x1 = 0.0
-        total_vertical_force = 0.0
-
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                total_moment_x1 += load.force * (load.location - x1)
-                total_vertical_force += load.force
-            elif isinstance(load, UDL):
-                start = load.start
-                end = load.end if load.end is not None else self.beam.length
-                end = min(end, self.beam.length)
-                
-                span_len = end - start
-                if span_len > 0:
-                    total_load = load.magnitude * span_len
-                    centroid = start + (span_len / 2.0)
-                    total_moment_x1 += total_load * (centroid - x1)
-                    total_vertical_force += total_load
-            elif isinstance(load, PointMoment):
-                total_moment_x1 += load.moment
-
-        r2 = total_moment_x1 / l_span
-        r1 = total_vertical_force - r2
-
-        return {
-            x1: {'fy': r1, 'm': 0.0},
-            x2: {'fy': r2, 'm': 0.0}
-        }
+        return {loc: dict(rx) for loc, rx in self._get_reactions().items()}
+
+    def _get_reactions(self) -> Dict[float, Dict[str, float]]:
+        """Returns the cached reactions, solving them first if needed."""
+        if self._reactions is None:
+            if len(self.beam.supports) > 2:
+                # Keep the solved FEM model: its displacements give deflections
+                self._reactions = self._get_solver()[1]
+            else:
+                with instrumentation.phase("engine.reactions"):
+                    self._reactions = solve_reactions(self.beam, self.loads)
+                self.solve_count += 1
+                instrumentation.count("engine.solves")
+        else:
+            instrumentation.count("engine.cache_hits")
+        return self._reactions
+
+    def _get_solver(self) -> Tuple[MatrixBeamSolver, Dict[float, Dict[str, float]]]:
+        """Returns the solved FEM model of the current loads and its reactions."""
+        if self._solver is None:
+            with instrumentation.phase("engine.reactions"):
+                solver = MatrixBeamSolver(self.beam, self.loads)
+                self._solver = (solver, solver.solve_reactions())
+            self.solve_count += 1
+            instrumentation.count("engine.solves")
+        return self._solver
 
     def get_shear_force(self, x: float) -> float:
         """
@@ -113,30 +199,7 @@ class AnalysisEngine:
                 f"Position x={x} is outside the beam limits (0 to {self.beam.length})."
             )
 
-        reactions = self.calculate_reactions()
-        v = 0.0
-
-        # Add reactions to the left of x
-        for support_loc, rx in reactions.items():
-            if support_loc <= x:
-                v += rx['fy']
-
-        # Add loads to the left of x
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                if load.location <= x:
-                    v -= load.force
-            elif isinstance(load, UDL):
-                start = load.start
-                end = load.end if load.end is not None else self.beam.length
-                
-                if x > start:
-                    effective_end = min(x, end)
-                    span = effective_end - start
-                    if span > 0:
-                        v -= load.magnitude * span
-
-        return v
+        return float(self.shear_at(np.array([x]))[0])
 
     def get_bending_moment(self, x: float) -> float:
         """
@@ -153,88 +216,323 @@ class AnalysisEngine:
                 f"Position x={x} is outside the beam limits (0 to {self.beam.length})."
             )
 
-        reactions = self.calculate_reactions()
-        m = 0.0
-
-        # Moment from reactions to the left of x
-        for support_loc, rx in reactions.items():
-            if support_loc <= x:
-                m += rx['fy'] * (x - support_loc)
-                m += rx['m']  # Include reaction moment (like fixed support)
-
-        # Moment from loads to the left of x
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                if load.location <= x:
-                    m -= load.force * (x - load.location)
-            elif isinstance(load, UDL):
-                start = load.start
-                end = load.end if load.end is not None else self.beam.length
-                
-                if x > start:
-                    effective_end = min(x, end)
-                    span = effective_end - start
-                    if span > 0:
-                        load_portion = load.magnitude * span
-                        centroid = start + (span / 2.0)
-                        m -= load_portion * (x - centroid)
-            elif isinstance(load, PointMoment):
-                if load.location <= x:
-                    m += load.moment
-
-        return m
+        return float(self.moment_at(np.array([x]))[0])
+
+    def shear_at(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the shear force at every position in `xs`.
+
+        Array counterpart of `get_shear_force`, evaluated on the compiled
+        diagram with one `searchsorted` over the segment breaks.
+
+        Args:
+            xs (np.ndarray): Positions along the beam (0 to length).
+
+        Returns:
+            np.ndarray: Shear forces in kN, same shape as `xs`.
+        """
+        xs = self._check_positions(xs)
+        return self._evaluate(0, xs)
+
+    def moment_at(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the bending moment at every position in `xs`.
+
+        Array counterpart of `get_bending_moment`.
+
+        Args:
+            xs (np.ndarray): Positions along the beam (0 to length).
+
+        Returns:
+            np.ndarray: Bending moments in kNm, same shape as `xs`.
+        """
+        xs = self._check_positions(xs)
+        return self._evaluate(1, xs)
+
+    def _evaluate(self, which: int, xs: np.ndarray) -> np.ndarray:
+        """Evaluates the shear (0) or moment (1) diagram, pending edits included."""
+        if self._diagrams is None or not self._pending:
+            return self.get_diagrams()[which](xs)
+        instrumentation.count("engine.cache_hits")
+        values = self._diagrams[which](xs)
+        for diagrams in self._pending:
+            values = values + diagrams[which](xs)
+        return values
+
+    def get_diagrams(self) -> Tuple[PiecewisePolynomial, PiecewisePolynomial]:
+        """
+        Returns the compiled shear and moment diagrams.
+
+        The model is compiled once into per-segment polynomials and reused
+        until the loads change. Indeterminate beams take them from the element
+        end forces of the FEM solve (`MatrixBeamSolver.internal_force_diagrams`),
+        determinate ones from statics. After load edits they are recompiled
+        from the updated reactions, without a new solve.
+
+        Returns:
+            Tuple[PiecewisePolynomial, PiecewisePolynomial]: (shear, moment)
+        """
+        if self._pending:
+            self._diagrams = None
+            self._pending = []
+        if self._diagrams is None:
+            reactions = self._get_reactions()
+            with instrumentation.phase("engine.compile_diagrams"):
+                if len(self.beam.supports) > 2 and self._solver is not None:
+                    self._diagrams = self._solver[0].internal_force_diagrams()
+                else:
+                    self._diagrams = compile_diagrams(self.beam, self.loads, reactions)
+        else:
+            instrumentation.count("engine.cache_hits")
+        return self._diagrams
+
+    def _check_positions(self, xs: np.ndarray) -> np.ndarray:
+        """Validates that all positions lie on the beam."""
+        xs = np.asarray(xs, dtype=float)
+        if xs.size and (xs.min() < 0 or xs.max() > self.beam.length):
+            raise ValueError(
+                f"Positions must be within the beam limits (0 to {self.beam.length})."
+            )
+        instrumentation.count("engine.points_evaluated", xs.size)
+        return xs
+
+    def iter_diagrams(
+        self, stations: int, chunk_size: int = 65536, deflection: bool = False
+    ) -> Iterator[Tuple[np.ndarray, ...]]:
+        """
+        Evaluates the diagrams at evenly spaced stations, one chunk at a time.
+
+        Only one chunk is held in memory, so any number of stations can be
+        streamed (e.g. to a file with `export_diagrams`).
+
+        Args:
+            stations (int): Number of stations from 0 to the beam length (>= 2).
+            chunk_size (int): Number of stations per chunk.
+            deflection (bool): Also yield deflections (needs E and I).
+
+        Yields:
+            Tuple[np.ndarray, ...]: (x, V, M) or (x, V, M, deflection) arrays
+                of one chunk.
+        """
+        if stations < 2 or chunk_size < 1:
+            raise ValueError(
+                "At least 2 stations and a positive chunk size are required."
+            )
+        deflection_diagram = self.get_deflection_diagram() if deflection else None
+        step = self.beam.length / (stations - 1)
+        for start in range(0, stations, chunk_size):
+            xs = np.arange(start, min(start + chunk_size, stations)) * step
+            if start + chunk_size >= stations:
+                xs[-1] = self.beam.length  # Exact end despite rounding
+            instrumentation.count("engine.points_evaluated", xs.size)
+            chunk = (xs, self._evaluate(0, xs), self._evaluate(1, xs))
+            if deflection_diagram is not None:
+                chunk += (deflection_diagram(xs),)
+            yield chunk
+
+    def export_diagrams(
+        self,
+        path: Path,
+        stations: int,
+        chunk_size: int = 65536,
+        deflection: bool = False,
+    ) -> int:
+        """
+        Writes the diagrams at evenly spaced stations to a .npy or .csv file.
+
+        Chunks from `iter_diagrams` are written as they are evaluated, so
+        memory use does not depend on `stations`. A .npy file holds one
+        (stations x columns) float64 array; a CSV file has the header
+        "x,V,M" (plus ",deflection").
+
+        Returns:
+            int: Number of rows written.
+
+        Raises:
+            ValueError: If the file extension is not supported.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        if suffix not in (".npy", ".csv"):
+            raise ValueError(f"Unsupported diagram file: {path}")
+        columns = ["x", "V", "M"] + (["deflection"] if deflection else [])
+        chunks = self.iter_diagrams(stations, chunk_size, deflection)
+
+        with open(path, "wb") as f:
+            if suffix == ".npy":
+                np.lib.format.write_array_header_2_0(f, {
+                    "descr": np.lib.format.dtype_to_descr(np.dtype(float)),
+                    "fortran_order": False,
+                    "shape": (stations, len(columns)),
+                })
+                for chunk in chunks:
+                    np.column_stack(chunk).tofile(f)
+            else:
+                f.write((",".join(columns) + "\n").encode())
+                for chunk in chunks:
+                    np.savetxt(f, np.column_stack(chunk), fmt="%.12g", delimiter=",")
+        return stations
+
+    def get_deflection_diagram(self) -> PiecewisePolynomial:
+        """
+        Returns the deflection diagram (positive downwards, in m).
+
+        It reuses the displacement vector of the FEM reaction solve, so for
+        indeterminate beams it costs no extra solve. Its derivative is the
+        rotation (positive clockwise).
+
+        Raises:
+            ValueError: If the beam has no E and I.
+        """
+        if self.beam.EI is None:
+            raise ValueError("Beam E and I must be set to compute deflections.")
+        if self._deflection is None:
+            self._get_reactions()
+            self._deflection = self._get_solver()[0].deflection_diagram()
+        return self._deflection
+
+    def deflection_at(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the deflection at every position in `xs`.
+
+        Args:
+            xs (np.ndarray): Positions along the beam (0 to length).
+
+        Returns:
+            np.ndarray: Deflections in m (positive downwards).
+        """
+        xs = self._check_positions(xs)
+        return self.get_deflection_diagram()(xs)
+
+    def rotation_at(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Calculates the rotation at every position in `xs`.
+
+        Args:
+            xs (np.ndarray): Positions along the beam (0 to length).
+
+        Returns:
+            np.ndarray: Rotations in rad (positive clockwise).
+        """
+        xs = self._check_positions(xs)
+        return self.get_deflection_diagram().derivative()(xs)
+
+    def get_nodal_displacements(self) -> Dict[float, Dict[str, float]]:
+        """
+        Returns the deflection and rotation at every FEM node.
+
+        Returns:
+            Dict[float, Dict[str, float]]: A dictionary mapping node location
+                to {'v': deflection (m, down), 'theta': rotation (rad, CW)}.
+        """
+        self.get_deflection_diagram()
+        solver = self._get_solver()[0]
+        v, theta = solver.nodal_displacements()
+        return {
+            float(x): {'v': float(v_i), 'theta': float(t_i)}
+            for x, v_i, t_i in zip(solver.nodes, v, theta)
+        }
+
+    def get_max_deflection_info(self) -> Tuple[float, float]:
+        """
+        Finds the maximum deflection and its location.
+
+        Returns:
+            Tuple[float, float]: (max_deflection_value, location_x)
+        """
+        return self.get_deflection_diagram().extremum()
 
     def get_max_shear_info(self) -> Tuple[float, float]:
         """
         Finds the maximum shear force and its location.
 
+        The extremum is exact: it is taken from the left and right limits at
+        every discontinuity of the compiled diagram.
+
         Returns:
             Tuple[float, float]: (max_shear_value, location_x)
         """
-        x_points = np.linspace(0, self.beam.length, 1000)
-        v_points = [self.get_shear_force(x) for x in x_points]
-
-        # For point loads, we should also check just before the load location
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                if load.location > 0.001:
-                    v_points.append(self.get_shear_force(load.location - 0.001))
-                v_points.append(self.get_shear_force(load.location))
-
-        v_abs = [abs(v) for v in v_points]
-        max_idx = np.argmax(v_abs)
-        # Simplified: if multiple max, we just take one.
-        # This is a bit rough for location, but good enough for MVP.
-        return v_points[max_idx], x_points[min(max_idx, len(x_points) - 1)]
+        return self.get_diagrams()[0].extremum()
 
     def get_max_moment_info(self) -> Tuple[float, float]:
         """
         Finds the maximum bending moment and its location.
 
+        The extremum is exact: candidates are the segment ends (both sides of
+        every point moment) and the zero crossings of the shear force.
+
         Returns:
             Tuple[float, float]: (max_moment_value, location_x)
         """
-        x_points = np.linspace(0, self.beam.length, 1000)
-        # Also include load locations and support locations for exact results
-        critical_points = set(x_points)
-        critical_points.update([s.location for s in self.beam.supports])
-        # Add middle of the beam as it's critical for UDL (legacy)
-        critical_points.add(self.beam.length / 2.0)
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                critical_points.add(load.location)
-            elif isinstance(load, PointMoment):
-                critical_points.add(load.location)
-                if load.location > 0.001:
-                    critical_points.add(load.location - 0.001)
-            elif isinstance(load, UDL):
-                critical_points.add(load.start)
-                end = load.end if load.end is not None else self.beam.length
-                critical_points.add(end)
-
-        sorted_points = sorted(list(critical_points))
-        m_points = [self.get_bending_moment(x) for x in sorted_points]
-
-        m_abs = [abs(m) for m in m_points]
-        max_idx = np.argmax(m_abs)
-        return m_points[max_idx], sorted_points[max_idx]
+        return self.get_diagrams()[1].extremum()
+
+
+def solve_reactions(
+    beam: Beam, loads: Iterable[Load] | LoadSet
+) -> Dict[float, Dict[str, float]]:
+    """
+    Solves the support reactions of a beam under the given loads.
+
+    Beams with a single fixed support or two supports are solved by statics,
+    all other support layouts by `MatrixBeamSolver`.
+
+    Args:
+        beam (Beam): The beam to be analyzed.
+        loads (Iterable[Load] | LoadSet): The applied loads.
+
+    Returns:
+        Dict[float, Dict[str, float]]: A dictionary mapping support location
+            to a dict of reactions {'fy': force, 'm': moment}.
+
+    Raises:
+        ValueError: If a single support is not fixed or two supports coincide.
+    """
+    loads = LoadSet.coerce(loads)
+
+    if len(beam.supports) == 1:
+        support = beam.supports[0]
+        if support.type != SupportType.FIXED:
+            raise ValueError("Single support must be FIXED.")
+
+    if len(beam.supports) not in (1, 2):
+        # Use the general matrix stiffness solver for other cases
+        # (e.g. indeterminate beams)
+        solver = MatrixBeamSolver(beam, loads)
+        return solver.solve_reactions()
+
+    # Distributed loads as linear pieces q_start -> q_end over [start, end]
+    starts, ends, q_starts, q_ends = loads.distributed_segments(beam.length)
+    widths = ends - starts
+    total_vertical_force = float(
+        loads.point_forces.sum() + ((q_starts + q_ends) * widths).sum() / 2.0
+    )
+    applied_moment = float(loads.moment_values.sum())
+
+    def moment_about(x0: float) -> float:
+        """Moment of all loads about x0 (clockwise positive)."""
+        a, b = starts - x0, ends - x0
+        distributed = widths * (q_starts * (2 * a + b) + q_ends * (a + 2 * b)) / 6.0
+        points = loads.point_forces @ (loads.point_locations - x0)
+        return float(points + distributed.sum()) + applied_moment
+
+    if len(beam.supports) == 1:
+        x0 = beam.supports[0].location
+        total_moment_at_support = moment_about(x0)
+        # Reaction moment is opposite to the applied moment
+        return {x0: {'fy': total_vertical_force, 'm': -total_moment_at_support}}
+
+    s1, s2 = sorted(beam.supports, key=lambda s: s.location)
+    x1, x2 = s1.location, s2.location
+    if x1 == x2:
+        raise ValueError("Supports coincide.")
+    l_span = x2 - x1
+
+    total_moment_x1 = moment_about(x1)
+
+    r2 = total_moment_x1 / l_span
+    r1 = total_vertical_force - r2
+
+    return {
+        x1: {'fy': r1, 'm': 0.0},
+        x2: {'fy': r2, 'm': 0.0}
+    }
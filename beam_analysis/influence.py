@@ -0,0 +1,205 @@
+import numpy as np
+from dataclasses import dataclass
+from scipy import sparse
+from typing import Sequence, Tuple
+from beam_analysis.beam import Beam
+from beam_analysis.combinations import Bounds
+from beam_analysis.solver import MatrixBeamSolver
+
+
+class InfluenceLines:
+    """
+    Influence lines of a beam for a unit downward point load.
+
+    The reaction influence lines are solved once per beam topology: a single
+    `MatrixBeamSolver` meshed at the supports is factorized and every unit
+    load position is one right-hand side. Shear and moment influence lines at
+    any section follow from the reactions by statics.
+
+    Attributes:
+        beam (Beam): The beam.
+        positions (np.ndarray): Evenly spaced unit load positions.
+        support_locations (np.ndarray): Support positions.
+        reactions (np.ndarray): (positions x supports x 2) [fy, m] reactions.
+    """
+
+    def __init__(self, beam: Beam, resolution: int = 2001):
+        if resolution < 2:
+            raise ValueError("Resolution must be at least 2.")
+        self.beam = beam
+        self.positions = np.linspace(0.0, beam.length, resolution)
+        self.support_locations = np.array(
+            [support.location for support in beam.supports], dtype=float
+        )
+        solver = MatrixBeamSolver(beam, [])
+        self.reactions = solver.unit_load_reactions(self.positions)
+
+    def shear(self, sections: Sequence[float]) -> np.ndarray:
+        """
+        Influence lines of the shear force at the given sections.
+
+        Returns:
+            np.ndarray: (positions x sections) shear for a unit load at each position.
+        """
+        sections = np.atleast_1d(np.asarray(sections, dtype=float))
+        smooth_v, _ = self._reaction_parts(sections)
+        return self.reactions.reshape(len(self.positions), -1) @ smooth_v - (
+            self.positions[:, None] <= sections
+        )
+
+    def moment(self, sections: Sequence[float]) -> np.ndarray:
+        """
+        Influence lines of the bending moment at the given sections.
+
+        Returns:
+            np.ndarray: (positions x sections) moment for a unit load at each position.
+        """
+        sections = np.atleast_1d(np.asarray(sections, dtype=float))
+        _, smooth_m = self._reaction_parts(sections)
+        lever = sections - self.positions[:, None]
+        return self.reactions.reshape(len(self.positions), -1) @ smooth_m - np.where(
+            lever >= 0, lever, 0.0
+        )
+
+    def _reaction_parts(self, sections: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Weights that turn the flattened [fy, m] reactions into V and M.
+
+        Only reactions at or to the left of a section contribute, like in
+        `AnalysisEngine.get_shear_force`.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (supports * 2 x sections) weights
+                for the shear and the moment.
+        """
+        left = (self.support_locations[:, None] <= sections).astype(float)
+        arm = (sections - self.support_locations[:, None]) * left
+        weights_v = np.stack([left, np.zeros_like(left)], axis=1)
+        weights_m = np.stack([arm, left], axis=1)
+        n_rows = 2 * len(self.support_locations)
+        return weights_v.reshape(n_rows, -1), weights_m.reshape(n_rows, -1)
+
+
+@dataclass
+class AxleTrain:
+    """
+    A train of axle loads moving along the beam.
+
+    Attributes:
+        loads (Sequence[float]): Axle loads in kN, from the lead axle backwards.
+                                 Positive is downwards.
+        spacings (Sequence[float]): Distances between consecutive axles in meters.
+    """
+
+    loads: Sequence[float]
+    spacings: Sequence[float] = ()
+
+    def __post_init__(self):
+        if len(self.loads) == 0:
+            raise ValueError("An axle train needs at least one axle.")
+        if len(self.spacings) != len(self.loads) - 1:
+            raise ValueError("There must be one spacing between each pair of axles.")
+        if any(spacing < 0 for spacing in self.spacings):
+            raise ValueError("Axle spacings cannot be negative.")
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """Distance of every axle behind the lead axle."""
+        return np.concatenate(([0.0], np.cumsum(self.spacings, dtype=float)))
+
+    @property
+    def length(self) -> float:
+        """Distance from the lead axle to the last axle."""
+        return float(np.sum(self.spacings))
+
+    def reversed(self) -> "AxleTrain":
+        """The same train travelling in the opposite direction."""
+        return AxleTrain(list(self.loads)[::-1], list(self.spacings)[::-1])
+
+
+@dataclass
+class MovingLoadResult:
+    """
+    Extreme responses of a beam while an axle train crosses it.
+
+    The governing indices of every `Bounds` refer to `lead_positions`.
+
+    Attributes:
+        lead_positions (np.ndarray): Positions of the lead axle.
+        sections (np.ndarray): Sections where shear and moment were tracked.
+        reactions (Bounds): Envelope of the (supports x 2) [fy, m] reactions.
+        shear (Bounds): Envelope of the shear force at each section.
+        moment (Bounds): Envelope of the bending moment at each section.
+    """
+
+    lead_positions: np.ndarray
+    sections: np.ndarray
+    reactions: Bounds
+    shear: Bounds
+    moment: Bounds
+
+
+def moving_load(
+    influence: InfluenceLines,
+    train: AxleTrain,
+    sections: Sequence[float] = (),
+    n_positions: int = 2001,
+) -> MovingLoadResult:
+    """
+    Moves an axle train across the beam and tracks the extreme responses.
+
+    The train is applied at every lead position at once: the axle pattern is
+    convolved with the influence lines through a sparse interpolation matrix
+    (one row per lead position), so thousands of positions cost a few matrix
+    products. The unit jump of the shear and the kink of the moment at each
+    section are added exactly rather than interpolated.
+
+    Args:
+        influence (InfluenceLines): Influence lines of the beam.
+        train (AxleTrain): The moving axle loads.
+        sections (Sequence[float]): Sections to track shear and moment at.
+        n_positions (int): Number of lead axle positions, from the lead axle
+            entering the beam to the last axle leaving it.
+
+    Returns:
+        MovingLoadResult: Envelopes of reactions, shear and moment.
+    """
+    length = influence.beam.length
+    sections = np.atleast_1d(np.asarray(sections, dtype=float))
+    loads = np.asarray(train.loads, dtype=float)
+
+    lead_positions = np.linspace(0.0, length + train.length, n_positions)
+    axle_x = lead_positions[:, None] - train.offsets
+    on_beam = (axle_x >= 0.0) & (axle_x <= length)
+
+    # Linear interpolation of the influence lines at every axle position
+    grid = influence.positions
+    step = grid[1] - grid[0]
+    rows, axles = np.nonzero(on_beam)
+    x = axle_x[rows, axles]
+    left = np.clip(np.floor(x / step).astype(int), 0, len(grid) - 2)
+    t = (x - grid[left]) / step
+    weights = sparse.csr_matrix(
+        (
+            np.concatenate((loads[axles] * (1.0 - t), loads[axles] * t)),
+            (np.concatenate((rows, rows)), np.concatenate((left, left + 1))),
+        ),
+        shape=(n_positions, len(grid)),
+    )
+
+    reactions = np.asarray(weights @ influence.reactions.reshape(len(grid), -1))
+    smooth_v, smooth_m = influence._reaction_parts(sections)
+
+    # Exact contributions of the axles left of each section
+    behind = on_beam[:, :, None] & (axle_x[:, :, None] <= sections)
+    lever = np.where(behind, sections - axle_x[:, :, None], 0.0)
+    shear = reactions @ smooth_v - np.einsum("k,pks->ps", loads, behind)
+    moment = reactions @ smooth_m - np.einsum("k,pks->ps", loads, lever)
+
+    return MovingLoadResult(
+        lead_positions=lead_positions,
+        sections=sections,
+        reactions=Bounds.over_first_axis(reactions.reshape(n_positions, -1, 2)),
+        shear=Bounds.over_first_axis(shear),
+        moment=Bounds.over_first_axis(moment),
+    )
@@ -0,0 +1,151 @@
+"""
+Lightweight phase timers and counters for the analysis hot paths.
+
+Instrumentation is off by default. While it is off, `phase` returns a shared
+no-op context manager and `count` returns after a single flag check, so the
+instrumented code pays next to nothing. Enable it around a run with::
+
+    from beam_analysis import instrumentation
+
+    with instrumentation.profile() as report:
+        engine.calculate_reactions()
+    print(report())   # {"phases": {...}, "counters": {...}}
+
+Phases may nest; each one records its inclusive wall time and call count.
+Whole functions are timed with the `timed` decorator.
+"""
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Dict, Iterator, List
+
+_enabled = False
+_phases: Dict[str, List[float]] = {}  # name -> [calls, total seconds]
+_counters: Dict[str, int] = {}
+_NULL_PHASE = nullcontext()
+
+
+class _Phase:
+    """Times one execution of a named phase."""
+
+    __slots__ = ("name", "start")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        entry = _phases.get(self.name)
+        if entry is None:
+            _phases[self.name] = [1, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+        return False
+
+
+def is_enabled() -> bool:
+    """Returns whether timers and counters are currently recorded."""
+    return _enabled
+
+
+def enable():
+    """Starts recording timers and counters."""
+    global _enabled
+    _enabled = True
+
+
+def disable():
+    """Stops recording; the collected data is kept until `reset`."""
+    global _enabled
+    _enabled = False
+
+
+def reset():
+    """Discards all collected timers and counters."""
+    _phases.clear()
+    _counters.clear()
+
+
+def phase(name: str):
+    """
+    Returns a context manager that times the enclosed block as `name`.
+
+    Args:
+        name (str): Dotted phase name, e.g. "solver.factorize".
+    """
+    if not _enabled:
+        return _NULL_PHASE
+    return _Phase(name)
+
+
+def timed(name: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator that times every call of the function as the phase `name`.
+
+    While instrumentation is disabled the wrapper only checks a flag.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _Phase(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def count(name: str, n: int = 1):
+    """
+    Adds `n` to the counter `name`.
+
+    Args:
+        name (str): Dotted counter name, e.g. "engine.cache_hits".
+        n (int): Amount to add. Defaults to 1.
+    """
+    if _enabled:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def report() -> Dict[str, Any]:
+    """
+    Returns the collected data in a JSON-serializable form.
+
+    Returns:
+        Dict[str, Any]: {"phases": {name: {"calls", "seconds"}},
+            "counters": {name: value}}, phases sorted by total time.
+    """
+    phases = sorted(_phases.items(), key=lambda item: item[1][1], reverse=True)
+    return {
+        "phases": {
+            name: {"calls": int(calls), "seconds": seconds}
+            for name, (calls, seconds) in phases
+        },
+        "counters": dict(sorted(_counters.items())),
+    }
+
+
+@contextmanager
+def profile() -> Iterator[Callable[[], Dict[str, Any]]]:
+    """
+    Records timers and counters for the enclosed block.
+
+    Previously collected data is discarded. Yields `report`, which can be
+    called inside or after the block.
+    """
+    was_enabled = _enabled
+    reset()
+    enable()
+    try:
+        yield report
+    finally:
+        if not was_enabled:
+            disable()
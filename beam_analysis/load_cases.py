@@ -0,0 +1,103 @@
+import numpy as np
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping
+from beam_analysis.beam import Beam
+from beam_analysis.diagram import compile_diagrams
+from beam_analysis.engine import solve_reactions
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+from beam_analysis.solver import MatrixBeamSolver
+
+
+@dataclass
+class LoadCaseResults:
+    """
+    Results of one beam analyzed under several load cases.
+
+    Attributes:
+        names (List[str]): Load case names, in input order.
+        stations (np.ndarray): Positions where shear and moment were sampled.
+        support_locations (np.ndarray): Support positions, in `beam.supports` order.
+        reactions (np.ndarray): (cases x supports x 2) array of [fy, m].
+        shear (np.ndarray): (cases x stations) shear forces in kN.
+        moment (np.ndarray): (cases x stations) bending moments in kNm.
+    """
+
+    names: List[str]
+    stations: np.ndarray
+    support_locations: np.ndarray
+    reactions: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+
+    def case_index(self, name: str) -> int:
+        """Returns the row of the named load case."""
+        try:
+            return self.names.index(name)
+        except ValueError:
+            raise KeyError(f"Unknown load case: {name}") from None
+
+    def reactions_of(self, name: str) -> Dict[float, Dict[str, float]]:
+        """Returns the reactions of one case in the `calculate_reactions` format."""
+        case = self.reactions[self.case_index(name)]
+        return {
+            float(loc): {'fy': float(fy), 'm': float(m)}
+            for loc, (fy, m) in zip(self.support_locations, case)
+        }
+
+
+def analyze_load_cases(
+    beam: Beam,
+    load_cases: Mapping[str, Iterable[Load] | LoadSet],
+    stations: np.ndarray | int = 201,
+) -> LoadCaseResults:
+    """
+    Analyzes one beam under several named load cases.
+
+    For indeterminate beams the stiffness matrix is assembled and factorized
+    once and all load cases are solved as the columns of one right-hand side
+    matrix, so N cases cost about as much as a single solve.
+
+    Args:
+        beam (Beam): The beam to be analyzed.
+        load_cases (Mapping[str, Iterable[Load] | LoadSet]): Loads of each named case.
+        stations (np.ndarray | int): Positions to sample shear and moment at,
+            or the number of evenly spaced positions. Defaults to 201.
+
+    Returns:
+        LoadCaseResults: Reactions and sampled diagrams of every case.
+    """
+    names = list(load_cases)
+    cases = [LoadSet.coerce(load_cases[name]) for name in names]
+
+    if np.isscalar(stations):
+        stations = np.linspace(0.0, beam.length, int(stations))
+    stations = np.asarray(stations, dtype=float)
+
+    if len(beam.supports) in (1, 2):
+        # Statically determinate: statics is cheaper than any factorization
+        case_reactions = [solve_reactions(beam, loads) for loads in cases]
+    else:
+        # Loads need not be nodes, so mesh the supports and beam ends only
+        solver = MatrixBeamSolver(beam, [])
+        case_reactions = solver.solve_load_cases(cases)
+
+    support_locations = np.array([s.location for s in beam.supports], dtype=float)
+    reactions = np.zeros((len(cases), len(beam.supports), 2))
+    shear = np.zeros((len(cases), len(stations)))
+    moment = np.zeros((len(cases), len(stations)))
+
+    for i, (loads, rx) in enumerate(zip(cases, case_reactions)):
+        reactions[i] = [[rx[loc]['fy'], rx[loc]['m']] for loc in support_locations]
+        shear_diagram, moment_diagram = compile_diagrams(beam, loads, rx)
+        shear[i] = shear_diagram(stations)
+        moment[i] = moment_diagram(stations)
+
+    return LoadCaseResults(
+        names=names,
+        stations=stations,
+        support_locations=support_locations,
+        reactions=reactions,
+        shear=shear,
+        moment=moment,
+    )
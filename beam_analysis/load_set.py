@@ -0,0 +1,718 @@
+import csv
+from bisect import insort
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+import numpy as np
+from beam_analysis.loads import (
+    Load, PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad,
+)
+
+# Load kinds, in the order of `LoadSet.kinds`
+POINT, MOMENT, DISTRIBUTED, LINEAR, TABULATED = 0, 1, 2, 3, 4
+KINDS = (POINT, MOMENT, DISTRIBUTED, LINEAR, TABULATED)
+
+# Kind of a slot of `LoadSet._order` whose load was removed
+REMOVED = -1
+
+# Appends up to this many loads update the live counts one by one; longer
+# ones rebuild them on next use
+MAX_COUNTED_APPENDS = 64
+
+
+class _Table:
+    """A growable (rows x columns) float array with amortized O(1) appends."""
+
+    def __init__(self, columns: int, dtype=float):
+        self._data = np.zeros((0, columns), dtype=dtype)
+        self.size = 0
+
+    @property
+    def rows(self) -> np.ndarray:
+        return self._data[: self.size]
+
+    def append(self, rows: np.ndarray) -> int:
+        """Appends (n x columns) rows and returns the index of the first one."""
+        first = self.size
+        needed = first + len(rows)
+        if needed > len(self._data):
+            self._grow(needed)
+        self._data[first:needed] = rows
+        self.size = needed
+        return first
+
+    def append_row(self, row: Tuple) -> int:
+        """Appends a single row without building an array first."""
+        if self.size == len(self._data):
+            self._grow(self.size + 1)
+        self._data[self.size] = row
+        self.size += 1
+        return self.size - 1
+
+    def swap_remove(self, row: int) -> int:
+        """
+        Removes a row by moving the last row into its place.
+
+        Returns:
+            int: The former index of the moved row (`row` itself if it was last).
+        """
+        last = self.size - 1
+        self._data[row] = self._data[last]
+        self.size = last
+        return last
+
+    def _grow(self, needed: int):
+        capacity = max(needed, 2 * len(self._data), 16)
+        data = np.zeros((capacity, self._data.shape[1]), dtype=self._data.dtype)
+        data[: self.size] = self._data[: self.size]
+        self._data = data
+
+    def copy(self) -> "_Table":
+        table = _Table(self._data.shape[1], self._data.dtype)
+        table.append(self.rows)
+        return table
+
+
+class _ObjectTable:
+    """A `_Table` counterpart for loads that do not fit in a fixed-width row."""
+
+    def __init__(self):
+        self.rows: List[TabulatedLoad] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.rows)
+
+    def append(self, rows: List[TabulatedLoad]) -> int:
+        first = len(self.rows)
+        self.rows.extend(rows)
+        return first
+
+    def append_row(self, row: TabulatedLoad) -> int:
+        self.rows.append(row)
+        return len(self.rows) - 1
+
+    def swap_remove(self, row: int) -> int:
+        last = len(self.rows) - 1
+        self.rows[row] = self.rows[last]
+        self.rows.pop()
+        return last
+
+    def copy(self) -> "_ObjectTable":
+        table = _ObjectTable()
+        table.rows = list(self.rows)
+        return table
+
+
+class _LiveCounts:
+    """
+    Fenwick tree over the slots of `LoadSet._order` counting live loads, so a
+    position in the sequence and its slot convert into each other in
+    O(log n) while removed slots are still in place.
+    """
+
+    def __init__(self, live: np.ndarray):
+        prefix = np.concatenate(([0], np.cumsum(live, dtype=np.int64)))
+        i = np.arange(1, len(live) + 1)
+        # Node i counts the slots i - lowbit(i) + 1 .. i (1-based)
+        self._tree = [0] + (prefix[i] - prefix[i - (i & -i)]).tolist()
+
+    def append(self):
+        """Counts a new live slot at the end."""
+        i = len(self._tree)
+        self._tree.append(1 + self._prefix(i - 1) - self._prefix(i - (i & -i)))
+
+    def remove(self, slot: int):
+        """Stops counting a slot whose load was removed."""
+        tree, i = self._tree, slot + 1
+        while i < len(tree):
+            tree[i] -= 1
+            i += i & -i
+
+    def position(self, slot: int) -> int:
+        """Position in the sequence of the (live) load in `slot`."""
+        return self._prefix(slot)
+
+    def slot(self, position: int) -> int:
+        """Slot of the load at `position` in the sequence."""
+        tree = self._tree
+        slot, remaining = 0, position + 1
+        step = 1 << (len(tree) - 1).bit_length()
+        while step:
+            if slot + step < len(tree) and tree[slot + step] < remaining:
+                slot += step
+                remaining -= tree[slot]
+            step >>= 1
+        return slot
+
+    def _prefix(self, n: int) -> int:
+        """Number of live slots among the first n."""
+        total = 0
+        while n > 0:
+            total += self._tree[n]
+            n -= n & -n
+        return total
+
+
+class LoadSet:
+    """
+    The loads of a beam stored as contiguous NumPy arrays, one table per type.
+
+    Analysis code reads the arrays directly instead of dispatching on every
+    load object, and large load sets (e.g. 10^5 traffic point loads) can be
+    ingested in bulk with `add_point_loads`, `add_moments`, `add_udls` or
+    `LoadSet.read`. The set still behaves like a sequence of `PointLoad`,
+    `UDL`, `PointMoment`, `TrapezoidalLoad` and `TabulatedLoad` objects in
+    insertion order; those are created on access only (tabulated loads are
+    kept as they are, their samples already being arrays).
+
+    Indexing, `index` (finding a load by value; its value index is built on
+    first use) and replacing or removing one load cost amortized O(log n). A
+    removed load leaves a hole in the insertion order, cleared once holes
+    outnumber the loads, and the last row of its table fills its row, so after
+    removals the arrays of one type are no longer in insertion order.
+
+    Attributes:
+        point_forces, point_locations (np.ndarray): Point loads (kN, m).
+        moment_values, moment_locations (np.ndarray): Point moments (kNm, m).
+        udl_magnitudes, udl_starts, udl_ends (np.ndarray): Distributed loads
+            (kN/m, m, m). An end of NaN means the end of the beam.
+        linear_start_magnitudes, linear_end_magnitudes, linear_starts,
+        linear_ends (np.ndarray): Trapezoidal loads (kN/m, kN/m, m, m).
+        tabulated (List[TabulatedLoad]): Tabulated loads.
+    """
+
+    def __init__(self, loads: Iterable[Load] = ()):
+        self._points = _Table(2)  # [force, location]
+        self._moments = _Table(2)  # [moment, location]
+        self._udls = _Table(3)  # [magnitude, start, end]
+        self._linear = _Table(4)  # [start magnitude, end magnitude, start, end]
+        self._tabulated = _ObjectTable()
+        self._order = _Table(2, dtype=np.int64)  # [kind, row in its table]
+        self._slots = [_Table(1, dtype=np.int64) for _ in KINDS]  # Row -> slot
+        self._holes = 0  # Slots of removed loads
+        self._live: _LiveCounts | None = None  # Built when there are holes
+        self._index: Dict[Tuple, List[int]] | None = None  # Load value -> slots
+        self.extend(loads)
+
+    @classmethod
+    def coerce(cls, loads: "Iterable[Load] | LoadSet") -> "LoadSet":
+        """Returns `loads` itself if it already is a LoadSet, else a new one."""
+        return loads if isinstance(loads, LoadSet) else cls(loads)
+
+    # Array views
+
+    @property
+    def point_forces(self) -> np.ndarray:
+        return self._points.rows[:, 0]
+
+    @property
+    def point_locations(self) -> np.ndarray:
+        return self._points.rows[:, 1]
+
+    @property
+    def moment_values(self) -> np.ndarray:
+        return self._moments.rows[:, 0]
+
+    @property
+    def moment_locations(self) -> np.ndarray:
+        return self._moments.rows[:, 1]
+
+    @property
+    def udl_magnitudes(self) -> np.ndarray:
+        return self._udls.rows[:, 0]
+
+    @property
+    def udl_starts(self) -> np.ndarray:
+        return self._udls.rows[:, 1]
+
+    @property
+    def udl_ends(self) -> np.ndarray:
+        return self._udls.rows[:, 2]
+
+    @property
+    def linear_start_magnitudes(self) -> np.ndarray:
+        return self._linear.rows[:, 0]
+
+    @property
+    def linear_end_magnitudes(self) -> np.ndarray:
+        return self._linear.rows[:, 1]
+
+    @property
+    def linear_starts(self) -> np.ndarray:
+        return self._linear.rows[:, 2]
+
+    @property
+    def linear_ends(self) -> np.ndarray:
+        return self._linear.rows[:, 3]
+
+    @property
+    def tabulated(self) -> List[TabulatedLoad]:
+        return self._tabulated.rows
+
+    @property
+    def kinds(self) -> np.ndarray:
+        """Kind of every load in insertion order (POINT, MOMENT, DISTRIBUTED, ...)."""
+        return self._live_order()[:, 0]
+
+    def udl_extents(self, length: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Distributed loads clipped to a beam of the given length.
+
+        Open ends run to the beam end; loads that do not reach onto the beam
+        are dropped.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (starts, ends, magnitudes)
+        """
+        starts = self.udl_starts
+        ends = np.where(np.isnan(self.udl_ends), length, self.udl_ends)
+        ends = np.minimum(ends, length)
+        loaded = ends > starts
+        return starts[loaded], ends[loaded], self.udl_magnitudes[loaded]
+
+    def distributed_segments(
+        self, length: float
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        All distributed loads as linearly varying pieces, clipped to a beam of
+        the given length.
+
+        UDLs and trapezoidal loads are one piece each, a tabulated load is one
+        piece per pair of consecutive samples. A piece cut by the beam end
+        keeps its intensity at the cut.
+
+        Returns:
+            Tuple[np.ndarray, ...]: (starts, ends, q_starts, q_ends)
+        """
+        linear_ends = np.where(np.isnan(self.linear_ends), length, self.linear_ends)
+        tabulated = self._tabulated.rows
+        starts = np.concatenate(
+            [self.udl_starts, self.linear_starts] + [load.x[:-1] for load in tabulated]
+        )
+        ends = np.concatenate(
+            [np.where(np.isnan(self.udl_ends), length, self.udl_ends), linear_ends]
+            + [load.x[1:] for load in tabulated]
+        )
+        q_starts = np.concatenate(
+            [self.udl_magnitudes, self.linear_start_magnitudes]
+            + [load.q[:-1] for load in tabulated]
+        )
+        q_ends = np.concatenate(
+            [self.udl_magnitudes, self.linear_end_magnitudes]
+            + [load.q[1:] for load in tabulated]
+        )
+
+        loaded = np.minimum(ends, length) > starts
+        starts, ends = starts[loaded], ends[loaded]
+        q_starts, q_ends = q_starts[loaded], q_ends[loaded]
+        cut = ends > length
+        if cut.any():
+            slope = (q_ends[cut] - q_starts[cut]) / (ends[cut] - starts[cut])
+            q_ends[cut] = q_starts[cut] + slope * (length - starts[cut])
+            ends[cut] = length
+        return starts, ends, q_starts, q_ends
+
+    # Ingestion
+
+    def append(self, load: Load):
+        """Adds a single load."""
+        kind, row = _as_row(load)
+        first = self._order.size
+        self._slots[kind].append_row((first,))
+        self._order.append_row((kind, self._table(kind).append_row(row)))
+        self._track(first)
+
+    def extend(self, loads: "Iterable[Load] | LoadSet"):
+        """Adds several loads, keeping their order."""
+        if isinstance(loads, LoadSet):
+            order = loads._live_order().copy()
+            tables = [loads._table(kind).rows for kind in KINDS]
+        else:
+            # Sort the objects into one row list per kind, then add in bulk
+            kinds, rows = [], ([], [], [], [], [])
+            for load in loads:
+                kind, row = _as_row(load)
+                kinds.append(kind)
+                rows[kind].append(row)
+            order = np.zeros((len(kinds), 2), dtype=np.int64)
+            order[:, 0] = kinds
+            tables = [
+                np.array(r, dtype=float).reshape(len(r), width)
+                for r, width in zip(rows, (2, 2, 3, 4))
+            ] + [rows[TABULATED]]
+            for kind in KINDS:
+                order[order[:, 0] == kind, 1] = np.arange(len(rows[kind]))
+
+        first_slot = self._order.size
+        for kind, table in zip(KINDS, tables):
+            first = self._table(kind).append(table)
+            of_kind = order[:, 0] == kind
+            order[of_kind, 1] += first
+            self._slots[kind].append(first_slot + np.flatnonzero(of_kind)[:, None])
+        self._order.append(order)
+        self._track(first_slot)
+
+    def add_point_loads(self, forces: Sequence[float], locations: Sequence[float]):
+        """
+        Adds point loads from arrays.
+
+        Args:
+            forces (Sequence[float]): Forces in kN. Positive is downwards.
+            locations (Sequence[float]): Locations in meters.
+        """
+        forces, locations = np.broadcast_arrays(
+            np.asarray(forces, dtype=float), np.asarray(locations, dtype=float)
+        )
+        if np.any(locations < 0):
+            raise ValueError("Location cannot be negative.")
+        self._add(POINT, np.column_stack((forces.ravel(), locations.ravel())))
+
+    def add_moments(self, moments: Sequence[float], locations: Sequence[float]):
+        """
+        Adds point moments from arrays.
+
+        Args:
+            moments (Sequence[float]): Moments in kNm. Positive is clockwise.
+            locations (Sequence[float]): Locations in meters.
+        """
+        moments, locations = np.broadcast_arrays(
+            np.asarray(moments, dtype=float), np.asarray(locations, dtype=float)
+        )
+        if np.any(locations < 0):
+            raise ValueError("Location cannot be negative.")
+        self._add(MOMENT, np.column_stack((moments.ravel(), locations.ravel())))
+
+    def add_udls(
+        self,
+        magnitudes: Sequence[float],
+        starts: Sequence[float] = 0.0,
+        ends: Sequence[float | None] | None = None,
+    ):
+        """
+        Adds uniformly distributed loads from arrays.
+
+        Args:
+            magnitudes (Sequence[float]): Intensities in kN/m. Positive is downwards.
+            starts (Sequence[float]): Start locations in meters. Defaults to 0.0.
+            ends (Sequence[float | None] | None): End locations in meters; None
+                or NaN extends a load to the end of the beam.
+        """
+        magnitudes, starts, ends = np.broadcast_arrays(
+            np.asarray(magnitudes, dtype=float),
+            np.asarray(starts, dtype=float),
+            np.asarray(np.nan if ends is None else ends, dtype=float),  # None -> NaN
+        )
+        bounded = ~np.isnan(ends)
+        if np.any(starts < 0):
+            raise ValueError("Start location cannot be negative.")
+        if np.any(ends[bounded] < 0):
+            raise ValueError("End location cannot be negative.")
+        if np.any(starts[bounded] >= ends[bounded]):
+            raise ValueError("Start location must be less than end location.")
+        rows = np.column_stack((magnitudes.ravel(), starts.ravel(), ends.ravel()))
+        self._add(DISTRIBUTED, rows)
+
+    @classmethod
+    def read(cls, path: Path) -> "LoadSet":
+        """
+        Reads loads from a .npz file written by `save` or from a CSV file.
+
+        CSV files have one load per row with the columns of the model CSV
+        format: kind (point, udl or moment), force, magnitude, start, end,
+        moment and location. Empty cells are allowed where unused.
+
+        Raises:
+            ValueError: If the file extension or a row kind is not supported.
+        """
+        path = Path(path)
+        suffix = path.suffix.lower()
+        load_set = cls()
+        if suffix == ".npz":
+            with np.load(path) as data:
+                load_set.add_point_loads(data["point_forces"], data["point_locations"])
+                load_set.add_moments(data["moment_values"], data["moment_locations"])
+                load_set.add_udls(
+                    data["udl_magnitudes"], data["udl_starts"], data["udl_ends"]
+                )
+                if "linear_starts" in data:
+                    load_set._add(LINEAR, np.column_stack((
+                        data["linear_start_magnitudes"], data["linear_end_magnitudes"],
+                        data["linear_starts"], data["linear_ends"],
+                    )))
+                    bounds = np.cumsum(np.append(0, data["tabulated_counts"]))
+                    for a, b in zip(bounds[:-1], bounds[1:]):
+                        load_set.append(TabulatedLoad(
+                            data["tabulated_x"][a:b], data["tabulated_q"][a:b]
+                        ))
+        elif suffix == ".csv":
+            with open(path, newline="", encoding="utf-8") as f:
+                load_set._read_csv_rows(csv.DictReader(f))
+        else:
+            raise ValueError(f"Unsupported load file: {path}")
+        return load_set
+
+    def _read_csv_rows(self, rows: Iterable[dict]):
+        columns: dict = {POINT: ([], []), MOMENT: ([], []), DISTRIBUTED: ([], [], [])}
+        for row in rows:
+            kind = (row.get("kind") or "").strip().lower()
+            if kind == "point":
+                columns[POINT][0].append(float(row["force"]))
+                columns[POINT][1].append(float(row["location"]))
+            elif kind == "moment":
+                columns[MOMENT][0].append(float(row["moment"]))
+                columns[MOMENT][1].append(float(row["location"]))
+            elif kind == "udl":
+                end = (row.get("end") or "").strip()
+                columns[DISTRIBUTED][0].append(float(row["magnitude"]))
+                columns[DISTRIBUTED][1].append(float(row.get("start") or 0.0))
+                columns[DISTRIBUTED][2].append(float(end) if end else np.nan)
+            else:
+                raise ValueError(f"Unknown load kind: {row.get('kind')}")
+        self.add_point_loads(*columns[POINT])
+        self.add_moments(*columns[MOMENT])
+        self.add_udls(*columns[DISTRIBUTED])
+
+    def save(self, path: Path):
+        """
+        Writes the load arrays to a .npz file (insertion order is only kept
+        within a type, and only if no load was removed).
+        """
+        np.savez(
+            path,
+            point_forces=self.point_forces, point_locations=self.point_locations,
+            moment_values=self.moment_values, moment_locations=self.moment_locations,
+            udl_magnitudes=self.udl_magnitudes, udl_starts=self.udl_starts,
+            udl_ends=self.udl_ends,
+            linear_start_magnitudes=self.linear_start_magnitudes,
+            linear_end_magnitudes=self.linear_end_magnitudes,
+            linear_starts=self.linear_starts, linear_ends=self.linear_ends,
+            tabulated_x=np.concatenate([[]] + [load.x for load in self.tabulated]),
+            tabulated_q=np.concatenate([[]] + [load.q for load in self.tabulated]),
+            tabulated_counts=np.array(
+                [len(load.x) for load in self.tabulated], dtype=np.int64
+            ),
+        )
+
+    # Editing
+
+    def __setitem__(self, index: int, load: Load):
+        """Replaces the load at `index`, keeping its position."""
+        slot = self._slot(index)
+        kind, row = _as_row(load)
+        old_kind, old_row = (int(v) for v in self._order.rows[slot])
+        self._unindex(slot)
+        if kind == old_kind:
+            self._table(kind).rows[old_row] = row
+        else:
+            self._drop_row(old_kind, old_row)
+            self._slots[kind].append_row((slot,))
+            self._order.rows[slot] = (kind, self._table(kind).append_row(row))
+        if self._index is not None:
+            insort(self._index.setdefault(_key(kind, row), []), slot)
+
+    def __delitem__(self, index: int):
+        """Removes the load at `index`."""
+        slot = self._slot(index)
+        self._unindex(slot)
+        self._drop_row(*(int(v) for v in self._order.rows[slot]))
+        self._order.rows[slot] = (REMOVED, -1)
+        self._holes += 1
+        if self._live is not None:
+            self._live.remove(slot)
+        if self._holes > max(len(self), MAX_COUNTED_APPENDS):
+            self._compact()
+
+    def index(self, load: Load) -> int:
+        """
+        Returns the position of the first load equal to `load`.
+
+        Raises:
+            ValueError: If there is no such load.
+        """
+        kind, row = _as_row(load)
+        if self._index is None:
+            self._index = {}
+            for slot, (slot_kind, slot_row) in enumerate(self._order.rows.tolist()):
+                if slot_kind != REMOVED:
+                    self._index.setdefault(
+                        _key(slot_kind, self._table(slot_kind).rows[slot_row]), []
+                    ).append(slot)
+        slots = self._index.get(_key(kind, row))
+        if not slots:
+            raise ValueError(f"Load not found: {load}")
+        return slots[0] if self._holes == 0 else self._live_counts().position(slots[0])
+
+    def _slot(self, index: int) -> int:
+        """The slot of `_order` holding the load at `index`."""
+        index = range(len(self))[index]
+        return index if self._holes == 0 else self._live_counts().slot(index)
+
+    def _live_counts(self) -> _LiveCounts:
+        if self._live is None:
+            self._live = _LiveCounts(self._order.rows[:, 0] != REMOVED)
+        return self._live
+
+    def _live_order(self) -> np.ndarray:
+        """The [kind, row] of every load, without the slots of removed ones."""
+        order = self._order.rows
+        return order if self._holes == 0 else order[order[:, 0] != REMOVED]
+
+    def _drop_row(self, kind: int, row: int):
+        """Removes a table row, moving the last row of the table into it."""
+        moved = self._table(kind).swap_remove(row)
+        slots = self._slots[kind]
+        slots.swap_remove(row)
+        if moved != row:
+            self._order.rows[slots.rows[row, 0], 1] = row
+
+    def _track(self, first: int):
+        """Updates the live counts and the value index for slots from `first` on."""
+        if self._live is not None:
+            if self._order.size - first > MAX_COUNTED_APPENDS:
+                self._live = None
+            else:
+                for _ in range(first, self._order.size):
+                    self._live.append()
+        if self._index is not None:
+            for slot in range(first, self._order.size):
+                kind, row = (int(v) for v in self._order.rows[slot])
+                self._index.setdefault(
+                    _key(kind, self._table(kind).rows[row]), []
+                ).append(slot)
+
+    def _unindex(self, slot: int):
+        """Removes the load in `slot` from the value index."""
+        if self._index is None:
+            return
+        kind, row = (int(v) for v in self._order.rows[slot])
+        key = _key(kind, self._table(kind).rows[row])
+        slots = self._index[key]
+        slots.remove(slot)
+        if not slots:
+            del self._index[key]
+
+    def _compact(self):
+        """Drops the slots of removed loads from `_order`."""
+        live = self._order.rows[:, 0] != REMOVED
+        new_slot = np.cumsum(live) - 1
+        for slots in self._slots:
+            slots.rows[:, 0] = new_slot[slots.rows[:, 0]]
+        order = _Table(2, dtype=np.int64)
+        order.append(self._order.rows[live])
+        self._order = order
+        self._holes = 0
+        self._live = None
+        self._index = None
+
+    def scaled(self, factor: float) -> "LoadSet":
+        """Returns a copy with every force, moment and intensity times `factor`."""
+        load_set = self.copy()
+        for kind in (POINT, MOMENT, DISTRIBUTED):
+            load_set._table(kind).rows[:, 0] *= factor
+        load_set._linear.rows[:, :2] *= factor
+        load_set._tabulated.rows = [
+            TabulatedLoad(load.x, load.q * factor) for load in self.tabulated
+        ]
+        return load_set
+
+    def copy(self) -> "LoadSet":
+        """Returns an independent copy."""
+        load_set = LoadSet()
+        load_set._points = self._points.copy()
+        load_set._moments = self._moments.copy()
+        load_set._udls = self._udls.copy()
+        load_set._linear = self._linear.copy()
+        load_set._tabulated = self._tabulated.copy()
+        load_set._order = self._order.copy()
+        load_set._slots = [slots.copy() for slots in self._slots]
+        load_set._holes = self._holes
+        return load_set
+
+    def _table(self, kind: int) -> "_Table | _ObjectTable":
+        tables = (
+            self._points, self._moments, self._udls, self._linear, self._tabulated,
+        )
+        return tables[kind]
+
+    def _add(self, kind: int, rows: np.ndarray):
+        if len(rows) == 0:
+            return
+        first = self._table(kind).append(rows)
+        first_slot = self._order.size
+        order = np.empty((len(rows), 2), dtype=np.int64)
+        order[:, 0] = kind
+        order[:, 1] = np.arange(first, first + len(rows))
+        self._slots[kind].append(np.arange(first_slot, first_slot + len(rows))[:, None])
+        self._order.append(order)
+        self._track(first_slot)
+
+    # Sequence of load objects
+
+    def _load(self, kind: int, row: int) -> Load:
+        values = self._table(kind).rows[row]
+        if kind == POINT:
+            return PointLoad(force=float(values[0]), location=float(values[1]))
+        if kind == MOMENT:
+            return PointMoment(moment=float(values[0]), location=float(values[1]))
+        if kind == TABULATED:
+            return values
+        if kind == LINEAR:
+            end = None if np.isnan(values[3]) else float(values[3])
+            return TrapezoidalLoad(
+                start_magnitude=float(values[0]), end_magnitude=float(values[1]),
+                start=float(values[2]), end=end,
+            )
+        end = None if np.isnan(values[2]) else float(values[2])
+        return UDL(magnitude=float(values[0]), start=float(values[1]), end=end)
+
+    def __len__(self) -> int:
+        return self._order.size - self._holes
+
+    def __iter__(self) -> Iterator[Load]:
+        for kind, row in self._live_order():
+            yield self._load(kind, row)
+
+    def __getitem__(self, index: int | slice) -> "Load | List[Load]":
+        if isinstance(index, slice):
+            return [self._load(kind, row) for kind, row in self._live_order()[index]]
+        kind, row = self._order.rows[self._slot(index)]
+        return self._load(kind, row)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (LoadSet, list, tuple)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"LoadSet({self._points.size} point loads, {self._udls.size} UDLs, "
+            f"{self._moments.size} moments, {self._linear.size} trapezoidal loads, "
+            f"{self._tabulated.size} tabulated loads)"
+        )
+
+
+def _as_row(load: Load) -> Tuple[int, Tuple]:
+    """Returns the kind and table row of a load object."""
+    if isinstance(load, PointLoad):
+        return POINT, (load.force, load.location)
+    if isinstance(load, PointMoment):
+        return MOMENT, (load.moment, load.location)
+    if isinstance(load, UDL):
+        return DISTRIBUTED, (
+            load.magnitude, load.start, np.nan if load.end is None else load.end
+        )
+    if isinstance(load, TrapezoidalLoad):
+        return LINEAR, (
+            load.start_magnitude, load.end_magnitude,
+            load.start, np.nan if load.end is None else load.end,
+        )
+    if isinstance(load, TabulatedLoad):
+        return TABULATED, load
+    raise ValueError(f"Unsupported load: {load}")
+
+
+def _key(kind: int, row) -> Tuple:
+    """A hashable key that is equal for equal loads (see `_as_row`)."""
+    if kind == TABULATED:
+        return (kind, tuple(row.x.tolist()), tuple(row.q.tolist()))
+    return (kind,) + tuple(None if np.isnan(v) else float(v) for v in row)
@@ -1,15 +1,18 @@
 from abc import ABC
 from dataclasses import dataclass
+from typing import Sequence
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class Load(ABC):
     """Base class for all loads."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class PointLoad(Load):
     """
     A point load applied at a specific location on the beam.
@@ -30,7 +33,7 @@ class PointLoad(Load):
         return f"PointLoad(force={self.force} kN, location={self.location} m)"
 
 
-@dataclass
+@dataclass(slots=True)
 class UDL(Load):
     """
     A uniformly distributed load applied over a span of the beam.
@@ -59,7 +62,7 @@ class UDL(Load):
         return f"UDL(magnitude={self.magnitude} kN/m, start={self.start} m, end={end_str})"
 
 
-@dataclass
+@dataclass(slots=True)
 class PointMoment(Load):
     """
     A concentrated moment applied at a specific location on the beam.
@@ -78,3 +81,92 @@ class PointMoment(Load):
 
     def __str__(self):
         return f"PointMoment(moment={self.moment} kNm, location={self.location} m)"
+
+
+@dataclass(slots=True)
+class TrapezoidalLoad(Load):
+    """
+    A distributed load that varies linearly over a span of the beam
+    (e.g. hydrostatic or earth pressure).
+
+    Attributes:
+        start_magnitude (float): Intensity at the start in kN/m. Positive is downwards.
+        end_magnitude (float): Intensity at the end in kN/m.
+        start (float): The start location of the load in meters. Defaults to 0.0.
+        end (float | None): The end location of the load in meters.
+                            If None, it extends to the end of the beam.
+    """
+
+    start_magnitude: float
+    end_magnitude: float
+    start: float = 0.0
+    end: float | None = None
+
+    def __post_init__(self):
+        if self.start < 0:
+            raise ValueError("Start location cannot be negative.")
+        if self.end is not None and self.end < 0:
+            raise ValueError("End location cannot be negative.")
+        if self.end is not None and self.start >= self.end:
+            raise ValueError("Start location must be less than end location.")
+
+    def __str__(self):
+        end_str = f"{self.end} m" if self.end is not None else "End"
+        return (
+            f"TrapezoidalLoad(magnitude={self.start_magnitude} -> "
+            f"{self.end_magnitude} kN/m, "
+            f"start={self.start} m, end={end_str})"
+        )
+
+
+class TabulatedLoad(Load):
+    """
+    A distributed load given by samples, e.g. a measured pressure profile.
+    The intensity varies linearly between the samples and is zero outside them.
+
+    Attributes:
+        x (np.ndarray): Strictly increasing sample locations in meters.
+        q (np.ndarray): Intensity at each sample in kN/m. Positive is downwards.
+    """
+
+    __slots__ = ("x", "q")
+
+    def __init__(self, x: Sequence[float], q: Sequence[float]):
+        self.x = np.array(x, dtype=float).ravel()
+        self.q = np.array(q, dtype=float).ravel()
+        if len(self.x) != len(self.q) or len(self.x) < 2:
+            raise ValueError("A tabulated load needs at least 2 (x, q) samples.")
+        if self.x[0] < 0:
+            raise ValueError("Location cannot be negative.")
+        if np.any(np.diff(self.x) <= 0):
+            raise ValueError("Sample locations must be strictly increasing.")
+        self.x.flags.writeable = False
+        self.q.flags.writeable = False
+
+    @property
+    def start(self) -> float:
+        return float(self.x[0])
+
+    @property
+    def end(self) -> float:
+        return float(self.x[-1])
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, TabulatedLoad):
+            return NotImplemented
+        return bool(
+            self.x.shape == other.x.shape
+            and (self.x == other.x).all()
+            and (self.q == other.q).all()
+        )
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"TabulatedLoad(x={self.x!r}, q={self.q!r})"
+
+    def __str__(self):
+        return (
+            f"TabulatedLoad({len(self.x)} samples, {self.start} - {self.end} m, "
+            f"q={self.q.min():g} .. {self.q.max():g} kN/m)"
+        )
@@ -0,0 +1,197 @@
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.loads import (
+    Load, PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad,
+)
+
+# Column layout of CSV model files: one row per beam, support or load.
+# Rows of one model must be consecutive and share the same `model` id.
+CSV_COLUMNS = [
+    "model", "kind", "length", "location", "type",
+    "force", "magnitude", "start", "end", "moment",
+]
+
+
+def model_from_dict(data: Dict[str, Any]) -> Tuple[Beam, List[Load]]:
+    """
+    Builds a beam and its loads from a model dictionary.
+
+    The expected layout is::
+
+        {"id": "B1", "length": 10.0, "E": 2.0e8, "I": 8.0e-5,
+         "supports": [{"location": 0.0, "type": "PINNED"}, ...],
+         "loads": [{"type": "point", "force": 10.0, "location": 5.0},
+                   {"type": "udl", "magnitude": 5.0, "start": 0.0, "end": 10.0},
+                   {"type": "moment", "moment": 10.0, "location": 5.0},
+                   {"type": "trapezoid", "start_magnitude": 0.0,
+                    "end_magnitude": 8.0, "start": 2.0, "end": 6.0},
+                   {"type": "tabulated", "x": [0.0, 1.0, 2.0], "q": [3.0, 4.0, 2.0]}]}
+
+    "E" (kN/m²) and "I" (m⁴) are optional; they are only needed for deflections.
+    Models that `read_models` could not read carry an "error" message instead.
+
+    Raises:
+        ValueError: If the model is incomplete or invalid.
+
+    Returns:
+        Tuple[Beam, List[Load]]: The beam and its loads.
+    """
+    if "error" in data:
+        raise ValueError(data["error"])
+    try:
+        supports = [
+            Support(
+                location=float(s["location"]),
+                type=SupportType[str(s.get("type", "ROLLER")).upper()],
+            )
+            for s in data["supports"]
+        ]
+        beam = Beam(
+            length=float(data["length"]),
+            supports=supports,
+            E=float(data["E"]) if data.get("E") is not None else None,
+            I=float(data["I"]) if data.get("I") is not None else None,
+        )
+        loads = [load_from_dict(item) for item in data.get("loads", [])]
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid model: missing or unknown field {exc}") from exc
+    return beam, loads
+
+
+def load_from_dict(data: Dict[str, Any]) -> Load:
+    """Builds a single load from its dictionary form."""
+    kind = str(data["type"]).lower()
+    if kind == "point":
+        return PointLoad(force=float(data["force"]), location=float(data["location"]))
+    if kind == "udl":
+        end = data.get("end")
+        return UDL(
+            magnitude=float(data["magnitude"]),
+            start=float(data.get("start") or 0.0),
+            end=float(end) if end is not None else None,
+        )
+    if kind == "moment":
+        return PointMoment(
+            moment=float(data["moment"]), location=float(data["location"])
+        )
+    if kind == "trapezoid":
+        end = data.get("end")
+        return TrapezoidalLoad(
+            start_magnitude=float(data["start_magnitude"]),
+            end_magnitude=float(data["end_magnitude"]),
+            start=float(data.get("start") or 0.0),
+            end=float(end) if end is not None else None,
+        )
+    if kind == "tabulated":
+        return TabulatedLoad(data["x"], data["q"])
+    raise ValueError(f"Unknown load type: {data['type']}")
+
+
+def model_to_dict(
+    beam: Beam, loads: List[Load], model_id: Any = None
+) -> Dict[str, Any]:
+    """Converts a beam and its loads to the dictionary form of `model_from_dict`."""
+    data: Dict[str, Any] = {} if model_id is None else {"id": model_id}
+    data["length"] = beam.length
+    if beam.EI is not None:
+        data["E"], data["I"] = beam.E, beam.I
+    data["supports"] = [
+        {"location": s.location, "type": s.type.name} for s in beam.supports
+    ]
+    data["loads"] = [load_to_dict(load) for load in loads]
+    return data
+
+
+def load_to_dict(load: Load) -> Dict[str, Any]:
+    """Converts a single load to its dictionary form."""
+    if isinstance(load, PointLoad):
+        return {"type": "point", "force": load.force, "location": load.location}
+    if isinstance(load, UDL):
+        return {
+            "type": "udl", "magnitude": load.magnitude,
+            "start": load.start, "end": load.end,
+        }
+    if isinstance(load, PointMoment):
+        return {"type": "moment", "moment": load.moment, "location": load.location}
+    if isinstance(load, TrapezoidalLoad):
+        return {
+            "type": "trapezoid", "start_magnitude": load.start_magnitude,
+            "end_magnitude": load.end_magnitude, "start": load.start, "end": load.end,
+        }
+    if isinstance(load, TabulatedLoad):
+        return {"type": "tabulated", "x": load.x.tolist(), "q": load.q.tolist()}
+    raise ValueError(f"Unsupported load: {load}")
+
+
+def read_models(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Reads model dictionaries from a JSON, JSONL or CSV file.
+
+    JSONL and CSV files are streamed one model at a time. A JSON file holds a
+    single model, a list of models or {"models": [...]} and is read at once.
+    A JSONL line or CSV model that cannot be read does not stop the stream;
+    it is yielded with an "error" message, which `model_from_dict` raises.
+
+    Raises:
+        ValueError: If the file extension is not supported.
+    """
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".jsonl":
+        yield from _read_jsonl(path)
+    elif suffix == ".json":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict) and "models" in data:
+            data = data["models"]
+        yield from data if isinstance(data, list) else [data]
+    elif suffix == ".csv":
+        yield from _read_csv(path)
+    else:
+        raise ValueError(f"Unsupported model file: {path}")
+
+
+def _read_jsonl(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as exc:
+                data = {"error": f"Invalid JSON on line {number}: {exc.msg}"}
+            yield data
+
+
+def _read_csv(path: Path) -> Iterator[Dict[str, Any]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        yield from _group_csv_rows(csv.DictReader(f))
+
+
+def _group_csv_rows(rows: Iterable[Dict[str, str]]) -> Iterator[Dict[str, Any]]:
+    """Groups consecutive CSV rows with the same model id into one model."""
+    model: Dict[str, Any] | None = None
+    for row in rows:
+        row = {key: (value.strip() if value else None) for key, value in row.items()}
+        if model is None or row["model"] != model["id"]:
+            if model is not None:
+                yield model
+            model = {"id": row["model"], "supports": [], "loads": []}
+
+        kind = (row.get("kind") or "").lower()
+        if kind == "beam":
+            model["length"] = row["length"]
+        elif kind == "support":
+            model["supports"].append({"location": row["location"], "type": row["type"]})
+        elif kind in ("point", "udl", "moment"):
+            load = {key: row.get(key) for key in CSV_COLUMNS[3:] if row.get(key)}
+            load["type"] = kind
+            model["loads"].append(load)
+        elif "error" not in model:
+            model["error"] = f"Unknown row kind in {row['model']}: {row.get('kind')}"
+
+    if model is not None:
+        yield model
@@ -0,0 +1,339 @@
+import itertools
+import warnings
+from dataclasses import dataclass
+from typing import Dict, Iterable, Sequence, Tuple
+import numpy as np
+from scipy.linalg import LinAlgWarning, lu_factor, lu_solve
+from scipy.optimize import minimize
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.diagram import compile_diagrams, deflection_from_moment
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+
+OBJECTIVES = ("moment", "deflection")
+
+# Objective value of layouts that cannot be analyzed (e.g. coincident supports)
+_PENALTY = 1.0e12
+
+# Layouts whose system has a pivot this much smaller than the largest are unstable
+_SINGULAR = 1.0e-12
+
+
+@dataclass
+class PlacementResult:
+    """
+    The best support layout found by `optimize_supports`.
+
+    Attributes:
+        beam (Beam): The base beam with the optimized supports.
+        objective (float): Peak |M| in kNm, or peak |deflection| in m (per
+            unit EI if the beam has no E and I).
+        evaluations (int): Number of distinct layouts solved (gradient steps,
+            which reuse the factorization of their layout, are not counted).
+    """
+
+    beam: Beam
+    objective: float
+    evaluations: int
+
+
+@dataclass
+class _Layout:
+    """A solved support layout (see `_LayoutObjective`)."""
+
+    locations: np.ndarray
+    factorization: Tuple[np.ndarray, np.ndarray]  # LU of the system matrix
+    unknowns: np.ndarray  # Reactions, fixed-support moments and a, b
+    points: np.ndarray  # Candidate locations of the peak
+    left: np.ndarray  # Whether each candidate is a left limit
+    value: float
+
+
+class _LayoutObjective:
+    """
+    Peak |M| or |deflection| as a function of the support locations.
+
+    Layouts are solved with the force method. The moment of the loads alone
+    (as if the beam were free) and its two integrals are computed once; the
+    reactions of a layout then follow from one small dense system: zero
+    deflection at every support, zero rotation at fixed ones and equilibrium.
+    Its unknowns are the reactions, the moments of fixed supports and the
+    integration constants a + b x of EI times the deflection, so a trial does
+    not touch the loads again.
+
+    The finite-difference steps of a gradient reuse the LU factorization of
+    their base layout (iterative refinement) and are evaluated only at the
+    candidate points of the base peak, so they cost no factorization and no
+    diagram. Base layouts are cached, so line searches never analyze the
+    same layout twice.
+    """
+
+    def __init__(
+        self, beam: Beam, loads: LoadSet, types: Sequence[SupportType], objective: str
+    ):
+        self.beam = beam
+        self.loads = loads
+        self.types = list(types)
+        self.fixed = np.array([t == SupportType.FIXED for t in self.types])
+        self.objective = objective
+        self.EI = beam.EI if beam.EI is not None else 1.0
+        shear, self._moment = compile_diagrams(beam, loads, {})
+        # EI times the rotation and the (upward) deflection of the free beam
+        self._rotation = self._moment.antiderivative()
+        self._deflection = self._rotation.antiderivative()
+        self._end_actions = np.array([shear(beam.length), self._moment(beam.length)])
+        self._cache: Dict[Tuple[float, ...], _Layout | None] = {}
+
+    @property
+    def evaluations(self) -> int:
+        return len(self._cache)
+
+    def layout(self, locations: Sequence[float]) -> Beam:
+        supports = [Support(float(x), t) for x, t in zip(locations, self.types)]
+        return Beam(self.beam.length, supports, E=self.beam.E, I=self.beam.I)
+
+    def __call__(self, locations: np.ndarray) -> float:
+        solved = self._solve(locations)
+        return _PENALTY if solved is None else solved.value
+
+    def batch(self, layouts: Iterable[np.ndarray]) -> np.ndarray:
+        """Evaluates several layouts (e.g. the screened random ones)."""
+        return np.array([self(layout) for layout in layouts])
+
+    def gradient(self, locations: np.ndarray, steps: np.ndarray) -> np.ndarray:
+        """
+        Forward differences of the objective, with `steps[i]` along support i
+        (zero steps give a zero entry).
+
+        Each step moves one support of the solved base layout; its system is
+        solved with the base factorization and the new peak is taken over the
+        base candidates, the ones at the moved support moving with it.
+        """
+        gradient = np.zeros(len(steps))
+        base = self._solve(locations)
+        if base is None:
+            return gradient
+        for i in np.flatnonzero(steps):
+            x = base.locations.copy()
+            x[i] += steps[i]
+            matrix, rhs = self._system(x)
+            z = base.unknowns
+            for _ in range(2):
+                z = z + lu_solve(base.factorization, rhs - matrix @ z)
+            moved = np.isclose(base.points, base.locations[i], rtol=0.0, atol=1e-12)
+            points = np.where(moved, x[i], base.points)
+            value = np.abs(self._values(x, z, points, base.left)).max()
+            gradient[i] = (value - base.value) / steps[i]
+        return gradient
+
+    def _solve(self, locations: np.ndarray) -> _Layout | None:
+        """Solves a layout (None if it is unstable or supports coincide)."""
+        x = np.round(np.asarray(locations, dtype=float), 12)
+        key = tuple(x)
+        if key in self._cache:
+            return self._cache[key]
+        solved = None
+        if len(set(key)) == len(key):
+            matrix, rhs = self._system(x)
+            with warnings.catch_warnings():
+                # Unstable layouts are detected from the pivots below
+                warnings.simplefilter("ignore", LinAlgWarning)
+                lu, pivots = lu_factor(matrix, check_finite=False)
+            diagonal = np.abs(np.diag(lu))
+            if diagonal.min() > _SINGULAR * diagonal.max():
+                z = lu_solve((lu, pivots), rhs)
+                points, left = self._candidates(x, z)
+                value = np.abs(self._values(x, z, points, left)).max()
+                solved = _Layout(x, (lu, pivots), z, points, left, float(value))
+        self._cache[key] = solved
+        return solved
+
+    def _system(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """The support conditions of a layout as a linear system."""
+        n, n_fixed, fixed = len(x), int(self.fixed.sum()), self.fixed
+        d = np.maximum(x[:, None] - x[None, :], 0.0)  # (x_i - x_j)+
+        matrix = np.zeros((n + n_fixed + 2, n + n_fixed + 2))
+        # EI * deflection at the supports
+        matrix[:n, :n] = d**3 / 6.0
+        matrix[:n, n:-2] = d[:, fixed] ** 2 / 2.0
+        matrix[:n, -2] = 1.0
+        matrix[:n, -1] = x
+        # EI * rotation at the fixed supports
+        matrix[n:-2, :n] = d[fixed] ** 2 / 2.0
+        matrix[n:-2, n:-2] = d[np.ix_(fixed, fixed)]
+        matrix[n:-2, -1] = 1.0
+        # No shear and no moment right of the beam end
+        matrix[-2, :n] = 1.0
+        matrix[-1, :n] = self.beam.length - x
+        matrix[-1, n:-2] = 1.0
+        rhs = -np.concatenate(
+            (self._deflection(x), self._rotation(x[fixed]), self._end_actions)
+        )
+        return matrix, rhs
+
+    def _values(
+        self, x: np.ndarray, z: np.ndarray, points: np.ndarray, left: np.ndarray
+    ) -> np.ndarray:
+        """Moment (or deflection, positive down) of a solved layout at `points`."""
+        n = len(x)
+        d = points[:, None] - x[None, :]
+        reactions, moments = z[:n], z[n:-2]
+        if self.objective == "deflection":
+            a, b = z[-2:]
+            span = np.maximum(d, 0.0)
+            deflection = (
+                a + b * points + self._deflection(points)
+                + span**3 @ reactions / 6.0 + span[:, self.fixed] ** 2 @ moments / 2.0
+            )
+            return -deflection / self.EI
+        d_fixed = d[:, self.fixed]
+        steps = np.where(left[:, None], d_fixed > 0.0, d_fixed >= 0.0)
+        return (
+            self._moment(points, left) + np.maximum(d, 0.0) @ reactions
+            + steps @ moments
+        )
+
+    def _candidates(
+        self, x: np.ndarray, z: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locations (and sides) where the peak of a solved layout can be: both
+        limits at every break and the interior stationary points.
+        """
+        n = len(x)
+        reactions = {
+            float(loc): {'fy': float(fy), 'm': 0.0} for loc, fy in zip(x, z[:n])
+        }
+        for loc, m in zip(x[self.fixed], z[n:-2]):
+            reactions[float(loc)]['m'] = float(m)
+        _, diagram = compile_diagrams(self.layout(x), self.loads, reactions)
+        if self.objective == "deflection":
+            diagram = deflection_from_moment(self.layout(x), diagram, self.EI)
+        seg, t = diagram.stationary_points()
+        breaks = diagram.breaks
+        points = np.concatenate((breaks, breaks, breaks[seg] + t))
+        left = np.repeat([False, True, False], [len(breaks), len(breaks), len(seg)])
+        return points, left
+
+
+def optimize_supports(
+    beam: Beam,
+    loads: Iterable[Load] | LoadSet,
+    zones: Sequence[Tuple[float, float]] | None = None,
+    types: Sequence[Sequence[SupportType]] | None = None,
+    objective: str = "moment",
+    starts: int = 16,
+    local_searches: int = 3,
+    seed: int = 0,
+) -> PlacementResult:
+    """
+    Chooses support locations (and optionally types) that minimize the peak
+    bending moment or deflection.
+
+    Random layouts inside the zones are screened for every combination of
+    candidate types; only the best `local_searches` of all of them are refined
+    with L-BFGS-B (`scipy.optimize.minimize`). Each layout is solved with one
+    small factorization, which its forward-difference gradient reuses.
+
+    Args:
+        beam (Beam): The base beam; its supports give the number of supports,
+            their default types and a starting layout.
+        loads (Iterable[Load] | LoadSet): The applied loads.
+        zones (Sequence[Tuple[float, float]] | None): Allowed (min, max)
+            location of each support. Defaults to the whole beam; equal
+            bounds keep a support in place.
+        types (Sequence[Sequence[SupportType]] | None): Candidate types of
+            each support. Defaults to the current type of each support.
+        objective (str): "moment" (peak |M|) or "deflection" (peak |w|).
+        starts (int): Number of random layouts screened per type combination.
+        local_searches (int): Number of best screened layouts (over all type
+            combinations) refined by L-BFGS-B.
+        seed (int): Seed of the random layouts.
+
+    Returns:
+        PlacementResult: The best layout found.
+
+    Raises:
+        ValueError: On invalid zones or objective, or if no combination of
+            support types gives a stable beam.
+    """
+    if objective not in OBJECTIVES:
+        raise ValueError(f"Unknown objective: {objective}")
+    loads = LoadSet.coerce(loads)
+    n = len(beam.supports)
+    if zones is None:
+        zones = [(0.0, beam.length)] * n
+    bounds = np.array(zones, dtype=float).reshape(-1, 2)
+    if len(bounds) != n:
+        raise ValueError("One zone is required per support.")
+    inverted = np.any(bounds[:, 0] > bounds[:, 1])
+    if inverted or bounds.min() < 0 or bounds.max() > beam.length:
+        raise ValueError("Zones must lie on the beam and have min <= max.")
+    if types is None:
+        types = [[support.type] for support in beam.supports]
+    if len(types) != n:
+        raise ValueError("One list of candidate types is required per support.")
+
+    rng = np.random.default_rng(seed)
+    initial = np.clip([s.location for s in beam.supports], bounds[:, 0], bounds[:, 1])
+    candidates = np.vstack((
+        initial,
+        bounds[:, 0] + rng.random((starts, n)) * (bounds[:, 1] - bounds[:, 0]),
+    ))
+
+    # Screen every type combination, then refine the best layouts of all
+    screened = []
+    objectives = []
+    for combination in itertools.product(*types):
+        layout_objective = _LayoutObjective(beam, loads, combination, objective)
+        objectives.append(layout_objective)
+        values = layout_objective.batch(candidates)
+        screened.extend(
+            (value, len(objectives) - 1, i)
+            for i, value in enumerate(values)
+            if value < _PENALTY  # Stable with these support types
+        )
+
+    best: PlacementResult | None = None
+    for _, k, i in sorted(screened)[:local_searches]:
+        x, value = _local_search(objectives[k], candidates[i], bounds)
+        if best is None or value < best.objective:
+            best = PlacementResult(objectives[k].layout(x), value, 0)
+
+    if best is None:
+        raise ValueError("No combination of support types gives a stable beam.")
+    best.evaluations = sum(o.evaluations for o in objectives)
+    return best
+
+
+def _local_search(
+    layout_objective: _LayoutObjective, start: np.ndarray, bounds: np.ndarray
+) -> Tuple[np.ndarray, float]:
+    """Refines a layout with L-BFGS-B; supports with a zero-width zone stay put."""
+    free = bounds[:, 1] > bounds[:, 0]
+    if not free.any():
+        return start, layout_objective(start)
+    step = 1e-6 * layout_objective.beam.length
+
+    def full(x_free: np.ndarray) -> np.ndarray:
+        x = start.copy()
+        x[free] = x_free
+        return x
+
+    def value_and_gradient(x_free: np.ndarray) -> Tuple[float, np.ndarray]:
+        x = full(x_free)
+        # Step backwards at the upper bound
+        steps = np.zeros(len(x))
+        steps[free] = np.where(x_free + step <= bounds[free, 1], step, -step)
+        value = layout_objective(x)
+        return value, layout_objective.gradient(x, steps)[free]
+
+    result = minimize(
+        value_and_gradient,
+        start[free],
+        jac=True,
+        method="L-BFGS-B",
+        bounds=bounds[free],
+    )
+    x = full(result.x)
+    return x, layout_objective(x)
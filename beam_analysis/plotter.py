@@ -2,8 +2,11 @@ import numpy as np
 from rich.panel import Panel
 from rich.table import Table
 from rich.console import Group
+from beam_analysis import instrumentation
 from beam_analysis.beam import Beam, SupportType
-from beam_analysis.loads import PointLoad, UDL, PointMoment
+from beam_analysis.loads import (
+    PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad,
+)
 
 
 class ASCIIPlotter:
@@ -16,6 +19,7 @@ class ASCIIPlotter:
         self.width = width
         self.height = height
 
+    @instrumentation.timed("plotter.schematic")
     def plot_beam_schematic(self, beam: Beam, loads: list) -> Panel:
         """
         Creates a schematic representation of the beam, supports, and loads.
@@ -68,7 +72,7 @@ class ASCIIPlotter:
             elif isinstance(load, PointMoment):
                 gx = get_grid_x(load.location)
                 grid[beam_y - 1][gx] = "↻" if load.moment > 0 else "↺"
-            elif isinstance(load, UDL):
+            elif isinstance(load, (UDL, TrapezoidalLoad, TabulatedLoad)):
                 start_gx = get_grid_x(load.start)
                 end = load.end if load.end is not None else beam.length
                 end_gx = get_grid_x(end)
@@ -76,49 +80,92 @@ class ASCIIPlotter:
                     grid[beam_y - 1][x] = "w"
 
         plot_str = "\n".join(["".join(row) for row in grid])
-        legend = "\n[bold]Legend:[/bold] ▲=Pinned, ○=Roller, │=Fixed, ↓=Point Load, w=UDL, ↻=Moment"
+        legend = (
+            "\n[bold]Legend:[/bold] ▲=Pinned, ○=Roller, │=Fixed, "
+            "↓=Point Load, w=Distributed Load, ↻=Moment"
+        )
         return Panel(plot_str + legend, title="Kiriş Şeması (Beam Schematic)", expand=False)
 
+    @instrumentation.timed("plotter.plot")
     def plot(self, x_points: np.ndarray, y_points: np.ndarray, title: str) -> Panel:
         """
         Creates an ASCII plot within a Rich Panel.
+
+        The points are binned into the plot columns and every column is filled
+        between the smallest and largest value that falls into it, so peaks
+        and jumps are never lost however dense the samples are. Rendering cost
+        beyond the binning depends on the plot size only.
         """
-        # Normalize points to grid
-        grid = [[" " for _ in range(self.width)] for _ in range(self.height)]
+        x_points = np.asarray(x_points, dtype=float).ravel()
+        y_points = np.asarray(y_points, dtype=float).ravel()
 
-        y_min, y_max = min(y_points), max(y_points)
+        y_min, y_max = float(y_points.min()), float(y_points.max())
         if y_min == y_max:
             y_min, y_max = y_min - 1, y_max + 1
+        y_span = y_max - y_min
+
+        x_min, x_max = float(x_points.min()), float(x_points.max())
+        x_span = (x_max - x_min) or 1.0
+
+        # Per-column envelope of the points
+        columns = ((x_points - x_min) / x_span * (self.width - 1)).astype(int)
+        col_min = np.full(self.width, np.inf)
+        col_max = np.full(self.width, -np.inf)
+        np.minimum.at(col_min, columns, y_points)
+        np.maximum.at(col_max, columns, y_points)
+        has_data = col_min <= col_max
+
+        # Row index of every value, counted from the bottom
+        def row_of(values):
+            scaled = (np.asarray(values) - y_min) / y_span * (self.height - 1)
+            rows = scaled.astype(int)
+            return np.clip(rows, 0, self.height - 1)
+
+        rows = np.arange(self.height)[:, None]
+        low = row_of(np.where(has_data, col_min, y_min))
+        high = row_of(np.where(has_data, col_max, y_min))
+        filled = has_data & (rows >= low) & (rows <= high)
+
+        # Color each cell by the sign of its row value, clipped to the column's range
+        cell_values = np.clip(
+            y_min + rows * y_span / (self.height - 1), col_min, col_max
+        )
+        cells = np.where(
+            cell_values > 0.001,
+            _POSITIVE,
+            np.where(cell_values < -0.001, _NEGATIVE, _POINT),
+        )
 
-        x_min, x_max = min(x_points), max(x_points)
-
-        # Zero line index
-        zero_y_idx = int((0 - y_min) / (y_max - y_min) * (self.height - 1))
-        zero_y_idx = max(0, min(self.height - 1, zero_y_idx))
-        # Flip Y for grid (0 is top)
-        zero_grid_y = (self.height - 1) - zero_y_idx
-
-        # Draw zero line
-        for x in range(self.width):
-            grid[zero_grid_y][x] = "─"
-
-        # Plot points
-        for i in range(len(x_points)):
-            grid_x = int((x_points[i] - x_min) / (x_max - x_min) * (self.width - 1))
-            grid_y_idx = int(
-                (y_points[i] - y_min) / (y_max - y_min) * (self.height - 1)
-            )
-            grid_y = (self.height - 1) - grid_y_idx
-
-            # Use color-coded characters
-            if y_points[i] > 0.001:
-                grid[grid_y][grid_x] = "[green]█[/green]"
-            elif y_points[i] < -0.001:
-                grid[grid_y][grid_x] = "[red]█[/red]"
-            else:
-                grid[grid_y][grid_x] = "█"
+        grid = np.full((self.height, self.width), _EMPTY, dtype=np.int8)
+        grid[row_of(0.0)] = _ZERO_LINE
+        grid = np.where(filled, cells, grid)[::-1]  # Flip Y (row 0 is the top)
 
-        plot_str = "\n".join(["".join(row) for row in grid])
+        plot_str = "\n".join(_row_markup(row) for row in grid)
         return Panel(
             plot_str, title=title, subtitle=f"Min: {y_min:.2f} | Max: {y_max:.2f}"
         )
+
+
+# Cell kinds of the plot grid and their (character, style)
+_EMPTY, _ZERO_LINE, _POINT, _POSITIVE, _NEGATIVE = range(5)
+_CELL_MARKUP = {
+    _EMPTY: (" ", None),
+    _ZERO_LINE: ("─", None),
+    _POINT: ("█", None),
+    _POSITIVE: ("█", "green"),
+    _NEGATIVE: ("█", "red"),
+}
+
+
+def _row_markup(row: np.ndarray) -> str:
+    """Renders one grid row, with one markup tag per run of equal cells."""
+    change = np.flatnonzero(np.diff(row)) + 1
+    starts = np.concatenate(([0], change))
+    ends = np.concatenate((change, [len(row)]))
+
+    parts = []
+    for start, end in zip(starts, ends):
+        char, style = _CELL_MARKUP[int(row[start])]
+        text = char * int(end - start)
+        parts.append(f"[{style}]{text}[/{style}]" if style else text)
+    return "".join(parts)
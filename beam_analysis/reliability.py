@@ -0,0 +1,237 @@
+from dataclasses import dataclass
+from typing import Iterable, Sequence, Tuple
+import numpy as np
+from scipy import sparse
+from beam_analysis.beam import Beam
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.influence import InfluenceLines
+from beam_analysis.loads import Load, PointLoad, UDL
+
+DISTRIBUTIONS = ("normal", "lognormal")
+
+
+@dataclass
+class RandomLoad:
+    """
+    A point load or UDL with a random magnitude and position.
+
+    Attributes:
+        load (PointLoad | UDL): The load; its magnitude is the mean.
+        magnitude_std (float): Standard deviation of the magnitude.
+        distribution (str): "normal" or "lognormal" magnitude.
+        position_range (Tuple[float, float] | None): If given, the location of
+            a point load (the start of a UDL, whose extent is kept) is uniform
+            in this range. Otherwise the position is fixed.
+    """
+
+    load: PointLoad | UDL
+    magnitude_std: float = 0.0
+    distribution: str = "normal"
+    position_range: Tuple[float, float] | None = None
+
+    def __post_init__(self):
+        if not isinstance(self.load, (PointLoad, UDL)):
+            raise ValueError("Only point loads and UDLs can be random.")
+        if self.magnitude_std < 0:
+            raise ValueError("Standard deviation cannot be negative.")
+        if self.distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution: {self.distribution}")
+        if self.distribution == "lognormal" and self.mean <= 0:
+            raise ValueError("A lognormal magnitude needs a positive mean.")
+        if self.position_range is not None:
+            low, high = self.position_range
+            if low < 0 or low > high:
+                raise ValueError("Position range must satisfy 0 <= min <= max.")
+
+    @property
+    def mean(self) -> float:
+        if isinstance(self.load, PointLoad):
+            return self.load.force
+        return self.load.magnitude
+
+    def sample_magnitudes(self, rng: np.random.Generator, n: int, dtype) -> np.ndarray:
+        z = rng.standard_normal(n, dtype=dtype)
+        if self.distribution == "normal":
+            return (self.mean + self.magnitude_std * z).astype(dtype, copy=False)
+        # Lognormal with the given mean and standard deviation
+        sigma2 = np.log1p((self.magnitude_std / self.mean) ** 2)
+        mu = np.log(self.mean) - sigma2 / 2.0
+        return np.exp(mu + np.sqrt(sigma2) * z).astype(dtype, copy=False)
+
+    def sample_positions(self, rng: np.random.Generator, n: int, dtype) -> np.ndarray:
+        if self.position_range is None:
+            if isinstance(self.load, PointLoad):
+                start = self.load.location
+            else:
+                start = self.load.start
+            return np.full(n, start, dtype=dtype)
+        low, high = self.position_range
+        positions = low + (high - low) * rng.random(n, dtype=dtype)
+        return positions.astype(dtype, copy=False)
+
+
+@dataclass
+class MonteCarloResult:
+    """
+    Sampled responses of a beam, one entry per sample.
+
+    Attributes:
+        sections (np.ndarray): Sections at which the moment was evaluated.
+        support_locations (np.ndarray): Support positions.
+        max_moment (np.ndarray): (samples,) peak |M| over the sections in kNm.
+        reactions (np.ndarray): (samples x supports x 2) [fy, m] reactions.
+    """
+
+    sections: np.ndarray
+    support_locations: np.ndarray
+    max_moment: np.ndarray
+    reactions: np.ndarray
+
+    def exceedance_probability(self, values: np.ndarray, threshold: float) -> float:
+        """Fraction of samples of `values` (e.g. `max_moment`) above `threshold`."""
+        return float(np.mean(values > threshold))
+
+    def exceedance_quantiles(
+        self,
+        values: np.ndarray,
+        probabilities: Sequence[float] = (0.5, 0.1, 0.01, 0.001),
+    ) -> np.ndarray:
+        """
+        Values exceeded with the given probabilities.
+
+        Args:
+            values (np.ndarray): Samples, e.g. `max_moment` or `reactions[:, 0, 0]`.
+            probabilities (Sequence[float]): Exceedance probabilities.
+
+        Returns:
+            np.ndarray: One value per probability.
+        """
+        levels = 1.0 - np.asarray(probabilities, dtype=float)
+        return np.quantile(values, levels, axis=0)
+
+
+def monte_carlo(
+    beam: Beam,
+    random_loads: Sequence[RandomLoad],
+    fixed_loads: Iterable[Load] = (),
+    samples: int = 100_000,
+    sections: int = 201,
+    resolution: int = 2001,
+    chunk_size: int = 65536,
+    dtype=np.float32,
+    seed: int | None = None,
+) -> MonteCarloResult:
+    """
+    Samples the peak moment and the reactions under random loads.
+
+    Responses are linear in the loads, so the influence lines of the beam are
+    solved once (`InfluenceLines`) and every sample is a weighted sum of them:
+    point loads interpolate the unit responses at their position, UDLs take
+    the difference of their running integral. The fixed loads are analyzed
+    exactly once and added. Samples are drawn and evaluated in chunks of
+    `chunk_size`; the interpolation weights of a chunk form a sparse matrix,
+    so its responses are one sparse-dense product and memory is bounded by
+    chunk_size x (sections + reactions) whatever the number of samples.
+
+    Args:
+        beam (Beam): The beam (fixed topology).
+        random_loads (Sequence[RandomLoad]): Loads with random magnitude/position.
+        fixed_loads (Iterable[Load]): Deterministic loads.
+        samples (int): Number of samples.
+        sections (int): Number of evenly spaced sections for the peak moment.
+        resolution (int): Number of unit load positions of the influence lines.
+        chunk_size (int): Number of samples evaluated at once.
+        dtype: Floating point type of the samples (float32 or float64).
+        seed (int | None): Seed of the random generator.
+
+    Returns:
+        MonteCarloResult: The sampled responses.
+    """
+    if samples < 1 or chunk_size < 1:
+        raise ValueError("Samples and chunk size must be positive.")
+    if sections < 2 or (resolution - 1) % (sections - 1) != 0:
+        raise ValueError("Sections must be a subset of the influence line positions.")
+    length = beam.length
+    for random_load in random_loads:
+        position_range = random_load.position_range
+        if position_range is not None and position_range[1] > length:
+            raise ValueError("Position range must lie on the beam.")
+
+    influence = InfluenceLines(beam, resolution)
+    positions = influence.positions
+    step = positions[1] - positions[0]
+    section_x = positions[:: (resolution - 1) // (sections - 1)]
+    n_supports = len(beam.supports)
+
+    # Unit responses: moment at each section, then the flattened reactions
+    unit = np.hstack((
+        influence.moment(section_x), influence.reactions.reshape(resolution, -1)
+    ))
+    running = np.vstack((
+        np.zeros((1, unit.shape[1])),
+        np.cumsum((unit[1:] + unit[:-1]) * (step / 2.0), axis=0),
+    ))
+    unit, running = unit.astype(dtype), running.astype(dtype)
+
+    fixed_loads = list(fixed_loads)
+    base = np.zeros(unit.shape[1])
+    if fixed_loads:
+        engine = AnalysisEngine(beam)
+        engine.add_loads(fixed_loads)
+        reactions = engine.calculate_reactions()
+        base[: len(section_x)] = engine.moment_at(section_x)
+        base[len(section_x):] = [
+            value for s in beam.supports
+            for value in (reactions[s.location]['fy'], reactions[s.location]['m'])
+        ]
+    base = base.astype(dtype)
+
+    # Point loads gather from the unit responses, UDLs from their running
+    # integral: both are stacked so a chunk is one sparse-dense product
+    table = np.vstack((unit, running))
+
+    def weights(x: np.ndarray, offset: int) -> Tuple[np.ndarray, np.ndarray]:
+        scaled = np.clip(x, 0.0, length) / step
+        left = np.minimum(scaled.astype(np.int64), resolution - 2)
+        t = (scaled - left).astype(dtype)
+        return np.stack((left, left + 1), axis=1) + offset, np.stack((1 - t, t), axis=1)
+
+    rng = np.random.default_rng(seed)
+    max_moment = np.empty(samples, dtype=dtype)
+    reactions = np.empty((samples, n_supports, 2), dtype=dtype)
+    for start in range(0, samples, chunk_size):
+        n = min(chunk_size, samples - start)
+        columns, values = [], []
+        for random_load in random_loads:
+            magnitudes = random_load.sample_magnitudes(rng, n, dtype)[:, None]
+            x = random_load.sample_positions(rng, n, dtype)
+            if isinstance(random_load.load, PointLoad):
+                cols, w = weights(x, 0)
+            else:
+                load = random_load.load
+                extent = (length if load.end is None else load.end) - load.start
+                end_cols, end_w = weights(x + extent, resolution)
+                start_cols, start_w = weights(x, resolution)
+                cols = np.hstack((end_cols, start_cols))
+                w = np.hstack((end_w, -start_w))
+            columns.append(cols)
+            values.append(magnitudes * w)
+
+        response = np.tile(base, (n, 1))
+        if random_loads:
+            columns, values = np.hstack(columns), np.hstack(values)
+            sampled = sparse.csr_matrix(
+                (values.ravel(), columns.ravel(), np.arange(n + 1) * columns.shape[1]),
+                shape=(n, len(table)),
+            )
+            response += sampled @ table
+        moments, flat_reactions = np.split(response, [len(section_x)], axis=1)
+        max_moment[start : start + n] = np.abs(moments).max(axis=1)
+        reactions[start : start + n] = flat_reactions.reshape(n, n_supports, 2)
+
+    return MonteCarloResult(
+        sections=section_x,
+        support_locations=influence.support_locations,
+        max_moment=max_moment,
+        reactions=reactions,
+    )
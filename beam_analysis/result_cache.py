@@ -0,0 +1,308 @@
+import hashlib
+import json
+import sqlite3
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Tuple
+import numpy as np
+from beam_analysis import instrumentation
+from beam_analysis.beam import Beam
+from beam_analysis.diagram import deflection_from_moment
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+
+# Part of every key: bump it when the analysis or the stored format changes,
+# so that stale on-disk entries are never returned.
+CACHE_VERSION = 3
+
+
+def model_hash(beam: Beam, loads: Iterable[Load] | LoadSet, stations: int = 201) -> str:
+    """
+    Returns a canonical content hash of a beam, its loads and the sampling.
+
+    Supports and loads are sorted first, so models that differ only in the
+    order of their supports or loads share a hash. Values are hashed as exact
+    float64 bytes (-0.0 is treated as 0.0).
+
+    Returns:
+        str: A hexadecimal SHA-256 digest.
+    """
+    loads = LoadSet.coerce(loads)
+    nan = float("nan")
+    parts = [
+        np.array([
+            beam.length,
+            nan if beam.E is None else beam.E,
+            nan if beam.I is None else beam.I,
+            stations,
+        ]),
+        _sorted_rows(np.array(
+            [[s.location, s.type.value] for s in beam.supports], dtype=float
+        ).reshape(-1, 2)),
+        _sorted_rows(np.column_stack((loads.point_forces, loads.point_locations))),
+        _sorted_rows(np.column_stack((loads.moment_values, loads.moment_locations))),
+        _sorted_rows(np.column_stack((
+            loads.udl_magnitudes, loads.udl_starts, loads.udl_ends
+        ))),
+        _sorted_rows(np.column_stack((
+            loads.linear_start_magnitudes, loads.linear_end_magnitudes,
+            loads.linear_starts, loads.linear_ends,
+        ))),
+    ]
+    # Tabulated loads: one (samples x 2) part each, in a canonical order
+    tabulated = [np.column_stack((load.x, load.q)) for load in loads.tabulated]
+    parts.extend(sorted(tabulated, key=lambda rows: (len(rows), rows.tobytes())))
+
+    digest = hashlib.sha256(f"beam-analysis/{CACHE_VERSION}".encode())
+    for part in parts:
+        digest.update(np.int64(len(part)).tobytes())
+        digest.update(np.ascontiguousarray(part + 0.0).tobytes())
+    return digest.hexdigest()
+
+
+def _sorted_rows(rows: np.ndarray) -> np.ndarray:
+    """Sorts the rows of a 2D array lexicographically."""
+    return rows[np.lexsort(rows.T[::-1])] if len(rows) else rows
+
+
+@dataclass
+class AnalysisResult:
+    """
+    The cacheable results of one beam analysis.
+
+    Results served from a cache are shared; treat them as read-only.
+
+    Attributes:
+        reactions (Dict[float, Dict[str, float]]): Support reactions, in the
+            format of `AnalysisEngine.calculate_reactions`.
+        max_shear (Tuple[float, float]): (value, location) of the maximum shear.
+        max_moment (Tuple[float, float]): (value, location) of the maximum moment.
+        stations (np.ndarray): Positions where the diagrams were sampled.
+        shear (np.ndarray): Shear force at each station in kN.
+        moment (np.ndarray): Bending moment at each station in kNm.
+        flexibility (float): Maximum absolute deflection times EI in kNm^3
+            (the deflection of the beam with a unit EI).
+    """
+
+    reactions: Dict[float, Dict[str, float]]
+    max_shear: Tuple[float, float]
+    max_moment: Tuple[float, float]
+    stations: np.ndarray
+    shear: np.ndarray
+    moment: np.ndarray
+    flexibility: float
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint, used for the cache size limit."""
+        arrays = self.stations.nbytes + self.shear.nbytes + self.moment.nbytes
+        return arrays + 200 * (len(self.reactions) + 1)
+
+    def to_json(self) -> str:
+        """Serializes the result (floats round-trip exactly)."""
+        return json.dumps({
+            "reactions": [
+                [loc, rx['fy'], rx['m']] for loc, rx in self.reactions.items()
+            ],
+            "max_shear": list(self.max_shear),
+            "max_moment": list(self.max_moment),
+            "stations": self.stations.tolist(),
+            "shear": self.shear.tolist(),
+            "moment": self.moment.tolist(),
+            "flexibility": self.flexibility,
+        })
+
+    @classmethod
+    def from_json(cls, text: str) -> "AnalysisResult":
+        data = json.loads(text)
+        return cls(
+            reactions={loc: {'fy': fy, 'm': m} for loc, fy, m in data["reactions"]},
+            max_shear=tuple(data["max_shear"]),
+            max_moment=tuple(data["max_moment"]),
+            stations=np.array(data["stations"]),
+            shear=np.array(data["shear"]),
+            moment=np.array(data["moment"]),
+            flexibility=data["flexibility"],
+        )
+
+
+@dataclass
+class CacheStats:
+    """
+    Hit and miss counts of a `ResultCache`.
+
+    Attributes:
+        memory_hits (int): Lookups served by the in-memory LRU tier.
+        disk_hits (int): Lookups served by the SQLite tier.
+        misses (int): Lookups that required an analysis.
+        evictions (int): Entries dropped from the memory tier.
+    """
+
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ResultCache:
+    """
+    A two-tier cache of `AnalysisResult` keyed by `model_hash`.
+
+    The memory tier is an LRU bounded by entry count and total size. The
+    optional disk tier is a SQLite file shared across runs (and processes);
+    entries found there are promoted to memory.
+
+    Args:
+        max_entries (int): Maximum number of results kept in memory.
+        max_bytes (int): Maximum total size of the results kept in memory.
+        path (Path | None): SQLite file of the persistent tier, or None.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 2**20,
+        path: Path | None = None,
+    ):
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("Cache limits cannot be negative.")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._memory: "OrderedDict[str, AnalysisResult]" = OrderedDict()
+        self._memory_bytes = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(str(path), timeout=30.0)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self._db.commit()
+
+    def __len__(self) -> int:
+        """Number of results in the memory tier."""
+        return len(self._memory)
+
+    def get(self, key: str) -> AnalysisResult | None:
+        """Returns the cached result of `key`, or None (counted as a miss)."""
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            self.stats.memory_hits += 1
+            instrumentation.count("cache.hits")
+            return result
+
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT value FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                result = AnalysisResult.from_json(row[0])
+                self._remember(key, result)
+                self.stats.disk_hits += 1
+                instrumentation.count("cache.hits")
+                return result
+
+        self.stats.misses += 1
+        instrumentation.count("cache.misses")
+        return None
+
+    def put(self, key: str, result: AnalysisResult):
+        """Stores a result in both tiers."""
+        self._remember(key, result)
+        if self._db is not None:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                (key, result.to_json()),
+            )
+            self._db.commit()
+
+    def clear(self):
+        """Empties both tiers and resets the statistics."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        self.stats = CacheStats()
+        if self._db is not None:
+            self._db.execute("DELETE FROM results")
+            self._db.commit()
+
+    def close(self):
+        """Closes the SQLite tier; the memory tier stays usable."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _remember(self, key: str, result: AnalysisResult):
+        if key in self._memory:
+            self._memory_bytes -= self._memory.pop(key).nbytes
+        self._memory[key] = result
+        self._memory_bytes += result.nbytes
+        while self._memory and (
+            len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes
+        ):
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes
+            self.stats.evictions += 1
+
+
+def analyze(
+    beam: Beam,
+    loads: Iterable[Load] | LoadSet,
+    stations: int = 201,
+    cache: ResultCache | None = None,
+) -> AnalysisResult:
+    """
+    Analyzes a beam, or returns the cached result of an identical model.
+
+    Args:
+        beam (Beam): The beam to be analyzed.
+        loads (Iterable[Load] | LoadSet): The applied loads.
+        stations (int): Number of evenly spaced diagram samples.
+        cache (ResultCache | None): Cache to look the model up in and store
+            the result into.
+
+    Returns:
+        AnalysisResult: Reactions, extrema, sampled diagrams and the unit-EI
+            deflection, which is integrated from the moment diagram (no
+            extra solve).
+    """
+    loads = LoadSet.coerce(loads)
+    key = None
+    if cache is not None:
+        key = model_hash(beam, loads, stations)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    engine = AnalysisEngine(beam)
+    engine.add_loads(loads)
+    xs = np.linspace(0.0, beam.length, stations)
+    result = AnalysisResult(
+        reactions=engine.calculate_reactions(),
+        max_shear=engine.get_max_shear_info(),
+        max_moment=engine.get_max_moment_info(),
+        stations=xs,
+        shear=engine.shear_at(xs),
+        moment=engine.moment_at(xs),
+        flexibility=abs(
+            deflection_from_moment(beam, engine.get_diagrams()[1]).extremum()[0]
+        ),
+    )
+
+    if cache is not None:
+        cache.put(key, result)
+    return result
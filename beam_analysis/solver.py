@@ -1,203 +1,830 @@
+from dataclasses import dataclass
 import numpy as np
-from typing import Dict, List, Tuple
+from scipy import sparse
+from scipy.linalg import eigh
+from scipy.sparse.linalg import LinearOperator, SuperLU, eigsh, splu
+from typing import Dict, Iterable, List, Tuple
+from beam_analysis import instrumentation
 from beam_analysis.beam import Beam, SupportType
-from beam_analysis.loads import Load, PointLoad, UDL, PointMoment
+from beam_analysis.diagram import (
+    PiecewisePolynomial,
+    compile_diagrams,
+    deflection_from_moment,
+)
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load
+
+# Nodes closer than this are merged into one
+NODE_TOLERANCE = 1e-9
+
+# Eigenproblems with fewer free DOFs than this are solved densely
+DENSE_EIGEN_DOFS = 64
+
+
+@dataclass
+class Modes:
+    """
+    Natural modes of vibration of a beam, lowest frequency first.
+
+    Attributes:
+        frequencies (np.ndarray): Natural frequencies in Hz.
+        shapes (List[PiecewisePolynomial]): Mode shapes, scaled to a peak
+            |deflection| of 1.
+    """
+
+    frequencies: np.ndarray
+    shapes: List[PiecewisePolynomial]
+
+    @property
+    def periods(self) -> np.ndarray:
+        """Natural periods in s."""
+        return 1.0 / self.frequencies
+
 
 class MatrixBeamSolver:
     """
-    A Finite Element Method (FEM) based solver for 1D beam analysis using the 
+    A Finite Element Method (FEM) based solver for 1D beam analysis using the
     Direct Stiffness Method. This allows solving statically indeterminate beams.
+
+    The stiffness matrix is banded (each node only couples to its neighbours),
+    so it is assembled in one vectorized pass into `scipy.sparse` storage and
+    factorized with a sparse LU. Time and memory grow linearly with the node
+    count.
     """
 
-    def __init__(self, beam: Beam, loads: List[Load]):
+    def __init__(
+        self,
+        beam: Beam,
+        loads: Iterable[Load] | LoadSet,
+        max_element_length: float | None = None,
+    ):
+        """
+        Args:
+            beam (Beam): The beam.
+            loads (Iterable[Load] | LoadSet): The applied loads.
+            max_element_length (float | None): If given, elements are
+                subdivided evenly to at most this length (a fine mesh for
+                modal analysis). By default nodes are placed only at the beam
+                ends, supports and load events, which is exact for statics.
+        """
+        if max_element_length is not None and max_element_length <= 0:
+            raise ValueError("Maximum element length must be positive.")
         self.beam = beam
-        self.loads = loads
+        self.loads = LoadSet.coerce(loads)
+        self.max_element_length = max_element_length
         self.nodes = self._generate_nodes()
-        self.EI = 1.0e6  # Arbitrary value for uniform beam reaction calculation
-        
+        # Reactions of a uniform beam do not depend on EI, so an arbitrary
+        # value is used unless the beam defines E and I (needed for deflections).
+        self.EI = beam.EI if beam.EI is not None else 1.0e6
+
         # Degrees of Freedom: 2 per node (Vertical Translation v, Rotation theta)
         self.n_dof = len(self.nodes) * 2
+        self._factorization: Tuple[sparse.csc_matrix, np.ndarray, SuperLU] | None = None
+        self._own_loads: Tuple[np.ndarray, np.ndarray] | None = None
+
+        # Global displacement vector [v, theta] of the last `solve_reactions`
+        self.displacements: np.ndarray | None = None
+
+    def _generate_nodes(self) -> np.ndarray:
+        """
+        Generates sorted unique node locations based on beam features.
+
+        Tabulated loads only add their first and last sample: their exact
+        equivalent nodal loads do not need a node per sample, which would
+        make the stiffness matrix needlessly large and ill-conditioned.
+        """
+        loads = self.loads
+        length = self.beam.length
+        points = np.concatenate((
+            [0.0, length],
+            [support.location for support in self.beam.supports],
+            loads.point_locations,
+            loads.moment_locations,
+            loads.udl_starts,
+            np.where(np.isnan(loads.udl_ends), length, loads.udl_ends),
+            loads.linear_starts,
+            np.where(np.isnan(loads.linear_ends), length, loads.linear_ends),
+            [x for load in loads.tabulated for x in (load.start, load.end)],
+        ))
+        points = points[points <= length]
+
+        points = np.unique(points)
+        keep = np.concatenate(([True], np.diff(points) > NODE_TOLERANCE))
+        points = points[keep]
+        if self.max_element_length is None:
+            return points
+
+        # Split every element into equal parts no longer than the limit
+        lengths = np.diff(points)
+        parts = np.ceil(lengths / self.max_element_length).astype(np.int64)
+        element = np.repeat(np.arange(len(lengths)), parts)
+        offset = np.arange(len(element)) - np.repeat(np.cumsum(parts) - parts, parts)
+        refined = points[element] + lengths[element] * offset / parts[element]
+        return np.append(refined, points[-1])
+
+    def _node_index(self, locations) -> np.ndarray:
+        """Maps locations to the index of the closest node (binary search)."""
+        locations = np.asarray(locations, dtype=float)
+        right = np.clip(np.searchsorted(self.nodes, locations), 1, len(self.nodes) - 1)
+        left = right - 1
+        closer_left = (locations - self.nodes[left]) <= (self.nodes[right] - locations)
+        return np.where(closer_left, left, right)
+
+    def _element_dofs(self) -> np.ndarray:
+        """Global DOF indices [v1, theta1, v2, theta2] of every element."""
+        first = 2 * np.arange(len(self.nodes) - 1)
+        return first[:, None] + np.arange(4)
+
+    @instrumentation.timed("solver.assemble_stiffness")
+    def assemble_stiffness(self) -> sparse.csc_matrix:
+        """
+        Assembles the global stiffness matrix.
+
+        Returns:
+            sparse.csc_matrix: The (n_dof x n_dof) stiffness matrix.
+        """
+        return self._assemble(self._element_stiffness())
+
+    def _element_stiffness(self) -> np.ndarray:
+        """Local stiffness matrices of all elements, (elements x 4 x 4)."""
+        L = np.diff(self.nodes)[:, None, None]
+        # Element Stiffness Matrix
+        # Coordinate system: Y positive UP, Moment positive CCW
+        # DOFs: [v1, theta1, v2, theta2]
+        pattern = np.array([
+            [12, 6, -12, 6],
+            [6, 4, -6, 2],
+            [-12, -6, 12, -6],
+            [6, 2, -6, 4],
+        ], dtype=float)
+        # Power of L multiplying each term
+        powers = np.array([
+            [0, 1, 0, 1],
+            [1, 2, 1, 2],
+            [0, 1, 0, 1],
+            [1, 2, 1, 2],
+        ])
+        return (self.EI / L**3) * pattern * L**powers
+
+    def assemble_mass(self, mass_per_length: float) -> sparse.csc_matrix:
+        """
+        Assembles the consistent mass matrix (same DOFs and shape functions
+        as the stiffness matrix).
+
+        Args:
+            mass_per_length (float): Mass of the beam in kg/m.
+
+        Returns:
+            sparse.csc_matrix: The (n_dof x n_dof) mass matrix in tonnes, the
+                mass unit consistent with kN, m and s.
+        """
+        if mass_per_length <= 0:
+            raise ValueError("Mass per length must be positive.")
+        L = np.diff(self.nodes)[:, None, None]
+        pattern = np.array([
+            [156, 22, 54, -13],
+            [22, 4, 13, -3],
+            [54, 13, 156, -22],
+            [-13, -3, -22, 4],
+        ], dtype=float)
+        powers = np.array([
+            [0, 1, 0, 1],
+            [1, 2, 1, 2],
+            [0, 1, 0, 1],
+            [1, 2, 1, 2],
+        ])
+        m_local = (mass_per_length * 1e-3 * L / 420.0) * pattern * L**powers
+        return self._assemble(m_local)
+
+    def _assemble(self, element_matrices: np.ndarray) -> sparse.csc_matrix:
+        """Adds (elements x 4 x 4) element matrices into a global sparse matrix."""
+        dofs = self._element_dofs()
+        rows = np.broadcast_to(dofs[:, :, None], element_matrices.shape)
+        cols = np.broadcast_to(dofs[:, None, :], element_matrices.shape)
+        matrix = sparse.coo_matrix(
+            (element_matrices.ravel(), (rows.ravel(), cols.ravel())),
+            shape=(self.n_dof, self.n_dof),
+        )
+        return matrix.tocsc()
+
+    @instrumentation.timed("solver.assemble_loads")
+    def assemble_load_vector(
+        self, loads: Iterable[Load] | LoadSet | None = None
+    ) -> np.ndarray:
+        """
+        Assembles the external load vector (equivalent nodal loads included).
+
+        Loads do not have to sit on nodes: loads inside an element are turned
+        into consistent nodal loads with the Hermite shape functions, which is
+        exact for the reactions and nodal displacements.
+
+        Args:
+            loads (Iterable[Load] | LoadSet | None): Loads to assemble.
+                Defaults to the loads the solver was created with.
+
+        Returns:
+            np.ndarray: The load vector, Y positive UP and moments positive CCW.
+        """
+        if loads is None:
+            fea, F = self._own_load_vectors()
+        else:
+            fea, F = self._load_vectors(LoadSet.coerce(loads))
+        return F + self._scatter(np.arange(len(fea)), fea)
+
+    def _own_load_vectors(self) -> Tuple[np.ndarray, np.ndarray]:
+        """`_load_vectors` of the solver's loads, computed once."""
+        if self._own_loads is None:
+            self._own_loads = self._load_vectors(self.loads)
+        return self._own_loads
+
+    def _load_vectors(self, loads: LoadSet) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Splits loads into element loads and nodal loads.
+
+        Distributed loads and concentrated loads between nodes act on the
+        elements and become consistent nodal loads (fixed-end actions).
+        Concentrated loads on a node act on the node directly.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (elements x 4) fixed-end actions and
+                the (n_dof,) vector of nodal loads, Y positive UP and moments
+                positive CCW.
+        """
+        n_elements = len(self.nodes) - 1
+        element_loads = [(np.array([], dtype=np.int64), np.zeros((0, 4)))]
+        F = np.zeros(self.n_dof)
+
+        # Equivalent Nodal Loads from distributed loads (UDL, linear, tabulated)
+        starts, ends, q_starts, q_ends = loads.distributed_segments(self.beam.length)
+        if len(starts):
+            elements, vectors = self._distributed_load_pieces(
+                starts, ends, q_starts, q_ends
+            )
+            # User load is positive DOWN. My system Y is UP.
+            element_loads.append((elements, -vectors))
+
+        # Point Loads / Moments
+        # User Force positive DOWN -> My Y positive UP -> Add -Force
+        # User Moment positive CW -> My Moment positive CCW -> Add -Moment
+        for locations, values, rotation in (
+            (loads.point_locations, loads.point_forces, 0),
+            (loads.moment_locations, loads.moment_values, 1),
+        ):
+            if not len(values):
+                continue
+            nodes = self._node_index(locations)
+            on_node = np.abs(self.nodes[nodes] - locations) <= NODE_TOLERANCE
+            F -= np.bincount(
+                2 * nodes[on_node] + rotation, values[on_node], minlength=self.n_dof
+            )
+            if not on_node.all():
+                elements, N, dN = self._shape_functions(locations[~on_node])
+                shape = dN if rotation else N
+                element_loads.append((elements, -values[~on_node, None] * shape))
+
+        elements = np.concatenate([e for e, _ in element_loads])
+        vectors = np.concatenate([v for _, v in element_loads])
+        fea = np.column_stack([
+            np.bincount(elements, vectors[:, k], minlength=n_elements) for k in range(4)
+        ])
+        return fea, F
+
+    def _shape_functions(
+        self, locations
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Evaluates the Hermite shape functions at arbitrary locations.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: The element containing
+                each location, the shape functions N (n x 4) and their
+                derivatives dN/dx (n x 4), in DOF order [v1, theta1, v2, theta2].
+        """
+        locations = np.asarray(locations, dtype=float)
+        n_elements = len(self.nodes) - 1
+        elements = np.clip(
+            np.searchsorted(self.nodes, locations, side="right") - 1, 0, n_elements - 1
+        )
+        L = self.nodes[elements + 1] - self.nodes[elements]
+        xi = np.clip((locations - self.nodes[elements]) / L, 0.0, 1.0)
+
+        N = np.stack([
+            1 - 3 * xi**2 + 2 * xi**3,
+            L * (xi - 2 * xi**2 + xi**3),
+            3 * xi**2 - 2 * xi**3,
+            L * (xi**3 - xi**2),
+        ], axis=-1)
+        dN = np.stack([
+            (6 * xi**2 - 6 * xi) / L,
+            1 - 4 * xi + 3 * xi**2,
+            (6 * xi - 6 * xi**2) / L,
+            3 * xi**2 - 2 * xi,
+        ], axis=-1)
+        return elements, N, dN
+
+    def _distributed_load_pieces(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        q_starts: np.ndarray,
+        q_ends: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Consistent nodal loads of linearly varying distributed loads.
+
+        Loads are split at the nodes. The elements a load covers fully only
+        add its linear intensity, which is summed per element with difference
+        arrays; the partially covered end elements are kept per load. Then q * N
+        is integrated over each piece with 3-point Gauss quadrature, which is
+        exact for a linear load times the cubic shape functions. The cost is
+        O(loads + elements) however much the loads overlap.
+
+        Args:
+            starts, ends (np.ndarray): Extents of the loads in meters.
+            q_starts, q_ends (np.ndarray): Intensities at the start and end in
+                kN/m. Positive is downwards.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The element of each piece and its
+                (pieces x 4) load vector, positive DOWN.
+        """
+        ends = np.minimum(ends, self.beam.length)
+        loaded = ends > starts
+        starts, ends = starts[loaded], ends[loaded]
+        q_starts, q_ends = q_starts[loaded], q_ends[loaded]
+
+        n_elements = len(self.nodes) - 1
+        first = np.clip(
+            np.searchsorted(self.nodes, starts, side="right") - 1, 0, n_elements - 1
+        )
+        last = np.clip(
+            np.searchsorted(self.nodes, ends, side="left") - 1, 0, n_elements - 1
+        )
+
+        # Intensity as q(x) = a + b * x in global coordinates
+        b = (q_ends - q_starts) / (ends - starts)
+        a = q_starts - b * starts
+
+        # Fully covered elements: sum the intensities of all loads per element
+        full = last - first >= 2
+        a_full = self._range_sum(first[full] + 1, last[full], a[full], n_elements)
+        b_full = self._range_sum(first[full] + 1, last[full], b[full], n_elements)
+        covered = np.nonzero((a_full != 0.0) | (b_full != 0.0))[0]
+
+        # Partially covered end elements: one piece per load and end element
+        two_ends = last > first
+        end_load = np.concatenate((np.arange(len(starts)), np.nonzero(two_ends)[0]))
+        end_element = np.concatenate((first, last[two_ends]))
+
+        elements = np.concatenate((covered, end_element))
+        u = np.concatenate((
+            self.nodes[covered],
+            np.maximum(self.nodes[end_element], starts[end_load]),
+        ))
+        v = np.concatenate((
+            self.nodes[covered + 1],
+            np.minimum(self.nodes[end_element + 1], ends[end_load]),
+        ))
+        piece_a = np.concatenate((a_full[covered], a[end_load]))
+        piece_b = np.concatenate((b_full[covered], b[end_load]))
+
+        gauss_points = np.array([-np.sqrt(0.6), 0.0, np.sqrt(0.6)])
+        gauss_weights = np.array([5.0, 8.0, 5.0]) / 9.0
+        half = np.maximum(v - u, 0.0) / 2.0
+        x = (u + v)[:, None] / 2.0 + half[:, None] * gauss_points
+        q = piece_a[:, None] + piece_b[:, None] * x
+
+        _, N, _ = self._shape_functions(x.ravel())
+        N = N.reshape(x.shape + (4,))
+        weights = (gauss_weights * half[:, None] * q)[..., None]
+        return elements, (weights * N).sum(axis=1)
+
+    @staticmethod
+    def _range_sum(
+        first: np.ndarray, stop: np.ndarray, values: np.ndarray, size: int
+    ) -> np.ndarray:
+        """Sums `values` over the index ranges [first, stop) with a difference array."""
+        delta = np.bincount(first, values, minlength=size + 1) - np.bincount(
+            stop, values, minlength=size + 1
+        )
+        return np.cumsum(delta)[:size]
+
+    def _scatter(self, elements: np.ndarray, element_vectors: np.ndarray) -> np.ndarray:
+        """Adds (n x 4) element vectors into a global (n_dof,) vector."""
+        dofs = self._element_dofs()[elements]
+        return np.bincount(
+            dofs.ravel(), element_vectors.ravel(), minlength=self.n_dof
+        )
+
+    def _support_nodes(self) -> np.ndarray:
+        """Returns the node index of every support."""
+        return self._node_index([support.location for support in self.beam.supports])
+
+    def _constrained_dofs(self) -> np.ndarray:
+        """Returns the DOFs restrained by the supports."""
+        idx = self._support_nodes()
+        fixed = np.array(
+            [support.type == SupportType.FIXED for support in self.beam.supports],
+            dtype=bool,
+        )
+        # v (vertical) is always constrained for all support types,
+        # theta (rotation) only for FIXED supports
+        return np.unique(np.concatenate((2 * idx, 2 * idx[fixed] + 1)))
+
+    def factorize(self) -> Tuple[sparse.csc_matrix, np.ndarray, SuperLU]:
+        """
+        Assembles and factorizes the stiffness matrix once per solver.
+
+        Returns:
+            Tuple[sparse.csc_matrix, np.ndarray, SuperLU]: The global stiffness
+                matrix, the mask of free DOFs and the LU factors of K_ff.
+        """
+        if self._factorization is not None:
+            return self._factorization
+
+        instrumentation.count("solver.factorizations")
+        constrained = self._constrained_dofs()
+        # Without interior hinges a beam is stable once it has two vertical
+        # restraints or a single clamped node.
+        if len(constrained) < 2:
+            raise ValueError("The beam is unstable under the given supports.")
+
+        K = self.assemble_stiffness()
+        free = np.ones(self.n_dof, dtype=bool)
+        free[constrained] = False
 
-    def _generate_nodes(self) -> List[float]:
-        """Generates sorted unique node locations based on beam features."""
-        points = {0.0, self.beam.length}
-        
-        for support in self.beam.supports:
-            points.add(support.location)
-            
-        for load in self.loads:
-            if isinstance(load, PointLoad):
-                points.add(load.location)
-            elif isinstance(load, PointMoment):
-                points.add(load.location)
-            elif isinstance(load, UDL):
-                points.add(load.start)
-                end = load.end if load.end is not None else self.beam.length
-                points.add(end)
-        
-        return sorted(list(points))
+        K_ff = K[free][:, free]
+        try:
+            with instrumentation.phase("solver.factorize"):
+                lu = splu(K_ff.tocsc())
+        except RuntimeError as exc:
+            raise ValueError("The beam is unstable under the given supports.") from exc
+
+        self._factorization = (K, free, lu)
+        return self._factorization
+
+    @instrumentation.timed("solver.solve")
+    def solve_displacements(self, F: np.ndarray) -> np.ndarray:
+        """
+        Solves K * d = F with the cached factorization.
+
+        Args:
+            F (np.ndarray): One load vector (n_dof,) or several as the columns
+                of an (n_dof, n_cases) matrix.
+
+        Returns:
+            np.ndarray: Displacements with the same shape as `F`
+                        (0.0 at constrained DOFs).
+        """
+        _, free, lu = self.factorize()
+        instrumentation.count("solver.load_vectors", F.shape[1] if F.ndim == 2 else 1)
+        d = np.zeros(F.shape)
+        d[free] = lu.solve(F[free])
+        return d
 
     def solve_reactions(self) -> Dict[float, Dict[str, float]]:
         """
         Solves the system and returns reactions at supported nodes.
         Returns format compatible with AnalysisEngine: {location: {'fy': val, 'm': val}}
         """
-        K = np.zeros((self.n_dof, self.n_dof))
-        F = np.zeros(self.n_dof)
-        
-        # 1. Assemble Global Stiffness Matrix and Equivalent Nodal Loads
-        for i in range(len(self.nodes) - 1):
-            x1 = self.nodes[i]
-            x2 = self.nodes[i+1]
-            L = x2 - x1
-            
-            if L <= 1e-9:
-                continue
-                
-            # Element Stiffness Matrix
-            # Coordinate system: Y positive UP, Moment positive CCW
-            # DOFs: [v1, theta1, v2, theta2]
-            k_local = (self.EI / L**3) * np.array([
-                [12,      6*L,    -12,     6*L],
-                [6*L,     4*L**2, -6*L,    2*L**2],
-                [-12,     -6*L,    12,     -6*L],
-                [6*L,     2*L**2, -6*L,    4*L**2]
-            ])
-            
-            # Map to global indices
-            indices = [2*i, 2*i+1, 2*(i+1), 2*(i+1)+1]
-            for r in range(4):
-                for c in range(4):
-                    K[indices[r], indices[c]] += k_local[r, c]
-            
-            # Equivalent Nodal Loads from UDL
-            # Check for UDLs on this element
-            w_segment = 0.0 # Net distributed load (Positive UP)
-            
-            mid_point = (x1 + x2) / 2.0
-            for load in self.loads:
-                if isinstance(load, UDL):
-                    end = load.end if load.end is not None else self.beam.length
-                    # Handle floating point precision with epsilon
-                    if load.start <= mid_point and end >= mid_point:
-                        # User UDL is positive DOWN. My system Y is UP.
-                        w_segment += (-load.magnitude)
-            
-            if abs(w_segment) > 1e-9:
-                # Fixed End Actions for Uniform Load w (Positive UP)
-                # Left (Node 1): Fy = wL/2, M = wL^2/12
-                # Right (Node 2): Fy = wL/2, M = -wL^2/12
-                fem_v1 = w_segment * L / 2
-                fem_m1 = w_segment * L**2 / 12
-                fem_v2 = w_segment * L / 2
-                fem_m2 = -w_segment * L**2 / 12
-                
-                # Add Equivalent Nodal Loads (Negative of FEM) to F
-                F[2*i]     += fem_v1
-                F[2*i+1]   += fem_m1
-                F[2*(i+1)] += fem_v2
-                F[2*(i+1)+1] += fem_m2
-
-        # 2. Add Nodal Loads (Point Loads / Moments)
-        for load in self.loads:
-            if isinstance(load, (PointLoad, PointMoment)):
-                # Find closest node index
-                # (Using min distance to handle float precision)
-                idx = np.argmin(np.abs(np.array(self.nodes) - load.location))
-                
-                if isinstance(load, PointLoad):
-                    # User Force positive DOWN -> My Y positive UP -> Add -Force
-                    F[2*idx] += (-load.force)
-                elif isinstance(load, PointMoment):
-                    # User Moment positive CW -> My Moment positive CCW -> Add -Moment
-                    F[2*idx+1] += (-load.moment)
-
-        # 3. Apply Boundary Conditions
-        constrained_dofs = []
-        
-        # We need to map support location to node index
-        support_indices = {}
-        for support in self.beam.supports:
-            idx = np.argmin(np.abs(np.array(self.nodes) - support.location))
-            support_indices[idx] = support
-            
-            # Apply constraints
-            # v (vertical) is always constrained for all support types
-            constrained_dofs.append(2*idx) 
-            
-            if support.type == SupportType.FIXED:
-                # theta (rotation) is also constrained
-                constrained_dofs.append(2*idx+1)
-
-        constrained_dofs = sorted(list(set(constrained_dofs)))
-        free_dofs = [i for i in range(self.n_dof) if i not in constrained_dofs]
-        
-        # 4. Solve for Displacements
-        # Partition matrices
-        K_ff = K[np.ix_(free_dofs, free_dofs)]
-        F_f = F[free_dofs]
-        
-        # Solve K_ff * d_f = F_f
-        d_f = np.linalg.solve(K_ff, F_f)
-        
-        # Construct full displacement vector
-        d_global = np.zeros(self.n_dof)
-        d_global[free_dofs] = d_f
-        # d_global[constrained_dofs] is 0.0 (homogeneous BCs)
-        
-        # 5. Calculate Reactions
-        # R = K * d - F_external
-        # Note: F vector currently contains Equivalent Nodal Loads + Point Loads.
-        # We want the reaction force which balances the internal force and external load.
-        # Equilibrium at node: R + F_external = F_internal (K*d)
-        # So R = K*d - F_external
-        # However, F constructed above *is* the external load vector (including equivalent nodal loads).
-        # So R = K * d_global - F
-        
-        internal_forces = K @ d_global
-        reactions_vector = internal_forces - F
-        
-        results = {}
-        for idx, support in support_indices.items():
-            # Extract reaction from vector
-            r_y = reactions_vector[2*idx]
-            r_m = reactions_vector[2*idx+1]
-            
-            # Convert back to user sign convention
-            # My Y UP -> User Y UP (Wait, user convention:
-            # In engine.py: return {'fy': force, 'm': moment}
-            # Standard: Reaction UP is positive.
-            # My calc: r_y is UP (because Y is UP).
-            
-            # User Moment:
-            # In engine.py: "Reaction moment is opposite to the applied moment"
-            # It seems user expects reaction moment convention. 
-            # If I have a fixed support and I apply CW moment, reaction is CCW.
-            # My calc: r_m is CCW.
-            # Let's check engine.py for single fixed support:
-            # load.force (Down) -> total_vertical_force += load.force (Down sum)
-            # return fy: total_vertical_force. 
-            # WAIT. If load is Down, reaction must be Up.
-            # If engine.py returns positive for Upward reaction resisting Downward load:
-            # load.force (positive) is DOWN.
-            # reaction should be UP.
-            # engine.py: total_vertical_force += load.force -> returns this.
-            # So engine output Positive = UP (magnitude equal to load).
-            # My r_y is Positive UP. So `fy` = r_y.
-            
-            # For Moment:
-            # load.moment (CW).
-            # total_moment += load.moment.
-            # returns 'm': -total_moment.
-            # So if load is CW (Pos), reaction is -Pos = Neg.
-            # Neg = CCW.
-            # My r_m is CCW.
-            # So if r_m is positive (CCW), it matches the sign of -total_moment (CCW).
-            # So `m` = r_m.
-            
-            results[support.location] = {
-                'fy': r_y,
-                'm': r_m
+        F = self.assemble_load_vector()
+        self.displacements = self.solve_displacements(F)
+        return self._reaction_dict(*self._support_reactions(F, self.displacements))
+
+    def _reaction_dict(
+        self, fy: np.ndarray, m: np.ndarray
+    ) -> Dict[float, Dict[str, float]]:
+        return {
+            support.location: {'fy': float(fy[j]), 'm': float(m[j])}
+            for j, support in enumerate(self.beam.supports)
+        }
+
+    def solve_load_cases(
+        self, load_cases: List[Iterable[Load] | LoadSet]
+    ) -> List[Dict[float, Dict[str, float]]]:
+        """
+        Solves several load cases with a single stiffness factorization.
+
+        All right-hand sides are solved together as one matrix.
+
+        Args:
+            load_cases (List[Iterable[Load] | LoadSet]): The loads of each case.
+
+        Returns:
+            List[Dict[float, Dict[str, float]]]: Reactions of each case, in the
+                format of `solve_reactions`.
+        """
+        F = np.column_stack([self.assemble_load_vector(loads) for loads in load_cases])
+        fy, m = self._support_reactions(F)
+
+        return [
+            {
+                support.location: {'fy': float(fy[j, case]), 'm': float(m[j, case])}
+                for j, support in enumerate(self.beam.supports)
             }
-            
-        return results
+            for case in range(len(load_cases))
+        ]
+
+    def unit_load_reactions(self, locations, chunk_size: int = 512) -> np.ndarray:
+        """
+        Reactions due to a unit downward point load at each location.
+
+        The locations do not have to be nodes, so a solver created without
+        loads (nodes at the supports and beam ends only) serves any load
+        position on the same topology. The right-hand sides are solved in
+        chunks against the cached factorization to bound memory.
+
+        Args:
+            locations (array-like): Positions of the unit load.
+            chunk_size (int): Number of unit loads solved at once.
+
+        Returns:
+            np.ndarray: (locations x supports x 2) array of [fy, m].
+        """
+        locations = np.asarray(locations, dtype=float)
+        result = np.zeros((len(locations), len(self.beam.supports), 2))
+        for start in range(0, len(locations), chunk_size):
+            chunk = slice(start, start + chunk_size)
+            elements, N, _ = self._shape_functions(locations[chunk])
+            F = np.zeros((self.n_dof, len(N)))
+            dofs = self._element_dofs()[elements]
+            # Unit force positive DOWN -> My Y positive UP
+            F[dofs, np.arange(len(N))[:, None]] = -N
+            fy, m = self._support_reactions(F)
+            result[chunk, :, 0] = fy.T
+            result[chunk, :, 1] = m.T
+        return result
+
+    @instrumentation.timed("solver.modes")
+    def natural_modes(self, mass_per_length: float, modes: int = 3) -> Modes:
+        """
+        Natural frequencies and mode shapes of the unloaded beam.
+
+        Solves K * phi = omega^2 * M * phi for the lowest `modes` eigenpairs
+        with `eigsh` in shift-invert mode around zero. The inverse is applied
+        with the cached LU factors of K_ff, so only a few sparse solves per
+        iteration are needed and the cost grows linearly with the mesh.
+        Create the solver with `max_element_length` for an accurate mesh (the
+        default mesh has nodes at the supports and load events only); 20 to
+        100 elements per span are plenty, while much finer meshes lose
+        accuracy to round-off as K becomes ill-conditioned. Tiny systems are
+        solved densely.
+
+        Args:
+            mass_per_length (float): Mass of the beam in kg/m.
+            modes (int): Number of modes.
+
+        Returns:
+            Modes: The lowest modes (fewer if the mesh has fewer free DOFs).
+        """
+        if self.beam.EI is None:
+            raise ValueError("Modal analysis requires E and I.")
+        if modes < 1:
+            raise ValueError("Number of modes must be positive.")
+        K, free, lu = self.factorize()
+        M_ff = self.assemble_mass(mass_per_length)[free][:, free]
+        n_free = int(free.sum())
+        modes = min(modes, n_free)
+
+        if n_free < DENSE_EIGEN_DOFS:
+            omega2, vectors = eigh(
+                K[free][:, free].toarray(),
+                M_ff.toarray(),
+                subset_by_index=[0, modes - 1],
+            )
+        else:
+            inverse = LinearOperator((n_free, n_free), matvec=lu.solve, dtype=float)
+            omega2, vectors = eigsh(
+                K[free][:, free], k=modes, M=M_ff, sigma=0.0, which="LM", OPinv=inverse
+            )
+            order = np.argsort(omega2)
+            omega2, vectors = omega2[order], vectors[:, order]
+
+        d = np.zeros((self.n_dof, modes))
+        d[free] = vectors
+        shapes = []
+        for mode in d.T:
+            shape = PiecewisePolynomial(self.nodes, self._hermite_coefficients(mode))
+            peak = shape.extremum()[0]
+            shapes.append(PiecewisePolynomial(self.nodes, shape.coeffs / peak))
+        frequencies = np.sqrt(np.maximum(omega2, 0.0)) / (2.0 * np.pi)
+        return Modes(frequencies, shapes)
+
+    def _support_reactions(
+        self, F: np.ndarray, d: np.ndarray | None = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Solves load vectors (columns of F) and extracts the support reactions.
+
+        Args:
+            F (np.ndarray): Load vector(s).
+            d (np.ndarray | None): Displacements, if already solved.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (supports x cases) arrays of 'fy'
+                and 'm' in the engine's sign convention.
+        """
+        K, _, _ = self.factorize()
+        if d is None:
+            d = self.solve_displacements(F)
+
+        # Equilibrium at node: R + F_external = K * d  ->  R = K * d - F
+        reactions_matrix = K @ d - F
+
+        # r_y is positive UP, like the engine's 'fy'.
+        # r_m is positive CCW, the engine's 'm' is the reaction moment in
+        # the applied-moment convention (positive CW), hence the sign flip.
+        idx = self._support_nodes()
+        return reactions_matrix[2 * idx], -reactions_matrix[2 * idx + 1]
+
+    def nodal_displacements(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Deflections and rotations at the nodes from the last solve.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Deflections in m (positive downwards)
+                and rotations in rad (positive clockwise), one per node.
+        """
+        d = self._solved_displacements()
+        return -d[0::2], -d[1::2]
+
+    def fixed_end_actions(
+        self, loads: Iterable[Load] | LoadSet | None = None
+    ) -> np.ndarray:
+        """
+        Consistent nodal loads of the loads acting inside each element.
+
+        Distributed loads and concentrated loads between nodes are element
+        loads; concentrated loads on a node act on the node directly and are
+        not included.
+
+        Args:
+            loads (Iterable[Load] | LoadSet | None): Defaults to the loads the
+                solver was created with.
+
+        Returns:
+            np.ndarray: (elements x 4) load vectors [F1, M1, F2, M2], Y
+                positive UP and moments positive CCW.
+        """
+        if loads is None:
+            return self._own_load_vectors()[0]
+        return self._load_vectors(LoadSet.coerce(loads))[0]
+
+    def element_end_forces(self) -> np.ndarray:
+        """
+        End forces of every element from the last solve.
+
+        f = k_local @ d_element - FEA, the forces and moments the nodes apply
+        to each element to keep it in equilibrium with its own loads.
+
+        Returns:
+            np.ndarray: (elements x 4) [F1, M1, F2, M2], Y positive UP and
+                moments positive CCW.
+        """
+        d = self._solved_displacements()
+        L = np.diff(self.nodes)
+        v1, t1 = d[0:-2:2], d[1:-2:2]
+        v2, t2 = d[2::2], d[3::2]
+        # k_local @ d_element, written out to avoid (elements x 4 x 4) arrays
+        k = self.EI / L**3
+        forces = np.empty((len(L), 4))
+        forces[:, 0] = k * (12 * (v1 - v2) + 6 * L * (t1 + t2))
+        forces[:, 1] = k * L * (6 * (v1 - v2) + L * (4 * t1 + 2 * t2))
+        forces[:, 2] = -forces[:, 0]
+        forces[:, 3] = k * L * (6 * (v1 - v2) + L * (2 * t1 + 4 * t2))
+        return forces - self.fixed_end_actions()
+
+    def internal_force_diagrams(
+        self,
+    ) -> Tuple[PiecewisePolynomial, PiecewisePolynomial]:
+        """
+        Shear and moment diagrams recovered from the element end forces.
+
+        Inside an element, V and M follow from the force and moment at its
+        left end plus the distributed load on the element. The nodes lie at
+        every load event, so this is exact, and a query only touches the
+        element containing it. Tabulated loads are not linear within an
+        element; with them the diagrams are compiled from the reactions
+        (`compile_diagrams`), which integrates the loads sample by sample.
+
+        Returns:
+            Tuple[PiecewisePolynomial, PiecewisePolynomial]: (shear, moment)
+                in the engine's sign convention.
+        """
+        if self.loads.tabulated:
+            d = self._solved_displacements()
+            fy, m = self._support_reactions(self.assemble_load_vector(), d)
+            return compile_diagrams(self.beam, self.loads, self._reaction_dict(fy, m))
+
+        forces = self.element_end_forces()
+        # Distributed load w0 + w1 * t on each element, positive DOWN
+        w0, w1 = -self._element_distributed_loads().T
+
+        n = len(self.nodes)
+        shear = np.zeros((n, 3))
+        moment = np.zeros((n, 4))
+        # The left node pushes the element up by V and turns it CCW by -M.
+        # Nothing acts right of the beam end, so the last segment is zero.
+        shear[:-1, 0] = forces[:, 0]
+        shear[:-1, 1] = -w0
+        shear[:-1, 2] = -w1 / 2.0
+        moment[:-1, 0] = -forces[:, 1]
+        moment[:-1, 1] = forces[:, 0]
+        moment[:-1, 2] = -w0 / 2.0
+        moment[:-1, 3] = -w1 / 6.0
+        if not w1.any():
+            shear, moment = shear[:, :2], moment[:, :3]  # Uniform loads only
+        return (
+            PiecewisePolynomial(self.nodes, shear),
+            PiecewisePolynomial(self.nodes, moment),
+        )
+
+    def deflection_diagram(self) -> PiecewisePolynomial:
+        """
+        Deflection along the beam from the last solve.
+
+        Inside each element the nodal values are interpolated with the Hermite
+        shape functions, plus the fixed-end deflection of the distributed load
+        on that element, which makes the curve exact for the default mesh
+        (nodes at every load event). With tabulated loads the moment diagram
+        is integrated instead (`deflection_from_moment`). No further solve is
+        needed.
+
+        Returns:
+            PiecewisePolynomial: Deflection in m (positive downwards). Its
+                derivative is the rotation (positive clockwise).
+        """
+        if self.loads.tabulated:
+            moment = self.internal_force_diagrams()[1]
+            return deflection_from_moment(self.beam, moment, self.EI)
+
+        coeffs = self._hermite_coefficients(self._solved_displacements())
+        L = np.diff(self.nodes)
+        # Distributed load w + slope * t on each element, positive DOWN
+        w, slope = -self._element_distributed_loads().T
+
+        # Fixed-fixed particular solution: v = -w t^2 (L - t)^2 / (24 EI)
+        coeffs[:-1, 2] -= w * L**2 / (24 * self.EI)
+        coeffs[:-1, 3] += w * L / (12 * self.EI)
+        coeffs[:-1, 4] -= w / (24 * self.EI)
+        if slope.any():
+            # Plus v = -slope (t^5 / 120 - L^2 t^3 / 40 + L^3 t^2 / 60) / EI
+            coeffs = np.column_stack((coeffs, np.zeros(len(coeffs))))
+            coeffs[:-1, 2] -= slope * L**3 / (60 * self.EI)
+            coeffs[:-1, 3] += slope * L**2 / (40 * self.EI)
+            coeffs[:-1, 5] -= slope / (120 * self.EI)
+
+        # My Y is UP, user deflection is positive DOWN
+        return PiecewisePolynomial(self.nodes, -coeffs)
+
+    def _hermite_coefficients(self, d: np.ndarray) -> np.ndarray:
+        """
+        Cubic Hermite interpolation of nodal [v, theta] values.
+
+        Returns:
+            np.ndarray: (nodes x 5) coefficients in local t, Y positive UP,
+                with a zero-width segment at the beam end.
+        """
+        L = np.diff(self.nodes)
+        v1, t1 = d[0:-2:2], d[1:-2:2]
+        v2, t2 = d[2::2], d[3::2]
+
+        coeffs = np.zeros((len(self.nodes), 5))
+        coeffs[:-1, 0] = v1
+        coeffs[:-1, 1] = t1
+        coeffs[:-1, 2] = 3 * (v2 - v1) / L**2 - (2 * t1 + t2) / L
+        coeffs[:-1, 3] = 2 * (v1 - v2) / L**3 + (t1 + t2) / L**2
+        coeffs[-1, 0] = d[-2]
+        coeffs[-1, 1] = d[-1]
+        return coeffs
+
+    def _element_distributed_loads(self) -> np.ndarray:
+        """
+        Net linear load on each element (Y positive UP).
+
+        An element carries a distributed load piece when its midpoint lies
+        within the piece, which is exact when the piece ends are nodes.
+
+        Returns:
+            np.ndarray: (elements x 2) intensity at the left node and its
+                slope along the element.
+        """
+        mid_points = (self.nodes[:-1] + self.nodes[1:]) / 2.0
+        n_elements = len(mid_points)
+        starts, ends, q_starts, q_ends = self.loads.distributed_segments(
+            self.beam.length
+        )
+        # User load is positive DOWN. My system Y is UP.
+        b = -(q_ends - q_starts) / (ends - starts)
+        a = -q_starts - b * starts
+        first = np.searchsorted(mid_points, starts, side="left")
+        last = np.searchsorted(mid_points, ends, side="right")
+        a = self._range_sum(first, last, a, n_elements)
+        b = self._range_sum(first, last, b, n_elements)
+        return np.column_stack((a + b * self.nodes[:-1], b))
+
+    def _solved_displacements(self) -> np.ndarray:
+        """Returns the displacements of the last solve, solving if needed."""
+        if self.displacements is None:
+            self.solve_reactions()
+        return self.displacements
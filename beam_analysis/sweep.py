@@ -0,0 +1,232 @@
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+import numpy as np
+from beam_analysis.beam import Beam, Support
+from beam_analysis.diagram import compile_diagrams
+from beam_analysis.engine import solve_reactions
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import Load, TabulatedLoad, TrapezoidalLoad, UDL
+from beam_analysis.solver import MatrixBeamSolver
+
+
+@dataclass
+class SweepResult:
+    """
+    Results of a parametric sweep, one row per variant.
+
+    Rows of invalid variants (e.g. a support outside the beam or an unstable
+    layout) are NaN and flagged in `valid`.
+
+    Attributes:
+        names (List[str]): Swept parameters, e.g. "length", "support[1]", "load[0]".
+        values (np.ndarray): (variants x parameters) parameter values.
+        valid (np.ndarray): (variants,) whether the variant could be analyzed.
+        max_shear (np.ndarray): (variants x 2) [value, location] of the maximum shear.
+        max_moment (np.ndarray): (variants x 2) [value, location] of the maximum moment.
+        reactions (np.ndarray): (variants x supports x 2) [fy, m], in the
+            order of the base beam's supports.
+    """
+
+    names: List[str]
+    values: np.ndarray
+    valid: np.ndarray
+    max_shear: np.ndarray
+    max_moment: np.ndarray
+    reactions: np.ndarray
+
+    def column(self, name: str) -> np.ndarray:
+        """Returns the values of one swept parameter."""
+        try:
+            return self.values[:, self.names.index(name)]
+        except ValueError:
+            raise KeyError(f"Unknown sweep parameter: {name}") from None
+
+
+def sweep(
+    beam: Beam,
+    loads: Iterable[Load] | LoadSet,
+    lengths: Sequence[float] | None = None,
+    support_locations: Mapping[int, Sequence[float]] | None = None,
+    load_locations: Mapping[int, Sequence[float]] | None = None,
+    workers: int = 1,
+    chunk_size: int = 512,
+) -> SweepResult:
+    """
+    Analyzes every combination of the given parameter values.
+
+    Variants are grouped by topology (length and support layout). Each group
+    is one unit of work: determinate layouts are solved by statics, others
+    factorize a single stiffness matrix and solve all load variants of the
+    group as the columns of one right-hand side.
+
+    Args:
+        beam (Beam): The base beam.
+        loads (Iterable[Load] | LoadSet): The base loads.
+        lengths (Sequence[float] | None): Beam lengths to sweep.
+        support_locations (Mapping[int, Sequence[float]] | None): Locations to
+            sweep for the support with the given index.
+        load_locations (Mapping[int, Sequence[float]] | None): Locations to
+            sweep for the load with the given index. For a distributed load
+            this is its start; its extent (and profile) is kept.
+        workers (int): Number of worker processes (1 runs in-process).
+        chunk_size (int): Maximum number of variants per unit of work.
+
+    Returns:
+        SweepResult: One row per variant, in grid (C) order of the parameters.
+    """
+    if workers < 1 or chunk_size < 1:
+        raise ValueError("Workers and chunk size must be positive.")
+    loads = list(loads)
+    support_locations = dict(support_locations or {})
+    load_locations = dict(load_locations or {})
+    for index in support_locations:
+        if not 0 <= index < len(beam.supports):
+            raise ValueError(f"Unknown support index: {index}")
+    for index in load_locations:
+        if not 0 <= index < len(loads):
+            raise ValueError(f"Unknown load index: {index}")
+
+    axes: Dict[str, Sequence[float]] = {}
+    if lengths is not None:
+        axes["length"] = lengths
+    axes.update({f"support[{i}]": v for i, v in sorted(support_locations.items())})
+    axes.update({f"load[{i}]": v for i, v in sorted(load_locations.items())})
+
+    names = list(axes)
+    grids = np.meshgrid(
+        *[np.asarray(v, dtype=float) for v in axes.values()], indexing="ij"
+    )
+    if names:
+        values = np.stack([g.ravel() for g in grids], axis=1)
+    else:
+        values = np.zeros((1, 0))
+    n_variants = len(values)
+
+    # Group variants sharing a topology, then split big groups into chunks
+    topology_columns = [
+        i for i, name in enumerate(names) if not name.startswith("load")
+    ]
+    _, group_of = np.unique(values[:, topology_columns], axis=0, return_inverse=True)
+    order = np.argsort(group_of.ravel(), kind="stable")
+    boundaries = np.flatnonzero(np.diff(group_of.ravel()[order])) + 1
+    tasks = [
+        rows[i : i + chunk_size]
+        for rows in np.split(order, boundaries)
+        for i in range(0, len(rows), chunk_size)
+    ]
+
+    n_supports = len(beam.supports)
+    result = SweepResult(
+        names=names,
+        values=values,
+        valid=np.zeros(n_variants, dtype=bool),
+        max_shear=np.full((n_variants, 2), np.nan),
+        max_moment=np.full((n_variants, 2), np.nan),
+        reactions=np.full((n_variants, n_supports, 2), np.nan),
+    )
+
+    def store(rows: np.ndarray, outcome: Tuple[np.ndarray, ...]):
+        valid, max_shear, max_moment, reactions = outcome
+        result.valid[rows] = valid
+        result.max_shear[rows] = max_shear
+        result.max_moment[rows] = max_moment
+        result.reactions[rows] = reactions
+
+    if workers == 1:
+        for rows in tasks:
+            store(rows, analyze_variants(beam, loads, names, values[rows]))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            (rows, pool.submit(analyze_variants, beam, loads, names, values[rows]))
+            for rows in tasks
+        ]
+        for rows, future in futures:
+            store(rows, future.result())
+    return result
+
+
+def analyze_variants(
+    beam: Beam, loads: List[Load], names: List[str], values: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Analyzes variants that share one topology (the unit of work of `sweep`).
+
+    Returns:
+        Tuple[np.ndarray, ...]: valid flags, max shear, max moment and
+            reactions of every variant, as in `SweepResult`.
+    """
+    n, n_supports = len(values), len(beam.supports)
+    valid = np.zeros(n, dtype=bool)
+    max_shear = np.full((n, 2), np.nan)
+    max_moment = np.full((n, 2), np.nan)
+    reactions = np.full((n, n_supports, 2), np.nan)
+
+    try:
+        variant_beam = _variant_beam(beam, names, values[0])
+    except ValueError:
+        return valid, max_shear, max_moment, reactions
+    locations = [support.location for support in variant_beam.supports]
+    if len(set(locations)) < n_supports:
+        return valid, max_shear, max_moment, reactions  # Supports coincide
+
+    load_sets, rows = [], []
+    for i, row in enumerate(values):
+        variant_loads = _variant_loads(loads, names, row)
+        if all(_on_beam(load, variant_beam.length) for load in variant_loads):
+            load_sets.append(LoadSet(variant_loads))
+            rows.append(i)
+
+    try:
+        if n_supports in (1, 2):
+            case_reactions = [solve_reactions(variant_beam, ls) for ls in load_sets]
+        else:
+            solver = MatrixBeamSolver(variant_beam, [])
+            case_reactions = solver.solve_load_cases(load_sets) if load_sets else []
+    except ValueError:
+        return valid, max_shear, max_moment, reactions
+
+    for i, load_set, rx in zip(rows, load_sets, case_reactions):
+        shear, moment = compile_diagrams(variant_beam, load_set, rx)
+        valid[i] = True
+        max_shear[i] = shear.extremum()
+        max_moment[i] = moment.extremum()
+        reactions[i] = [[rx[loc]['fy'], rx[loc]['m']] for loc in locations]
+
+    return valid, max_shear, max_moment, reactions
+
+
+def _variant_beam(beam: Beam, names: List[str], row: np.ndarray) -> Beam:
+    length = beam.length
+    supports = list(beam.supports)
+    for name, value in zip(names, row):
+        if name == "length":
+            length = float(value)
+        elif name.startswith("support["):
+            i = int(name[8:-1])
+            supports[i] = Support(location=float(value), type=supports[i].type)
+    return Beam(length=length, supports=supports, E=beam.E, I=beam.I)
+
+
+def _variant_loads(loads: List[Load], names: List[str], row: np.ndarray) -> List[Load]:
+    loads = list(loads)
+    for name, value in zip(names, row):
+        if name.startswith("load["):
+            i = int(name[5:-1])
+            load = loads[i]
+            if isinstance(load, (UDL, TrapezoidalLoad)):
+                end = None if load.end is None else float(value) + load.end - load.start
+                loads[i] = replace(load, start=float(value), end=end)
+            elif isinstance(load, TabulatedLoad):
+                loads[i] = TabulatedLoad(load.x + (float(value) - load.start), load.q)
+            else:
+                loads[i] = replace(load, location=float(value))
+    return loads
+
+
+def _on_beam(load: Load, length: float) -> bool:
+    if isinstance(load, (UDL, TrapezoidalLoad, TabulatedLoad)):
+        return load.start < length
+    return load.location <= length
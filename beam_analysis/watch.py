@@ -0,0 +1,249 @@
+"""
+Re-analysis of model files when they change, used by the `watch` command.
+
+Files are polled by modification time and size. A changed file is read
+again and every model in it is compared with its previous version: if the
+beam is unchanged, only the loads that differ are removed from or added to
+the model's `AnalysisEngine`, which updates its cached results incrementally.
+Each update lists the panels whose displayed content changed, so the CLI
+redraws only those.
+"""
+from collections import Counter
+from dataclasses import astuple, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+import numpy as np
+from beam_analysis.beam import Beam
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import Load, TabulatedLoad
+from beam_analysis.model_io import model_from_dict, model_to_dict, read_models
+
+MODEL_SUFFIXES = (".json", ".jsonl", ".csv")
+
+# Input summary first, then the panels of `cli.result_panels`
+PANELS = ("summary", "reactions", "extrema", "schematic", "shear", "moment")
+
+# Diagram samples compared to detect changed plots (as drawn by the CLI)
+PANEL_SAMPLES = 200
+
+
+def diff_loads(
+    old: Sequence[Load], new: Sequence[Load]
+) -> Tuple[List[Load], List[Load]]:
+    """
+    Compares two load lists as multisets (their order does not matter).
+
+    Returns:
+        Tuple[List[Load], List[Load]]: (removed, added) loads.
+    """
+    def key(load: Load) -> Tuple:
+        if isinstance(load, TabulatedLoad):
+            return (type(load).__name__, tuple(load.x), tuple(load.q))
+        return (type(load).__name__, astuple(load))
+
+    unmatched = Counter(key(load) for load in new)
+    removed = []
+    for load in old:
+        if unmatched[key(load)] > 0:
+            unmatched[key(load)] -= 1
+        else:
+            removed.append(load)
+
+    unmatched = Counter(key(load) for load in old)
+    added = []
+    for load in new:
+        if unmatched[key(load)] > 0:
+            unmatched[key(load)] -= 1
+        else:
+            added.append(load)
+    return removed, added
+
+
+@dataclass
+class ModelUpdate:
+    """
+    The outcome of re-reading one model.
+
+    Attributes:
+        name (str): The file, followed by "#<id>" for files with several models.
+        beam (Beam | None): The new beam (None on errors and deletions).
+        loads (List[Load]): The new loads, in file order.
+        engine (AnalysisEngine | None): The solved model.
+        panels (List[str]): Names of the panels (see `PANELS`) whose content changed.
+        added (int): Number of loads added to the previous version.
+        removed (int): Number of loads removed from the previous version.
+        rebuilt (bool): True if the model was analyzed from scratch (new
+            model or changed beam) instead of incrementally.
+        deleted (bool): True if the model no longer exists.
+        error (str | None): Why the model could not be analyzed.
+    """
+
+    name: str
+    beam: Beam | None = None
+    loads: List[Load] = field(default_factory=list)
+    engine: AnalysisEngine | None = None
+    panels: List[str] = field(default_factory=list)
+    added: int = 0
+    removed: int = 0
+    rebuilt: bool = False
+    deleted: bool = False
+    error: str | None = None
+
+
+@dataclass
+class _WatchedModel:
+    beam: Beam
+    loads: List[Load]
+    engine: AnalysisEngine
+    keys: Dict[str, Any]  # Panel name -> content of the last render
+
+
+class ModelWatcher:
+    """
+    Tracks model files (or directories of them) and re-analyzes changed models.
+
+    Args:
+        paths (Iterable[Path]): Model files (.json, .jsonl, .csv) or
+            directories, which are scanned for such files on every poll.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        self.paths = [Path(path) for path in paths]
+        self._stamps: Dict[Path, Tuple[int, int]] = {}
+        self._files: Dict[Path, List[str]] = {}  # File -> names of its models
+        self._models: Dict[str, _WatchedModel] = {}
+
+    def files(self) -> List[Path]:
+        """Returns the model files currently being watched."""
+        files = []
+        for path in self.paths:
+            if path.is_dir():
+                files.extend(sorted(
+                    p for p in path.iterdir() if p.suffix.lower() in MODEL_SUFFIXES
+                ))
+            elif path.exists():
+                files.append(path)
+        return files
+
+    def poll(self) -> List[ModelUpdate]:
+        """
+        Checks the files once and re-analyzes the models of changed ones.
+
+        The first poll analyzes every model.
+
+        Returns:
+            List[ModelUpdate]: One update per model of every changed, new or
+                deleted file.
+        """
+        stamps = {}
+        for path in self.files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue  # Deleted while scanning
+            stamps[path] = (stat.st_mtime_ns, stat.st_size)
+
+        updates = []
+        for path in self._stamps.keys() - stamps.keys():
+            for name in self._files.pop(path, []):
+                self._models.pop(name, None)
+                updates.append(ModelUpdate(name=name, deleted=True))
+        for path, stamp in stamps.items():
+            if self._stamps.get(path) != stamp:
+                updates.extend(self._reload(path))
+        self._stamps = stamps
+        return updates
+
+    def _reload(self, path: Path) -> List[ModelUpdate]:
+        try:
+            models = list(read_models(path))
+        except (OSError, ValueError) as exc:
+            return [ModelUpdate(name=str(path), error=str(exc))]
+
+        names = [
+            str(path) if len(models) == 1 else f"{path}#{data.get('id', i + 1)}"
+            for i, data in enumerate(models)
+        ]
+        updates = []
+        for name in self._files.get(path, []):
+            if name not in names:
+                self._models.pop(name, None)
+                updates.append(ModelUpdate(name=name, deleted=True))
+        updates.extend(self._update(name, data) for name, data in zip(names, models))
+        self._files[path] = [name for name in names if name in self._models]
+        return updates
+
+    def _update(self, name: str, data: Dict[str, Any]) -> ModelUpdate:
+        previous = self._models.pop(name, None)
+        try:
+            beam, loads = model_from_dict(data)
+            if previous is None or previous.beam != beam:
+                engine = AnalysisEngine(beam)
+                engine.add_loads(loads)
+                update = ModelUpdate(
+                    name, beam, loads, engine, added=len(loads), rebuilt=True
+                )
+            else:
+                engine = previous.engine
+                removed, added = diff_loads(previous.loads, loads)
+                # A changed load becomes an update, the rest are additions or removals
+                for old, new in zip(removed, added):
+                    engine.update_load(old, new)
+                for old in removed[len(added):]:
+                    engine.remove_load(old)
+                for new in added[len(removed):]:
+                    engine.add_load(new)
+                update = ModelUpdate(
+                    name, beam, loads, engine, added=len(added), removed=len(removed)
+                )
+            engine.calculate_reactions()
+        except ValueError as exc:
+            return ModelUpdate(name=name, error=str(exc))
+
+        edited = update.rebuilt or update.added or update.removed
+        keys = _panel_keys(beam, loads, engine, None if edited else previous.keys)
+        changed = {
+            panel for panel in keys
+            if previous is None or not _same(previous.keys[panel], keys[panel])
+        }
+        if changed & {"shear", "moment"}:
+            changed.add("extrema")
+        update.panels = [panel for panel in PANELS if panel in changed]
+        self._models[name] = _WatchedModel(beam, loads, engine, keys)
+        return update
+
+
+def _panel_keys(
+    beam: Beam,
+    loads: List[Load],
+    engine: AnalysisEngine,
+    previous: Dict[str, Any] | None = None,
+) -> Dict[str, Any]:
+    """
+    The content each panel is drawn from, rounded like the displayed values.
+
+    The extrema panel has no key: its exact values need the diagrams rebuilt
+    from all loads, so it is redrawn whenever the shear or moment changes.
+    With `previous`, the keys of the same analysis (no load changed), only
+    the keys of the input panels are computed again.
+    """
+    model = model_to_dict(beam, loads)
+    if previous is not None:
+        return dict(previous, summary=model, schematic=model)
+    x = np.linspace(0.0, beam.length, PANEL_SAMPLES)
+    return {
+        "summary": model,
+        "reactions": [
+            (loc, f"{rx['fy']:.2f}", f"{rx['m']:.2f}")
+            for loc, rx in engine.calculate_reactions().items()
+        ],
+        "schematic": model,
+        "shear": engine.shear_at(x),
+        "moment": engine.moment_at(x),
+    }
+
+
+def _same(old: Any, new: Any) -> bool:
+    if isinstance(new, np.ndarray):
+        return old.shape == new.shape and np.allclose(old, new, rtol=1e-9, atol=1e-9)
+    return old == new
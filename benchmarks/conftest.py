@@ -0,0 +1,179 @@
+"""
+Benchmark harness for `pytest benchmarks`.
+
+Every benchmark measures the wall time (best of a few runs) and the peak
+memory (one extra run under tracemalloc) of a callable. Results are compared
+against a JSON baseline and a benchmark fails when one of its metrics grew by
+more than the threshold.
+
+Wall times depend on the machine, so they are compared in units of a fixed
+calibration workload timed once per session ("relative_time"): a baseline
+recorded on one machine stays valid on slower or faster ones. Absolute times
+are stored as well, but only compared with --benchmark-absolute. Options:
+
+    --benchmark-baseline PATH   baseline file (default: benchmarks/baseline.json)
+    --benchmark-threshold X     allowed relative growth (default: 0.5 = +50%)
+    --benchmark-update          write the current results as the new baseline
+    --benchmark-absolute        also compare absolute wall times
+    --benchmark-json PATH       also write the current results to PATH
+"""
+import json
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pytest
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Differences below these are noise, whatever the relative change
+MIN_TIME_DELTA = 0.005  # s
+MIN_MEMORY_DELTA = 256 * 1024  # bytes
+
+_results: Dict[str, Dict[str, float]] = {}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark-baseline", type=Path, default=DEFAULT_BASELINE)
+    group.addoption("--benchmark-threshold", type=float, default=0.5)
+    group.addoption("--benchmark-update", action="store_true")
+    group.addoption("--benchmark-absolute", action="store_true")
+    group.addoption("--benchmark-json", type=Path, default=None)
+
+
+def _calibration_workload():
+    """A fixed mix of interpreter and numpy work, like the benchmarks."""
+    total = 0.0
+    for i in range(100_000):
+        total += i * 0.5
+    values = np.random.default_rng(0).random(200_000)
+    np.sort(values)
+    np.cumsum(values)
+    return total + float(values @ values)
+
+
+def calibrate(repeat: int = 5) -> float:
+    """Returns the best wall time of the calibration workload in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        _calibration_workload()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(func: Callable[[], Any], repeat: int = 3) -> Dict[str, float]:
+    """
+    Measures the best wall time and the peak traced memory of `func`.
+
+    Timing runs are done without tracemalloc, which slows allocations down.
+
+    Returns:
+        Dict[str, float]: {"time": seconds, "peak_memory": bytes}
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"time": best, "peak_memory": float(peak)}
+
+
+def regressions(
+    current: Dict[str, float],
+    baseline: Dict[str, float],
+    threshold: float,
+    calibration: float,
+    absolute: bool = False,
+) -> Dict[str, str]:
+    """
+    Returns a message for every metric that grew beyond the threshold.
+
+    Args:
+        calibration (float): Calibration time of this session in seconds,
+            which scales the noise floor of "relative_time".
+        absolute (bool): Also compare the absolute "time".
+    """
+    slack = {
+        "time": MIN_TIME_DELTA,
+        "relative_time": MIN_TIME_DELTA / calibration,
+        "peak_memory": MIN_MEMORY_DELTA,
+    }
+    failed = {}
+    for metric, value in current.items():
+        if metric == "time" and not absolute:
+            continue
+        reference = baseline.get(metric)
+        if reference is None:
+            continue
+        if value > reference * (1.0 + threshold) and value - reference > slack[metric]:
+            failed[metric] = f"{metric}: {value:.6g} vs baseline {reference:.6g}"
+    return failed
+
+
+@pytest.fixture(scope="session")
+def baseline(request) -> Dict[str, Dict[str, float]]:
+    path = request.config.getoption("--benchmark-baseline")
+    if request.config.getoption("--benchmark-update") or not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+@pytest.fixture(scope="session")
+def calibration() -> float:
+    return calibrate()
+
+
+@pytest.fixture
+def benchmark(request, baseline, calibration):
+    """
+    Measures a callable and checks it against the baseline.
+
+    Usage: ``benchmark(func, repeat=3)``; returns the measured metrics.
+    """
+    threshold = request.config.getoption("--benchmark-threshold")
+    absolute = request.config.getoption("--benchmark-absolute")
+
+    def run(func: Callable[[], Any], repeat: int = 3) -> Dict[str, float]:
+        result = measure(func, repeat)
+        result["relative_time"] = result["time"] / calibration
+        _results[request.node.nodeid] = result
+        failed = regressions(
+            result, baseline.get(request.node.nodeid, {}), threshold,
+            calibration, absolute,
+        )
+        if failed:
+            pytest.fail("Benchmark regression: " + "; ".join(failed.values()))
+        return result
+
+    return run
+
+
+def pytest_sessionfinish(session, exitstatus):
+    if not _results:
+        return
+    config = session.config
+    paths = [config.getoption("--benchmark-json")]
+    if config.getoption("--benchmark-update"):
+        paths.append(config.getoption("--benchmark-baseline"))
+
+    for path in filter(None, paths):
+        merged = {}
+        if path.exists():
+            with open(path, encoding="utf-8") as f:
+                merged = json.load(f)
+        merged.update(_results)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dict(sorted(merged.items())), f, indent=2)
+            f.write("\n")
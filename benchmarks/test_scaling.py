@@ -0,0 +1,148 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import PointLoad, UDL, PointMoment
+from beam_analysis.plotter import ASCIIPlotter
+from beam_analysis.solver import MatrixBeamSolver
+
+LOAD_COUNTS = [10, 1_000, 100_000]
+SUPPORT_COUNTS = [1, 2, 10, 1_000]
+RESOLUTIONS = [200, 10_000, 100_000]
+LENGTH = 100.0
+
+
+def make_beam(n_supports: int) -> Beam:
+    if n_supports == 1:
+        return Beam(LENGTH, [Support(0.0, SupportType.FIXED)])
+    locations = np.linspace(0.0, LENGTH, n_supports)
+    supports = [Support(float(x)) for x in locations]
+    supports[0] = Support(0.0, SupportType.PINNED)
+    return Beam(LENGTH, supports)
+
+
+def make_loads(n_loads: int, seed: int = 0) -> list:
+    """A reproducible mix of point loads, moments and UDLs."""
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0.0, LENGTH, size=(n_loads, 2))
+    magnitudes = rng.uniform(1.0, 10.0, size=n_loads)
+    loads = []
+    for i in range(n_loads):
+        if i % 3 == 0:
+            loads.append(PointLoad(force=magnitudes[i], location=x[i, 0]))
+        elif i % 3 == 1:
+            loads.append(PointMoment(moment=magnitudes[i], location=x[i, 0]))
+        else:
+            start, end = sorted(x[i])
+            loads.append(UDL(magnitude=magnitudes[i], start=start, end=end))
+    return loads
+
+
+@pytest.mark.parametrize("n_supports", SUPPORT_COUNTS)
+@pytest.mark.parametrize("n_loads", LOAD_COUNTS)
+def test_engine_analysis(benchmark, n_loads, n_supports):
+    beam = make_beam(n_supports)
+    loads = make_loads(n_loads)
+    stations = np.linspace(0.0, LENGTH, 1_000)
+
+    def analyze():
+        engine = AnalysisEngine(beam)
+        for load in loads:
+            engine.add_load(load)
+        engine.calculate_reactions()
+        engine.get_max_moment_info()
+        engine.moment_at(stations)
+
+    benchmark(analyze, repeat=1 if n_loads >= 100_000 else 3)
+
+
+@pytest.mark.parametrize("n_supports", [2, 1_000])
+@pytest.mark.parametrize("n_loads", LOAD_COUNTS)
+def test_engine_bulk_point_loads(benchmark, n_loads, n_supports):
+    beam = make_beam(n_supports)
+    rng = np.random.default_rng(0)
+    forces = rng.uniform(1.0, 10.0, n_loads)
+    locations = rng.uniform(0.0, LENGTH, n_loads)
+
+    def analyze():
+        loads = LoadSet()
+        loads.add_point_loads(forces, locations)
+        engine = AnalysisEngine(beam)
+        engine.add_loads(loads)
+        engine.calculate_reactions()
+        engine.get_max_moment_info()
+
+    benchmark(analyze)
+
+
+@pytest.mark.parametrize("n_supports", [10, 1_000])
+@pytest.mark.parametrize("n_loads", LOAD_COUNTS)
+def test_solver_reactions(benchmark, n_loads, n_supports):
+    beam = make_beam(n_supports)
+    loads = make_loads(n_loads)
+    benchmark(
+        lambda: MatrixBeamSolver(beam, loads).solve_reactions(),
+        repeat=1 if n_loads >= 100_000 else 3,
+    )
+
+
+@pytest.mark.parametrize("n_supports", [2, 1_000])
+def test_engine_load_edits(benchmark, n_supports):
+    engine = AnalysisEngine(make_beam(n_supports))
+    engine.add_loads(make_loads(100_000))
+    engine.calculate_reactions()
+    engine.get_diagrams()
+    stations = np.linspace(0.0, LENGTH, 200)
+
+    def edit():
+        engine.add_load(PointLoad(force=5.0, location=42.0))
+        engine.moment_at(stations)
+        engine.remove_load(-1)
+        engine.moment_at(stations)
+
+    benchmark(edit)
+
+
+
+@pytest.mark.parametrize("n_loads", LOAD_COUNTS)
+def test_engine_edits_by_value(benchmark, n_loads):
+    loads = make_loads(n_loads)
+    engine = AnalysisEngine(make_beam(2))
+    engine.add_loads(loads)
+    engine.get_diagrams()
+    engine.remove_load(loads[0])  # Builds the value index
+    stations = np.linspace(0.0, LENGTH, 200)
+    edited = loads[n_loads // 2 :: max(n_loads // 16, 1)][:16]
+    moved = PointLoad(force=5.0, location=42.0)
+
+    def edit():
+        # 64 edits, so the diagram rebuilds after pending edits are included
+        for load in edited:
+            engine.update_load(load, moved)
+            engine.moment_at(stations)
+            engine.update_load(moved, load)
+            engine.moment_at(stations)
+            engine.remove_load(load)
+            engine.moment_at(stations)
+            engine.add_load(load)
+            engine.moment_at(stations)
+
+    benchmark(edit)
+
+@pytest.mark.parametrize("resolution", RESOLUTIONS)
+def test_engine_sampling(benchmark, resolution):
+    engine = AnalysisEngine(make_beam(10))
+    for load in make_loads(1_000):
+        engine.add_load(load)
+    engine.get_diagrams()
+    xs = np.linspace(0.0, LENGTH, resolution)
+    benchmark(lambda: (engine.shear_at(xs), engine.moment_at(xs)))
+
+
+@pytest.mark.parametrize("resolution", RESOLUTIONS)
+def test_plotter(benchmark, resolution):
+    xs = np.linspace(0.0, LENGTH, resolution)
+    ys = np.sin(xs / 7.0) * 100.0
+    plotter = ASCIIPlotter(width=120, height=20)
+    benchmark(lambda: plotter.plot(xs, ys, title="Benchmark"))
@@ -0,0 +1,114 @@
+import json
+import pytest
+from typer.testing import CliRunner
+from beam_analysis.batch import run_batch
+from beam_analysis.cli import app
+from beam_analysis.model_io import model_from_dict, model_to_dict, read_models
+
+runner = CliRunner()
+
+MODEL = {
+    "id": "B1",
+    "length": 10.0,
+    "supports": [
+        {"location": 0.0, "type": "PINNED"}, {"location": 10.0, "type": "ROLLER"}
+    ],
+    "loads": [{"type": "point", "force": 10.0, "location": 5.0}],
+}
+
+CSV_TEXT = """model,kind,length,location,type,force,magnitude,start,end,moment
+B1,beam,10,,,,,,,
+B1,support,,0,PINNED,,,,,
+B1,support,,10,ROLLER,,,,,
+B1,udl,,,,,5,0,10,
+B2,beam,5,,,,,,,
+B2,support,,0,FIXED,,,,,
+B2,point,,5,,10,,,,
+"""
+
+
+def test_model_round_trip():
+    beam, loads = model_from_dict(MODEL)
+    assert model_to_dict(beam, loads, "B1") == MODEL
+
+
+def test_invalid_model():
+    with pytest.raises(ValueError, match="Invalid model"):
+        model_from_dict({"length": 10.0})
+
+
+def test_read_csv_groups_rows(tmp_path):
+    path = tmp_path / "models.csv"
+    path.write_text(CSV_TEXT)
+    models = list(read_models(path))
+    assert [m["id"] for m in models] == ["B1", "B2"]
+    beam, loads = model_from_dict(models[1])
+    assert beam.supports[0].type.name == "FIXED"
+    assert loads[0].force == 10.0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_batch(workers):
+    bad = {"length": -1.0, "supports": []}
+    models = [dict(MODEL, id=f"B{i}") for i in range(5)] + [bad]
+    results = list(run_batch(models, workers=workers, chunk_size=2))
+
+    assert sorted(str(r["id"]) for r in results) == ["5", "B0", "B1", "B2", "B3", "B4"]
+    ok = [r for r in results if "error" not in r]
+    assert len(ok) == 5
+    assert ok[0]["max_moment"]["value"] == pytest.approx(25.0)
+    assert [r for r in results if "error" in r][0]["id"] == 5
+
+
+def test_batch_reports_rows_that_are_not_objects(tmp_path):
+    models = tmp_path / "models.jsonl"
+    models.write_text(
+        json.dumps(MODEL) + "\n[1, 2]\n" + json.dumps(dict(MODEL, id="B2"))
+    )
+    output = tmp_path / "results.jsonl"
+
+    result = runner.invoke(app, ["batch", str(models), "-o", str(output), "-w", "1"])
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["id"] for line in lines] == ["B1", None, "B2"]
+    assert "Invalid model" in lines[1]["error"]
+    assert "reactions" in lines[2]
+
+
+def test_batch_reports_unreadable_and_unsolvable_models(tmp_path):
+    coincident = dict(MODEL, id="C", supports=[
+        {"location": 3.0, "type": "PINNED"}, {"location": 3.0, "type": "ROLLER"},
+    ])
+    models = tmp_path / "models.jsonl"
+    rows = [json.dumps(MODEL), json.dumps(coincident), "{not json"]
+    models.write_text("\n".join(rows + [json.dumps(dict(MODEL, id="B2"))]))
+    output = tmp_path / "results.jsonl"
+
+    result = runner.invoke(app, ["batch", str(models), "-o", str(output), "-w", "1"])
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["id"] for line in lines] == ["B1", "C", 2, "B2"]
+    assert lines[1]["error"] == "Supports coincide."
+    assert "line 3" in lines[2]["error"]
+    assert "reactions" in lines[3]
+
+
+def test_read_csv_reports_unknown_rows(tmp_path):
+    path = tmp_path / "models.csv"
+    path.write_text(CSV_TEXT.replace("B1,udl", "B1,wind"))
+    results = list(run_batch(read_models(path)))
+    assert [r["id"] for r in results] == ["B1", "B2"]
+    assert "Unknown row kind in B1" in results[0]["error"]
+    assert "reactions" in results[1]
+
+
+def test_batch_command(tmp_path):
+    models = tmp_path / "models.jsonl"
+    models.write_text("\n".join(json.dumps(dict(MODEL, id=i)) for i in range(3)))
+    output = tmp_path / "results.jsonl"
+
+    result = runner.invoke(app, ["batch", str(models), "-o", str(output), "-w", "1"])
+    assert result.exit_code == 0
+    lines = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [line["id"] for line in lines] == [0, 1, 2]
+    assert lines[0]["reactions"][0]["fy"] == pytest.approx(5.0)
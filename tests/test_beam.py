@@ -32,3 +32,16 @@ def test_beam_support_out_of_bounds_excessive():
 def test_beam_representation():
     beam = Beam(length=5.0, supports=[Support(0.0, SupportType.PINNED), Support(5.0, SupportType.ROLLER)])
     assert str(beam) == "Beam(length=5.0 m, supports=[PINNED at 0.0m, ROLLER at 5.0m])"
+
+
+def test_beam_stiffness():
+    beam = Beam(length=5.0, supports=[Support(0.0)], E=200e6, I=8e-5)
+    assert beam.EI == pytest.approx(16000.0)
+    assert Beam(length=5.0, supports=[Support(0.0)]).EI is None
+
+
+def test_beam_invalid_stiffness():
+    with pytest.raises(ValueError, match="Modulus of elasticity must be positive"):
+        Beam(length=5.0, supports=[Support(0.0)], E=0.0, I=8e-5)
+    with pytest.raises(ValueError, match="Second moment of area must be positive"):
+        Beam(length=5.0, supports=[Support(0.0)], E=200e6, I=-1.0)
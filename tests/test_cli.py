@@ -1,9 +1,71 @@
+import json
+import subprocess
+import sys
+import pytest
 from typer.testing import CliRunner
 from beam_analysis.cli import app
 
 runner = CliRunner()
 
+# Importing the CLI (typer included) must stay well below the ~0.4 s it took
+# when numpy, rich and inquirer were imported at module level.
+IMPORT_BUDGET_S = 0.25
+
 
 def test_cli_help():
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
+
+
+def test_cli_analyze_json():
+    result = runner.invoke(
+        app, ["analyze", "-l", "10", "-s", "0:pinned", "-s", "10:roller",
+              "-p", "10@5", "-u", "2", "--json"]
+    )
+    assert result.exit_code == 0
+    data = json.loads(result.output)
+    assert [r["fy"] for r in data["reactions"]] == pytest.approx([15.0, 15.0])
+    assert data["max_moment"]["value"] == pytest.approx(50.0)
+
+
+def test_cli_analyze_tables():
+    result = runner.invoke(
+        app, ["analyze", "--length", "10", "--support", "0:fixed",
+              "--udl", "5@0:4", "--moment", "10@8"]
+    )
+    assert result.exit_code == 0
+    assert "Mesnet Reaksiyonları" in result.output
+    assert "20.00" in result.output  # fixed end reaction of the 5 kN/m x 4 m UDL
+
+
+def test_cli_analyze_invalid_input():
+    result = runner.invoke(app, ["analyze", "-l", "10", "-s", "0:hinge"])
+    assert result.exit_code != 0
+    result = runner.invoke(app, ["analyze", "-l", "10", "-s", "0:pinned", "-p", "10@5"])
+    assert result.exit_code == 1
+    assert "Single support must be FIXED" in result.output
+
+
+def test_cli_import_is_lazy():
+    # Heavy dependencies must not be imported until a command needs them
+    code = (
+        "import sys, beam_analysis.cli; "
+        "print(','.join(m for m in ('numpy', 'scipy', 'inquirer', 'rich.console') "
+        "if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_cli_import_time_budget():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import beam_analysis.cli"],
+        capture_output=True, text=True, check=True,
+    )
+    # Last line: "import time: self | cumulative | beam_analysis.cli" in microseconds
+    rows = result.stderr.splitlines()
+    line = [row for row in rows if row.endswith("beam_analysis.cli")][-1]
+    cumulative_us = int(line.split("|")[1])
+    assert cumulative_us < IMPORT_BUDGET_S * 1e6
@@ -0,0 +1,70 @@
+import pytest
+from beam_analysis.beam import Beam, Support
+from beam_analysis.combinations import LoadCombination, analyze_combinations
+from beam_analysis.loads import PointLoad, UDL
+
+
+def _simple_beam():
+    return Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+
+
+def test_parse_expression():
+    combination = LoadCombination.from_expression("ULS", "1.4G + 1.6Q - 0.5 W")
+    assert combination.factors == {"G": 1.4, "Q": 1.6, "W": -0.5}
+
+
+def test_parse_invalid_expression():
+    with pytest.raises(ValueError, match="Invalid combination"):
+        LoadCombination.from_expression("ULS", "1.4G + * Q")
+
+
+def test_alternative_factors_expand():
+    combination = LoadCombination("ULS", {"G": (1.0, 1.35), "Q": (0.0, 1.5)})
+    names = [name for name, _ in combination.expand()]
+    assert names == [
+        "ULS (1G+0Q)",
+        "ULS (1G+1.5Q)",
+        "ULS (1.35G+0Q)",
+        "ULS (1.35G+1.5Q)",
+    ]
+
+
+def test_envelope_superposes_cases():
+    cases = {
+        "G": [UDL(magnitude=5.0)],
+        "Q": [PointLoad(force=10.0, location=5.0)],
+    }
+    combinations = [
+        LoadCombination.from_expression("ULS", "1.4G + 1.6Q"),
+        LoadCombination.from_expression("SLS", "G + Q"),
+    ]
+    env = analyze_combinations(_simple_beam(), cases, combinations, stations=11)
+
+    # M(5) = 1.4 * 62.5 + 1.6 * 25 = 127.5 under ULS
+    mid = 5
+    assert env.moment.maximum[mid] == pytest.approx(127.5)
+    assert env.governing(env.moment.max_governing[mid]) == ["ULS"]
+    assert env.moment.minimum[mid] == pytest.approx(87.5)
+    assert env.governing(env.moment.min_governing[mid]) == ["SLS"]
+
+    # Ra = 1.4 * 25 + 1.6 * 5
+    assert env.reactions.maximum[0, 0] == pytest.approx(43.0)
+
+
+def test_envelope_with_favourable_factors():
+    cases = {"G": [UDL(magnitude=5.0)], "Q": [UDL(magnitude=-2.0, start=0.0, end=5.0)]}
+    combination = LoadCombination("ULS", {"G": (1.0, 1.35), "Q": (0.0, 1.5)})
+    env = analyze_combinations(_simple_beam(), cases, [combination], stations=11)
+    assert len(env.combinations) == 4
+    # Largest Ra: 1.35G with Q left out
+    assert env.reactions.maximum[0, 0] == pytest.approx(1.35 * 25.0)
+    assert env.governing(env.reactions.max_governing[0, 0]) == ["ULS (1.35G+0Q)"]
+
+
+def test_unknown_case_in_combination():
+    with pytest.raises(KeyError, match="Unknown load case"):
+        analyze_combinations(
+            _simple_beam(),
+            {"G": [UDL(magnitude=5.0)]},
+            [LoadCombination.from_expression("ULS", "1.4G + 1.6Q")],
+        )
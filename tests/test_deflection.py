@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, UDL
+
+E = 200e6  # kN/m2
+INERTIA = 8e-5  # m4
+EI = E * INERTIA
+
+
+def test_simply_supported_udl_deflection():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=E, I=INERTIA)
+    engine = AnalysisEngine(beam)
+    engine.add_load(UDL(magnitude=5.0))
+
+    value, location = engine.get_max_deflection_info()
+    assert value == pytest.approx(5 * 5.0 * 10.0**4 / (384 * EI))
+    assert location == pytest.approx(5.0)
+    # End rotations are wL^3/24EI, clockwise at the left support
+    assert engine.rotation_at([0.0, 10.0]) == pytest.approx(
+        [5.0 * 1000.0 / (24 * EI), -5.0 * 1000.0 / (24 * EI)]
+    )
+
+
+def test_cantilever_tip_deflection_and_rotation():
+    beam = Beam(4.0, [Support(0.0, SupportType.FIXED)], E=E, I=INERTIA)
+    engine = AnalysisEngine(beam)
+    engine.add_load(PointLoad(force=10.0, location=4.0))
+
+    tip = 10.0 * 64.0 / (3 * EI)
+    assert engine.deflection_at([0.0, 4.0]) == pytest.approx([0.0, tip])
+    assert engine.rotation_at(4.0) == pytest.approx(10.0 * 16.0 / (2 * EI))
+    nodes = engine.get_nodal_displacements()
+    assert nodes[4.0]['v'] == pytest.approx(tip)
+    assert nodes[0.0]['theta'] == pytest.approx(0.0, abs=1e-12)
+
+
+def test_point_load_between_nodes():
+    # Simply supported, P at a = 3 of L = 10: deflection under the load is Pa²b²/3EIL
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=E, I=INERTIA)
+    engine = AnalysisEngine(beam)
+    engine.add_load(PointLoad(force=20.0, location=3.0))
+    expected = 20.0 * 9.0 * 49.0 / (3 * EI * 10.0)
+    assert engine.deflection_at(3.0) == pytest.approx(expected)
+
+
+def test_continuous_beam_reuses_reaction_solve():
+    supports = [Support(0.0, SupportType.PINNED), Support(5.0), Support(10.0)]
+    engine = AnalysisEngine(Beam(10.0, supports, E=E, I=INERTIA))
+    engine.add_load(UDL(magnitude=10.0))
+
+    engine.calculate_reactions()
+    deflections = engine.deflection_at(np.linspace(0.0, 10.0, 101))
+    assert engine.solve_count == 1
+    assert deflections[[0, 50, 100]] == pytest.approx([0.0, 0.0, 0.0], abs=1e-12)
+    # Each span behaves like a propped cantilever: max wL^4/185EI
+    value, _ = engine.get_max_deflection_info()
+    assert value == pytest.approx(10.0 * 5.0**4 / (184.6 * EI), rel=1e-3)
+
+
+def test_deflection_requires_stiffness():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    engine = AnalysisEngine(beam)
+    with pytest.raises(ValueError, match="E and I must be set"):
+        engine.deflection_at(5.0)
@@ -0,0 +1,157 @@
+import json
+import numpy as np
+import pytest
+from typer.testing import CliRunner
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.cli import app
+from beam_analysis.design import (
+    DesignCriteria, DesignDemand, SectionCatalog, select_sections, utilizations
+)
+from beam_analysis.loads import UDL
+
+runner = CliRunner()
+
+# IPE sections: mass (kg/m), W_el,y (cm^3), A_v,z (cm^2), I_y (cm^4)
+CATALOG_CSV = """name,mass,W,Av,I
+IPE 300,42.2,557,25.7,8356
+IPE 200,22.4,194,14.0,1943
+IPE 400,66.3,1156,42.7,23130
+IPE 240,30.7,324,19.1,3892
+"""
+
+
+@pytest.fixture
+def catalog(tmp_path):
+    path = tmp_path / "ipe.csv"
+    path.write_text(CATALOG_CSV)
+    return SectionCatalog.read(path)
+
+
+def simple_beam(length=6.0):
+    return Beam(length, [Support(0.0, SupportType.PINNED), Support(length)])
+
+
+def test_demand_of_simply_supported_udl():
+    demand = DesignDemand.from_models([(simple_beam(), [UDL(magnitude=10.0)])])
+    assert demand.moment[0] == pytest.approx(10.0 * 36.0 / 8.0)
+    assert demand.shear[0] == pytest.approx(30.0)
+    assert demand.flexibility[0] == pytest.approx(5.0 * 10.0 * 6.0**4 / 384.0)
+
+
+def test_utilizations(catalog):
+    demand = DesignDemand(
+        moment=np.array([45.0]), shear=np.array([30.0]),
+        length=np.array([6.0]), flexibility=np.array([5.0 * 10.0 * 6.0**4 / 384.0]),
+    )
+    util = utilizations(demand, catalog, DesignCriteria())
+    assert util.shape == (1, 4, 3)
+    # IPE 300: 45 kNm / (557 cm^3 * 235 MPa)
+    assert util[0, 0, 0] == pytest.approx(45.0 / (557e-6 * 235e3))
+    assert util[0, 0, 1] == pytest.approx(30.0 / (25.7e-4 * 235e3 / np.sqrt(3.0)))
+    deflection = demand.flexibility[0] / (2.1e8 * 8356e-8)
+    assert util[0, 0, 2] == pytest.approx(deflection / (6.0 / 250.0))
+
+
+def test_select_lightest_passing_section(catalog):
+    demand = DesignDemand.from_models([
+        (simple_beam(), [UDL(magnitude=10.0)]),
+        (simple_beam(), [UDL(magnitude=20.0)]),
+        (simple_beam(), [UDL(magnitude=1000.0)]),
+    ])
+    result = select_sections(demand, catalog, chunk_size=2)
+    # 10 kN/m is governed by deflection (IPE 200 fails L/250), 20 kN/m as well
+    assert result.names == ["IPE 240", "IPE 300", None]
+    assert result.section.tolist() == [3, 0, -1]
+    assert np.all(result.utilization[:2] <= 1.0)
+    assert np.isnan(result.utilization[2]).all()
+
+    # The next lighter section fails one check
+    full = utilizations(demand, catalog)
+    assert full[0, 1].max() > 1.0
+    assert full[1, 3].max() > 1.0
+
+
+def test_invalid_catalog(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("name,mass,W\nIPE 100,8.1,34.2\n")
+    with pytest.raises(ValueError, match="missing column"):
+        SectionCatalog.read(path)
+    with pytest.raises(ValueError, match="must be positive"):
+        SectionCatalog(["X"], [1.0], [0.0], [1.0], [1.0])
+
+
+def test_cli_batch_design(tmp_path):
+    catalog_path = tmp_path / "ipe.csv"
+    catalog_path.write_text(CATALOG_CSV)
+    models = tmp_path / "models.jsonl"
+    model = {
+        "length": 6.0,
+        "supports": [
+            {"location": 0.0, "type": "PINNED"}, {"location": 6.0, "type": "ROLLER"}
+        ],
+        "loads": [{"type": "udl", "magnitude": 10.0}],
+    }
+    invalid = {"length": -1, "supports": []}
+    models.write_text(json.dumps(model) + "\n" + json.dumps(invalid) + "\n")
+    result = runner.invoke(
+        app, ["batch", str(models), "--workers", "1", "--catalog", str(catalog_path)]
+    )
+    assert result.exit_code == 0
+    good, bad = (json.loads(line) for line in result.output.splitlines())
+    assert good["design"]["section"] == "IPE 240"
+    assert set(good["design"]["utilization"]) == {"bending", "shear", "deflection"}
+    assert "design" not in bad
+
+
+def test_run_batch_design_in_workers(catalog):
+    from beam_analysis.batch import run_batch
+
+    model = {
+        "length": 6.0,
+        "supports": [
+            {"location": 0.0, "type": "PINNED"}, {"location": 6.0, "type": "ROLLER"}
+        ],
+        "loads": [{"type": "udl", "magnitude": 20.0}],
+    }
+    results = list(run_batch([model] * 5, workers=2, chunk_size=2, catalog=catalog))
+    assert [r["design"]["section"] for r in results] == ["IPE 300"] * 5
+
+
+def test_design_reuses_the_batch_analyses(catalog, monkeypatch):
+    from beam_analysis.batch import run_batch
+    from beam_analysis.engine import AnalysisEngine
+
+    created = []
+    init = AnalysisEngine.__init__
+
+    def counting_init(self, beam):
+        created.append(beam)
+        init(self, beam)
+
+    monkeypatch.setattr(AnalysisEngine, "__init__", counting_init)
+    model = {
+        "length": 6.0,
+        "supports": [
+            {"location": 0.0, "type": "PINNED"}, {"location": 6.0, "type": "ROLLER"}
+        ],
+        "loads": [{"type": "udl", "magnitude": 20.0}],
+    }
+    results = list(run_batch([model] * 5, workers=1, chunk_size=2, catalog=catalog))
+    assert [r["design"]["section"] for r in results] == ["IPE 300"] * 5
+    assert len(created) == 1  # Duplicates and the design pass hit the cache
+
+
+def test_demand_deflection_of_an_indeterminate_beam():
+    from beam_analysis.engine import AnalysisEngine
+    from beam_analysis.loads import PointLoad
+
+    supports = [Support(0.0, SupportType.FIXED), Support(4.0), Support(10.0)]
+    loads = [
+        UDL(magnitude=3.0, start=1.0, end=7.0), PointLoad(force=12.0, location=8.5)
+    ]
+    demand = DesignDemand.from_models([(Beam(10.0, supports), loads)])
+
+    engine = AnalysisEngine(Beam(10.0, supports, E=1.0, I=1.0))
+    engine.add_loads(loads)
+    max_w = abs(engine.get_max_deflection_info()[0])
+    assert demand.flexibility[0] == pytest.approx(max_w)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support
+from beam_analysis.diagram import PiecewisePolynomial
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, UDL, PointMoment
+
+
+def test_piecewise_polynomial_right_continuous():
+    # V = 5 on [0, 5), -5 on [5, 10), 0 at the end
+    diagram = PiecewisePolynomial(
+        np.array([0.0, 5.0, 10.0]), np.array([[5.0], [-5.0], [0.0]])
+    )
+    assert diagram(np.array([0.0, 4.999, 5.0, 10.0])) == pytest.approx(
+        [5.0, 5.0, -5.0, 0.0]
+    )
+    assert diagram.left_limits() == pytest.approx([0.0, 5.0, -5.0])
+
+
+def test_max_shear_is_exact_at_point_load():
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(PointLoad(force=10.0, location=2.0))
+
+    # Ra = 8, V just left of the load is 8 over [0, 2)
+    max_v, x_v = engine.get_max_shear_info()
+    assert max_v == pytest.approx(8.0)
+    assert x_v == pytest.approx(0.0)
+
+    max_m, x_m = engine.get_max_moment_info()
+    assert max_m == pytest.approx(16.0)
+    assert x_m == pytest.approx(2.0)
+
+
+def test_max_moment_at_shear_zero_crossing():
+    # Partial UDL from 0 to 5 on a 10m span: Ra = 37.5, V = 0 at x = 3.75
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(UDL(magnitude=10.0, start=0.0, end=5.0))
+
+    max_m, x_m = engine.get_max_moment_info()
+    assert x_m == pytest.approx(3.75)
+    assert max_m == pytest.approx(37.5 * 3.75 - 10.0 * 3.75**2 / 2.0)
+
+
+def test_max_moment_uses_both_sides_of_point_moment():
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(PointMoment(moment=-10.0, location=5.0))
+
+    # M = x on the left (left limit 5 at x = 5), M = x - 10 on the right
+    max_m, x_m = engine.get_max_moment_info()
+    assert abs(max_m) == pytest.approx(5.0)
+    assert x_m == pytest.approx(5.0)
+
+
+def test_diagrams_are_compiled_once():
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(UDL(magnitude=5.0))
+    assert engine.get_diagrams() is engine.get_diagrams()
+
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    assert engine.get_bending_moment(5.0) == pytest.approx(87.5)
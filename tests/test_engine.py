@@ -1,5 +1,5 @@
 import pytest
-from beam_analysis.beam import Beam, Support
+from beam_analysis.beam import Beam, Support, SupportType
 from beam_analysis.engine import AnalysisEngine
 
 
@@ -201,3 +201,185 @@ def test_calculate_reactions_udl_partial():
     # Check shear force at x=7.5 (after load)
     # V = Ra - TotalLoad = 37.5 - 50 = -12.5
     assert engine.get_shear_force(7.5) == pytest.approx(-12.5)
+
+
+def test_reactions_are_cached_until_loads_change():
+    from beam_analysis.loads import PointLoad
+
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    assert engine.solve_count == 0
+
+    engine.calculate_reactions()
+    engine.get_shear_force(2.5)
+    engine.get_bending_moment(2.5)
+    engine.get_max_shear_info()
+    engine.get_max_moment_info()
+    assert engine.solve_count == 1
+
+    # Adding a load updates the cached reactions without a new solve
+    engine.add_load(PointLoad(force=10.0, location=2.5))
+    reactions = engine.calculate_reactions()
+    assert engine.solve_count == 1
+    assert reactions[0.0]['fy'] == pytest.approx(12.5)
+
+
+def test_cached_reactions_are_not_exposed_for_mutation():
+    from beam_analysis.loads import PointLoad
+
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    engine.calculate_reactions()[0.0]['fy'] = 100.0
+    assert engine.calculate_reactions()[0.0]['fy'] == pytest.approx(5.0)
+
+
+def test_invalidate_after_support_change():
+    from beam_analysis.loads import PointLoad
+
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    engine.calculate_reactions()
+
+    beam.supports[1] = Support(5.0)
+    engine.invalidate()
+    reactions = engine.calculate_reactions()
+    assert reactions[5.0]['fy'] == pytest.approx(10.0)
+    assert engine.solve_count == 2
+
+
+def test_shear_and_moment_at_arrays():
+    import numpy as np
+    from beam_analysis.loads import PointLoad, UDL, PointMoment
+
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    engine.add_load(UDL(magnitude=5.0))
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    engine.add_load(PointMoment(moment=10.0, location=7.5))
+
+    xs = np.array([0.0, 2.5, 5.0, 7.5, 10.0])
+    v = engine.shear_at(xs)
+    m = engine.moment_at(xs)
+    assert v.shape == xs.shape
+    # Ra = 25 + 5 - 1 = 29
+    assert v == pytest.approx([29.0, 16.5, -6.0, -18.5, 0.0])
+    assert m == pytest.approx([0.0, 56.875, 82.5, 61.875, 0.0])
+
+
+def test_shear_at_rejects_positions_outside_beam():
+    import numpy as np
+
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    engine = AnalysisEngine(beam=beam)
+    with pytest.raises(ValueError, match="within the beam limits"):
+        engine.shear_at(np.array([0.0, 10.5]))
+
+
+@pytest.mark.parametrize("supports", [
+    [Support(0.0), Support(10.0)],
+    [Support(0.0, SupportType.FIXED)],
+    [Support(0.0, SupportType.PINNED), Support(4.0), Support(10.0, SupportType.FIXED)],
+])
+def test_incremental_load_edits_match_full_analysis(supports):
+    import numpy as np
+    from beam_analysis.loads import PointLoad, UDL, PointMoment
+
+    engine = AnalysisEngine(Beam(length=10.0, supports=supports))
+    engine.add_load(UDL(magnitude=2.0, start=1.0, end=6.0))
+    engine.add_load(PointLoad(force=10.0, location=3.0))
+    engine.calculate_reactions()
+    engine.get_max_moment_info()
+
+    engine.add_load(PointMoment(moment=5.0, location=7.0))
+    assert engine.remove_load(0) == UDL(magnitude=2.0, start=1.0, end=6.0)
+    engine.update_load(
+        PointLoad(force=10.0, location=3.0), PointLoad(force=4.0, location=8.5)
+    )
+    engine.update_load(-1, UDL(magnitude=1.0, start=2.0))
+    assert engine.solve_count == 1
+
+    reference = AnalysisEngine(Beam(length=10.0, supports=supports))
+    reference.add_loads(engine.loads)
+    assert engine.loads == [
+        PointLoad(force=4.0, location=8.5), UDL(magnitude=1.0, start=2.0)
+    ]
+
+    reactions = engine.calculate_reactions()
+    expected = reference.calculate_reactions()
+    for location in expected:
+        for key in ('fy', 'm'):
+            assert reactions[location][key] == pytest.approx(
+                expected[location][key], abs=1e-9
+            )
+    xs = np.linspace(0.0, 10.0, 41)
+    np.testing.assert_allclose(engine.shear_at(xs), reference.shear_at(xs), atol=1e-9)
+    np.testing.assert_allclose(engine.moment_at(xs), reference.moment_at(xs), atol=1e-9)
+    expected_max = reference.get_max_moment_info()
+    assert engine.get_max_moment_info() == pytest.approx(expected_max)
+    assert engine.solve_count == 1
+
+
+def test_remove_unknown_load():
+    from beam_analysis.loads import PointLoad
+
+    engine = AnalysisEngine(Beam(length=10.0, supports=[Support(0.0), Support(10.0)]))
+    engine.add_load(PointLoad(force=10.0, location=5.0))
+    with pytest.raises(ValueError, match="Load not found"):
+        engine.remove_load(PointLoad(force=1.0, location=5.0))
+    with pytest.raises(IndexError):
+        engine.remove_load(3)
+
+
+def test_triangular_load_on_simple_beam():
+    from beam_analysis.loads import TrapezoidalLoad
+
+    # Triangular load 0 -> q: R = qL/6 and qL/3,
+    # M_max = qL^2 / (9 sqrt(3)) at L / sqrt(3)
+    beam = Beam(
+        length=10.0, supports=[Support(0.0, SupportType.PINNED), Support(10.0)],
+        E=2.0e8, I=1.0e-4,
+    )
+    engine = AnalysisEngine(beam)
+    engine.add_load(TrapezoidalLoad(start_magnitude=0.0, end_magnitude=6.0))
+
+    reactions = engine.calculate_reactions()
+    assert reactions[0.0]['fy'] == pytest.approx(10.0)
+    assert reactions[10.0]['fy'] == pytest.approx(20.0)
+    max_m, x_m = engine.get_max_moment_info()
+    assert max_m == pytest.approx(6.0 * 100.0 / (9 * 3**0.5))
+    assert x_m == pytest.approx(10.0 / 3**0.5)
+    # w_max = 0.00652 qL^4 / EI
+    max_w = engine.get_max_deflection_info()[0]
+    assert max_w == pytest.approx(0.00652 * 6.0e4 / 2.0e4, rel=1e-3)
+
+
+@pytest.mark.parametrize("supports", [
+    [Support(0.0, SupportType.PINNED), Support(10.0)],
+    [Support(0.0, SupportType.FIXED), Support(4.0), Support(10.0)],
+])
+def test_sampled_profile_matches_trapezoidal_load(supports):
+    import numpy as np
+    from beam_analysis.loads import TabulatedLoad, TrapezoidalLoad, UDL
+
+    beam = Beam(length=10.0, supports=supports, E=2.0e8, I=1.0e-4)
+    x = np.linspace(1.0, 9.0, 100_001)
+    sampled, exact = AnalysisEngine(beam), AnalysisEngine(beam)
+    sampled.add_loads([TabulatedLoad(x, 2.0 + 0.75 * (x - 1.0)), UDL(magnitude=1.0)])
+    exact.add_loads([TrapezoidalLoad(2.0, 8.0, start=1.0, end=9.0), UDL(magnitude=1.0)])
+
+    reactions, expected = sampled.calculate_reactions(), exact.calculate_reactions()
+    for location in expected:
+        for key in ('fy', 'm'):
+            assert reactions[location][key] == pytest.approx(
+                expected[location][key], abs=1e-9
+            )
+    xs = np.linspace(0.0, 10.0, 101)
+    np.testing.assert_allclose(sampled.shear_at(xs), exact.shear_at(xs), atol=1e-9)
+    np.testing.assert_allclose(sampled.moment_at(xs), exact.moment_at(xs), atol=1e-9)
+    np.testing.assert_allclose(
+        sampled.deflection_at(xs), exact.deflection_at(xs), atol=1e-12
+    )
+    assert sampled.get_max_moment_info() == pytest.approx(exact.get_max_moment_info())
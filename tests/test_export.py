@@ -0,0 +1,71 @@
+import tracemalloc
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, UDL
+
+
+def make_engine():
+    beam = Beam(
+        10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=2.0e8, I=8.0e-5
+    )
+    engine = AnalysisEngine(beam)
+    engine.add_load(UDL(magnitude=5.0, start=2.0, end=7.0))
+    engine.add_load(PointLoad(force=10.0, location=4.0))
+    return engine
+
+
+def test_chunks_match_sampled_diagrams():
+    engine = make_engine()
+    chunks = list(engine.iter_diagrams(1001, chunk_size=300, deflection=True))
+    assert [len(chunk[0]) for chunk in chunks] == [300, 300, 300, 101]
+
+    x, v, m, w = (np.concatenate(column) for column in zip(*chunks))
+    expected = np.linspace(0.0, 10.0, 1001)
+    np.testing.assert_allclose(x, expected, atol=1e-12)
+    assert x[-1] == 10.0
+    np.testing.assert_allclose(v, engine.shear_at(expected))
+    np.testing.assert_allclose(m, engine.moment_at(expected))
+    np.testing.assert_allclose(w, engine.deflection_at(expected))
+
+
+@pytest.mark.parametrize("suffix", [".npy", ".csv"])
+def test_export_diagrams(tmp_path, suffix):
+    engine = make_engine()
+    path = tmp_path / f"diyagram{suffix}"
+    assert engine.export_diagrams(path, 501, chunk_size=64) == 501
+
+    if suffix == ".npy":
+        data = np.load(path)
+    else:
+        assert path.read_text().splitlines()[0] == "x,V,M"
+        data = np.loadtxt(path, delimiter=",", skiprows=1)
+    xs = np.linspace(0.0, 10.0, 501)
+    assert data.shape == (501, 3)
+    np.testing.assert_allclose(data[:, 1], engine.shear_at(xs), atol=1e-9)
+    np.testing.assert_allclose(data[:, 2], engine.moment_at(xs), atol=1e-9)
+
+
+def test_streaming_memory_does_not_grow_with_stations(tmp_path):
+    engine = make_engine()
+    engine.get_diagrams()
+
+    def peak(stations):
+        tracemalloc.start()
+        engine.export_diagrams(tmp_path / "diyagram.npy", stations, chunk_size=10_000)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak_bytes
+
+    small, large = peak(20_000), peak(2_000_000)
+    assert large < 2 * small + 256 * 1024
+    assert (tmp_path / "diyagram.npy").stat().st_size > 2_000_000 * 3 * 8
+
+
+def test_invalid_export(tmp_path):
+    engine = make_engine()
+    with pytest.raises(ValueError, match="Unsupported diagram file"):
+        engine.export_diagrams(tmp_path / "diyagram.txt", 10)
+    with pytest.raises(ValueError, match="At least 2 stations"):
+        list(engine.iter_diagrams(1))
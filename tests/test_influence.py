@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.influence import AxleTrain, InfluenceLines, moving_load
+from beam_analysis.loads import PointLoad
+
+
+def _continuous_beam():
+    return Beam(
+        length=30.0,
+        supports=[
+            Support(0.0, SupportType.PINNED),
+            Support(12.0, SupportType.ROLLER),
+            Support(30.0, SupportType.FIXED),
+        ],
+    )
+
+
+def test_influence_lines_match_static_unit_loads():
+    beam = _continuous_beam()
+    influence = InfluenceLines(beam, resolution=31)
+    sections = [6.0, 12.0, 20.5]
+    shear = influence.shear(sections)
+    moment = influence.moment(sections)
+
+    for i in (0, 7, 12, 19, 30):
+        engine = AnalysisEngine(beam)
+        engine.add_load(PointLoad(force=1.0, location=float(influence.positions[i])))
+        reactions = engine.calculate_reactions()
+        for j, loc in enumerate(influence.support_locations):
+            assert influence.reactions[i, j, 0] == pytest.approx(reactions[loc]['fy'])
+            assert influence.reactions[i, j, 1] == pytest.approx(reactions[loc]['m'])
+        assert shear[i] == pytest.approx(engine.shear_at(np.array(sections)))
+        assert moment[i] == pytest.approx(engine.moment_at(np.array(sections)))
+
+
+def test_single_axle_on_simple_span():
+    beam = Beam(length=10.0, supports=[Support(0.0), Support(10.0)])
+    result = moving_load(
+        InfluenceLines(beam, resolution=101), AxleTrain([100.0]), sections=[5.0]
+    )
+    assert result.moment.maximum[0] == pytest.approx(250.0)
+    assert result.lead_positions[result.moment.max_governing[0]] == pytest.approx(5.0)
+    assert result.reactions.maximum[0, 0] == pytest.approx(100.0)
+
+
+def test_axle_train_matches_engine_at_governing_position():
+    beam = _continuous_beam()
+    train = AxleTrain([50.0, 80.0, 80.0], spacings=[3.0, 1.5])
+    result = moving_load(
+        InfluenceLines(beam, resolution=601), train, sections=[6.0], n_positions=3451
+    )
+
+    lead = result.lead_positions[result.moment.max_governing[0]]
+    engine = AnalysisEngine(beam)
+    for load, offset in zip(train.loads, train.offsets):
+        if 0.0 <= lead - offset <= beam.length:
+            engine.add_load(PointLoad(force=load, location=float(lead - offset)))
+    expected = engine.get_bending_moment(6.0)
+    assert result.moment.maximum[0] == pytest.approx(expected, rel=1e-3)
+
+
+def test_invalid_axle_train():
+    with pytest.raises(ValueError, match="one spacing"):
+        AxleTrain([10.0, 10.0])
+    assert AxleTrain([10.0, 20.0], [4.0]).reversed().loads == [20.0, 10.0]
@@ -0,0 +1,60 @@
+import json
+import numpy as np
+from typer.testing import CliRunner
+from beam_analysis import instrumentation
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.cli import app
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import UDL
+
+
+def continuous_engine():
+    supports = [Support(0.0, SupportType.PINNED), Support(5.0), Support(10.0)]
+    engine = AnalysisEngine(Beam(10.0, supports))
+    engine.add_load(UDL(magnitude=10.0))
+    return engine
+
+
+def test_disabled_by_default_records_nothing():
+    instrumentation.reset()
+    assert not instrumentation.is_enabled()
+    continuous_engine().calculate_reactions()
+    assert instrumentation.report() == {"phases": {}, "counters": {}}
+
+
+def test_profile_records_phases_and_counters():
+    with instrumentation.profile() as report:
+        engine = continuous_engine()
+        engine.calculate_reactions()
+        engine.calculate_reactions()
+        engine.moment_at(np.linspace(0.0, 10.0, 50))
+
+    data = report()
+    assert not instrumentation.is_enabled()
+    assert data["counters"]["engine.solves"] == 1
+    assert data["counters"]["solver.factorizations"] == 1
+    assert data["counters"]["engine.cache_hits"] >= 1
+    assert data["counters"]["engine.points_evaluated"] == 50
+    for name in ("engine.reactions", "solver.assemble_stiffness", "solver.factorize",
+                 "engine.compile_diagrams"):
+        assert data["phases"][name]["calls"] == 1
+        assert data["phases"][name]["seconds"] >= 0.0
+
+
+def test_cli_profile_output(tmp_path):
+    model = tmp_path / "model.json"
+    model.write_text(json.dumps({
+        "length": 10, "supports": [{"location": 0, "type": "PINNED"}, {"location": 10}],
+        "loads": [{"type": "point", "force": 10, "location": 5}],
+    }))
+    output = tmp_path / "profile.json"
+
+    result = CliRunner().invoke(
+        app, ["--profile-output", str(output), "batch", str(model), "--workers", "1"]
+    )
+
+    assert result.exit_code == 0
+    data = json.loads(output.read_text())
+    assert data["counters"]["engine.solves"] == 1
+    assert "engine.reactions" in data["phases"]
+    instrumentation.disable()
@@ -0,0 +1,81 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.load_cases import analyze_load_cases
+from beam_analysis.loads import PointLoad, UDL, PointMoment
+from beam_analysis.solver import MatrixBeamSolver
+
+
+def _continuous_beam():
+    return Beam(
+        length=30.0,
+        supports=[
+            Support(0.0, SupportType.PINNED),
+            Support(10.0, SupportType.ROLLER),
+            Support(20.0, SupportType.ROLLER),
+            Support(30.0, SupportType.ROLLER),
+        ],
+    )
+
+
+def _load_cases():
+    return {
+        "G": [UDL(magnitude=12.0)],
+        "Q": [
+            UDL(magnitude=5.0, start=0.0, end=10.0),
+            PointLoad(force=20.0, location=25.0),
+        ],
+        "W": [PointMoment(moment=15.0, location=12.5)],
+    }
+
+
+@pytest.mark.parametrize(
+    "beam",
+    [
+        _continuous_beam(),
+        Beam(length=30.0, supports=[Support(0.0), Support(30.0)]),
+        Beam(length=30.0, supports=[Support(0.0, SupportType.FIXED)]),
+    ],
+)
+def test_load_cases_match_single_engine_runs(beam):
+    cases = _load_cases()
+    results = analyze_load_cases(beam, cases, stations=61)
+    assert results.shear.shape == (3, 61)
+    assert results.moment.shape == (3, 61)
+
+    for i, (name, loads) in enumerate(cases.items()):
+        engine = AnalysisEngine(beam)
+        for load in loads:
+            engine.add_load(load)
+
+        expected = engine.calculate_reactions()
+        for loc, rx in results.reactions_of(name).items():
+            assert rx['fy'] == pytest.approx(expected[loc]['fy'], abs=1e-9)
+            assert rx['m'] == pytest.approx(expected[loc]['m'], abs=1e-9)
+        assert results.shear[i] == pytest.approx(engine.shear_at(results.stations))
+        assert results.moment[i] == pytest.approx(engine.moment_at(results.stations))
+
+
+def test_load_cases_factorize_once(monkeypatch):
+    calls = []
+    original = MatrixBeamSolver.assemble_stiffness
+
+    def counting(self):
+        calls.append(self)
+        return original(self)
+
+    monkeypatch.setattr(MatrixBeamSolver, "assemble_stiffness", counting)
+    results = analyze_load_cases(_continuous_beam(), _load_cases())
+    assert len(calls) == 1
+    assert results.names == ["G", "Q", "W"]
+    # Reactions of the full UDL case: 0.4wL / 1.1wL
+    assert results.reactions[0, :, 0] == pytest.approx([48.0, 132.0, 132.0, 48.0])
+
+
+def test_unknown_load_case():
+    results = analyze_load_cases(
+        _continuous_beam(), _load_cases(), stations=np.array([5.0])
+    )
+    with pytest.raises(KeyError):
+        results.reactions_of("S")
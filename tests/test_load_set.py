@@ -0,0 +1,189 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.load_set import LoadSet
+from beam_analysis.loads import (
+    PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad
+)
+
+
+def mixed_loads():
+    return [
+        PointLoad(force=10.0, location=2.0),
+        UDL(magnitude=5.0, start=1.0, end=4.0),
+        PointMoment(moment=3.0, location=6.0),
+        UDL(magnitude=2.0),
+        PointLoad(force=-4.0, location=8.0),
+    ]
+
+
+def test_load_set_is_a_sequence_of_loads():
+    loads = mixed_loads()
+    load_set = LoadSet(loads)
+
+    assert len(load_set) == 5
+    assert list(load_set) == loads
+    assert load_set[1] == loads[1]
+    assert load_set[-1] == loads[-1]
+    assert load_set[1:3] == loads[1:3]
+    assert load_set == loads
+    assert LoadSet() == []
+
+
+def test_load_set_arrays():
+    load_set = LoadSet(mixed_loads())
+
+    assert load_set.point_forces == pytest.approx([10.0, -4.0])
+    assert load_set.point_locations == pytest.approx([2.0, 8.0])
+    assert load_set.moment_values == pytest.approx([3.0])
+    assert np.isnan(load_set.udl_ends[1])
+    starts, ends, magnitudes = load_set.udl_extents(10.0)
+    assert ends == pytest.approx([4.0, 10.0])
+    assert magnitudes == pytest.approx([5.0, 2.0])
+
+
+def test_bulk_ingestion_validates_like_the_dataclasses():
+    load_set = LoadSet()
+    with pytest.raises(ValueError, match="Location cannot be negative"):
+        load_set.add_point_loads([1.0, 2.0], [1.0, -1.0])
+    with pytest.raises(ValueError, match="Start location must be less than end"):
+        load_set.add_udls([1.0], [5.0], [4.0])
+    assert len(load_set) == 0
+
+    load_set.add_udls([1.0, 2.0], [0.0, 1.0], [None, 3.0])
+    assert load_set[0] == UDL(magnitude=1.0)
+    assert load_set[1] == UDL(magnitude=2.0, start=1.0, end=3.0)
+
+
+def test_engine_bulk_loads_match_load_objects():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(5.0), Support(10.0)])
+    rng = np.random.default_rng(0)
+    forces, locations = rng.uniform(1.0, 10.0, 500), rng.uniform(0.0, 10.0, 500)
+
+    bulk = AnalysisEngine(beam)
+    load_set = LoadSet()
+    load_set.add_point_loads(forces, locations)
+    bulk.add_loads(load_set)
+
+    single = AnalysisEngine(beam)
+    for force, location in zip(forces, locations):
+        single.add_load(PointLoad(force=force, location=location))
+
+    expected = single.calculate_reactions()
+    for location, rx in bulk.calculate_reactions().items():
+        assert rx['fy'] == pytest.approx(expected[location]['fy'])
+    assert bulk.get_max_moment_info() == pytest.approx(single.get_max_moment_info())
+
+
+def test_read_and_save(tmp_path):
+    csv_path = tmp_path / "loads.csv"
+    csv_path.write_text(
+        "kind,force,magnitude,start,end,moment,location\n"
+        "point,10,,,,,2\n"
+        "udl,,5,1,4,,\n"
+        "udl,,2,,,,\n"
+        "moment,,,,,3,6\n"
+    )
+    load_set = LoadSet.read(csv_path)
+    assert sorted(map(str, load_set)) == sorted(map(str, mixed_loads()[:4]))
+
+    npz_path = tmp_path / "loads.npz"
+    load_set.save(npz_path)
+    restored = LoadSet.read(npz_path)
+    assert restored.udl_magnitudes == pytest.approx(load_set.udl_magnitudes)
+    assert restored.point_forces == pytest.approx(load_set.point_forces)
+
+
+def test_load_dataclasses_use_slots():
+    assert not hasattr(PointLoad(force=1.0, location=0.0), "__dict__")
+    assert not hasattr(UDL(magnitude=1.0), "__dict__")
+
+
+def test_edit_in_place():
+    load_set = LoadSet([
+        PointLoad(force=1.0, location=1.0),
+        UDL(magnitude=2.0, start=0.0, end=4.0),
+        PointLoad(force=3.0, location=3.0),
+    ])
+    load_set[0] = PointMoment(moment=5.0, location=2.0)
+    del load_set[1]
+    load_set[-1] = PointLoad(force=6.0, location=6.0)
+    assert load_set == [
+        PointMoment(moment=5.0, location=2.0), PointLoad(force=6.0, location=6.0),
+    ]
+    np.testing.assert_allclose(load_set.point_forces, [6.0])
+    assert len(load_set.udl_magnitudes) == 0
+
+    negated = load_set.scaled(-1.0)
+    np.testing.assert_allclose(negated.moment_values, [-5.0])
+    np.testing.assert_allclose(load_set.moment_values, [5.0])
+    with pytest.raises(IndexError):
+        del load_set[2]
+
+
+
+def test_random_edits_match_a_list():
+    rng = np.random.default_rng(1)
+    choices = mixed_loads() + [TabulatedLoad([1.0, 2.0], [3.0, 4.0])]
+    load_set, expected = LoadSet(), []
+    for step in range(2000):
+        action = rng.integers(5) if expected else 0
+        load = choices[rng.integers(len(choices))]
+        if action == 0:
+            load_set.append(load)
+            expected.append(load)
+        elif action == 1:
+            load_set.extend(LoadSet([load, load]))
+            expected += [load, load]
+        elif action == 2:
+            i = int(rng.integers(-len(expected), len(expected)))
+            del load_set[i]
+            del expected[i]
+        elif action == 3:
+            i = int(rng.integers(len(expected)))
+            load_set[i] = load
+            expected[i] = load
+        elif load in expected:
+            i = load_set.index(load)
+            assert i == expected.index(load)
+            del load_set[i]
+            del expected[i]
+        if step % 100 == 0:
+            assert load_set == expected
+            assert load_set.copy() == expected
+    assert load_set == expected
+    assert len(load_set.point_forces) == sum(
+        isinstance(load, PointLoad) for load in expected
+    )
+    with pytest.raises(ValueError, match="Load not found"):
+        load_set.index(PointLoad(force=7.0, location=7.0))
+
+def test_varying_distributed_loads(tmp_path):
+    loads = [
+        UDL(magnitude=2.0, start=1.0, end=3.0),
+        TabulatedLoad([5.0, 6.0, 8.0], [1.0, 3.0, 0.0]),
+        TrapezoidalLoad(start_magnitude=0.0, end_magnitude=6.0, start=7.0),
+        PointLoad(force=1.0, location=2.0),
+    ]
+    load_set = LoadSet(loads)
+    assert list(load_set) == loads
+    assert len(load_set.tabulated) == 1
+
+    # Pieces are clipped to the beam, keeping the intensity at the cut
+    starts, ends, q_starts, q_ends = load_set.distributed_segments(7.0)
+    np.testing.assert_allclose(starts, [1.0, 5.0, 6.0])
+    np.testing.assert_allclose(ends, [3.0, 6.0, 7.0])
+    np.testing.assert_allclose(q_starts, [2.0, 1.0, 3.0])
+    np.testing.assert_allclose(q_ends, [2.0, 3.0, 1.5])
+
+    path = tmp_path / "loads.npz"
+    load_set.scaled(2.0).save(path)
+    restored = LoadSet.read(path)
+    assert restored.tabulated == [TabulatedLoad([5.0, 6.0, 8.0], [2.0, 6.0, 0.0])]
+    np.testing.assert_allclose(restored.linear_end_magnitudes, [12.0])
+    assert np.isnan(restored.linear_ends[0])
+
+    del load_set[1]
+    assert load_set.tabulated == []
+    assert load_set == [loads[0], loads[2], loads[3]]
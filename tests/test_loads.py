@@ -1,5 +1,8 @@
+import numpy as np
 import pytest
-from beam_analysis.loads import PointLoad, UDL, PointMoment
+from beam_analysis.loads import (
+    PointLoad, UDL, PointMoment, TabulatedLoad, TrapezoidalLoad
+)
 
 
 def test_point_load_initialization():
@@ -54,3 +57,29 @@ def test_point_moment_initialization():
 def test_point_moment_representation():
     load = PointMoment(moment=10.0, location=5.0)
     assert str(load) == "PointMoment(moment=10.0 kNm, location=5.0 m)"
+
+
+def test_trapezoidal_load():
+    load = TrapezoidalLoad(start_magnitude=0.0, end_magnitude=6.0, start=1.0, end=4.0)
+    assert str(load) == (
+        "TrapezoidalLoad(magnitude=0.0 -> 6.0 kN/m, start=1.0 m, end=4.0 m)"
+    )
+    with pytest.raises(ValueError):
+        TrapezoidalLoad(start_magnitude=1.0, end_magnitude=2.0, start=5.0, end=2.0)
+
+
+def test_tabulated_load():
+    load = TabulatedLoad([1.0, 2.0, 4.0], [3.0, 5.0, 0.0])
+    assert (load.start, load.end) == (1.0, 4.0)
+    assert load == TabulatedLoad(np.array([1.0, 2.0, 4.0]), [3, 5, 0])
+    assert load != TabulatedLoad([1.0, 2.0, 4.0], [3.0, 5.0, 1.0])
+    with pytest.raises(ValueError):
+        load.x[0] = 0.0  # Samples are read-only
+    with pytest.raises(ValueError):
+        TabulatedLoad([1.0], [3.0])
+    with pytest.raises(ValueError):
+        TabulatedLoad([1.0, 2.0], [3.0])
+    with pytest.raises(ValueError):
+        TabulatedLoad([2.0, 1.0], [3.0, 4.0])
+    with pytest.raises(ValueError):
+        TabulatedLoad([-1.0, 1.0], [3.0, 4.0])
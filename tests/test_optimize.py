@@ -0,0 +1,95 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.diagram import deflection_from_moment
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, PointMoment, UDL
+from beam_analysis.optimize import optimize_supports
+
+
+def test_two_supports_balance_span_and_overhang_moments():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    result = optimize_supports(
+        beam, [UDL(magnitude=1.0)], zones=[(0.0, 5.0), (5.0, 10.0)]
+    )
+    # Classic optimum: overhangs of (sqrt(2) - 1) / 2 L
+    a = (np.sqrt(2.0) - 1.0) / 2.0 * 10.0
+    locations = [s.location for s in result.beam.supports]
+    assert locations == pytest.approx([a, 10.0 - a], abs=1e-3)
+    assert result.objective == pytest.approx(a**2 / 2.0, rel=1e-5)
+    assert result.beam.supports[1].type == SupportType.ROLLER
+
+
+def test_support_types_and_fixed_zones():
+    beam = Beam(20.0, [Support(0.0, SupportType.PINNED), Support(10.0), Support(20.0)])
+    loads = [UDL(magnitude=1.0), PointLoad(force=20.0, location=15.0)]
+    result = optimize_supports(
+        beam, loads,
+        zones=[(0.0, 0.0), (5.0, 15.0), (20.0, 20.0)],
+        types=[
+            [SupportType.PINNED],
+            [SupportType.ROLLER],
+            [SupportType.ROLLER, SupportType.FIXED],
+        ],
+    )
+    assert result.beam.supports[0].location == 0.0
+    assert result.beam.supports[2].type == SupportType.FIXED
+
+    engine = AnalysisEngine(result.beam)
+    engine.add_loads(loads)
+    assert abs(engine.get_max_moment_info()[0]) == pytest.approx(result.objective)
+    # No screened layout with the original types is better
+    original = AnalysisEngine(beam)
+    original.add_loads(loads)
+    assert result.objective < abs(original.get_max_moment_info()[0])
+
+
+def test_deflection_objective_matches_engine():
+    beam = Beam(
+        10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=2.0e8, I=1.0e-4
+    )
+    result = optimize_supports(
+        beam, [UDL(magnitude=2.0)], zones=[(0.0, 4.0), (6.0, 10.0)],
+        objective="deflection",
+    )
+    engine = AnalysisEngine(result.beam)
+    engine.add_load(UDL(magnitude=2.0))
+    assert abs(engine.get_max_deflection_info()[0]) == pytest.approx(result.objective)
+    locations = [s.location for s in result.beam.supports]
+    assert locations == pytest.approx([2.23, 7.77], abs=0.01)
+
+
+def test_fixed_supports_and_point_moments_match_engine():
+    beam = Beam(12.0, [Support(0.0, SupportType.PINNED), Support(6.0), Support(12.0)])
+    loads = [PointLoad(20.0, 3.0), PointLoad(-15.0, 8.5), PointMoment(7.0, 5.0)]
+    types = [
+        [SupportType.PINNED, SupportType.FIXED],
+        [SupportType.ROLLER],
+        [SupportType.ROLLER, SupportType.FIXED],
+    ]
+    result = optimize_supports(beam, loads, types=types, starts=8)
+    engine = AnalysisEngine(result.beam)
+    engine.add_loads(loads)
+    assert abs(engine.get_max_moment_info()[0]) == pytest.approx(result.objective)
+    # Screening and refinement solve far fewer layouts than a full search
+    assert result.evaluations < 1000
+
+
+def test_deflection_from_moment_matches_fem():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(4.0),
+                       Support(10.0, SupportType.FIXED)], E=2.0e8, I=1.0e-4)
+    engine = AnalysisEngine(beam)
+    engine.add_loads([UDL(3.0, 1.0, 7.0), PointLoad(5.0, 9.0), PointMoment(4.0, 5.0)])
+    deflection = deflection_from_moment(beam, engine.get_diagrams()[1], beam.EI)
+    xs = np.linspace(0.0, 10.0, 101)
+    np.testing.assert_allclose(deflection(xs), engine.deflection_at(xs), atol=1e-12)
+
+
+def test_invalid_inputs():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    with pytest.raises(ValueError, match="Unknown objective"):
+        optimize_supports(beam, [], objective="weight")
+    with pytest.raises(ValueError, match="One zone"):
+        optimize_supports(beam, [], zones=[(0.0, 1.0)])
+    with pytest.raises(ValueError, match="stable beam"):
+        optimize_supports(Beam(10.0, [Support(0.0)]), [UDL(1.0)])
@@ -0,0 +1,47 @@
+import numpy as np
+from beam_analysis.plotter import ASCIIPlotter
+
+
+def plot_rows(plotter, xs, ys):
+    return plotter.plot(xs, ys, title="Test").renderable.split("\n")
+
+
+def test_plot_keeps_narrow_peaks():
+    # One sample in a million is the peak; it must still reach the top row
+    xs = np.linspace(0.0, 10.0, 1_000_000)
+    ys = np.sin(xs)
+    ys[123_456] = 5.0
+    rows = plot_rows(ASCIIPlotter(width=60, height=12), xs, ys)
+
+    assert len(rows) == 12
+    assert "█" in rows[0]
+
+
+def test_plot_fills_jumps_vertically():
+    # Shear of a central point load: +15 then -15, the jump falls in one column
+    xs = np.linspace(0.0, 10.0, 201)
+    ys = np.where(xs < 5.0, 15.0, -15.0)
+    plotter = ASCIIPlotter(width=40, height=10)
+    rows = plot_rows(plotter, xs, ys)
+
+    jump_column = int(5.0 / 10.0 * (plotter.width - 1))
+    for row in rows:
+        plain = row.replace("[green]", "").replace("[/green]", "")
+        plain = plain.replace("[red]", "").replace("[/red]", "")
+        assert len(plain) == plotter.width
+        assert plain[jump_column] == "█"
+
+
+def test_plot_merges_markup_runs():
+    xs = np.linspace(0.0, 10.0, 10_000)
+    ys = np.where(xs < 5.0, 15.0, -15.0)
+    rows = plot_rows(ASCIIPlotter(width=40, height=10), xs, ys)
+
+    assert rows[0].count("[green]") == 1
+    assert rows[-1].count("[red]") == 1
+    assert "[/green][green]" not in "".join(rows)
+
+
+def test_plot_constant_values():
+    rows = plot_rows(ASCIIPlotter(width=20, height=5), np.arange(5.0), np.zeros(5))
+    assert len(rows) == 5
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, PointMoment, UDL
+from beam_analysis.reliability import RandomLoad, monte_carlo
+
+
+def test_deterministic_samples_match_the_engine():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(4.0),
+                       Support(10.0, SupportType.FIXED)])
+    loads = [
+        PointLoad(force=10.0, location=3.0),
+        UDL(magnitude=2.0, start=1.0, end=6.0),
+        UDL(magnitude=1.0),
+    ]
+    fixed = [PointMoment(moment=8.0, location=3.0)]
+    result = monte_carlo(
+        beam, [RandomLoad(load) for load in loads], fixed, samples=5, dtype=np.float64
+    )
+
+    engine = AnalysisEngine(beam)
+    engine.add_loads(loads + fixed)
+    reactions = engine.calculate_reactions()
+    expected = abs(engine.get_max_moment_info()[0])
+    assert result.max_moment == pytest.approx(expected, rel=1e-4)
+    for i, support in enumerate(beam.supports):
+        rx = reactions[support.location]
+        assert result.reactions[:, i, 0] == pytest.approx(rx['fy'], abs=1e-4)
+        assert result.reactions[:, i, 1] == pytest.approx(rx['m'], abs=1e-4)
+
+
+def test_exceedance_of_a_normal_point_load():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    load = RandomLoad(PointLoad(force=10.0, location=5.0), magnitude_std=2.0)
+    result = monte_carlo(beam, [load], samples=200_000, chunk_size=30_000, seed=0)
+
+    assert result.max_moment.dtype == np.float32
+    assert result.max_moment.shape == (200_000,)
+    # M = 2.5 P, so M > 30 means P > 12: one standard deviation above the mean
+    probability = result.exceedance_probability(result.max_moment, 30.0)
+    assert probability == pytest.approx(0.1587, abs=0.003)
+    median, q10 = result.exceedance_quantiles(result.max_moment, (0.5, 0.1))
+    assert median == pytest.approx(25.0, rel=0.01)
+    assert q10 == pytest.approx(2.5 * (10.0 + 1.2816 * 2.0), rel=0.01)
+    assert np.mean(result.reactions[:, 0, 0]) == pytest.approx(5.0, rel=0.01)
+
+
+def test_random_positions_and_lognormal_magnitudes():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    moving = RandomLoad(PointLoad(force=10.0, location=0.0), position_range=(0.0, 10.0))
+    result = monte_carlo(beam, [moving], samples=50_000, seed=1)
+    # M_max = P a (L - a) / L for a uniform location a
+    assert np.mean(result.max_moment) == pytest.approx(10.0 * 10.0 / 6.0, rel=0.01)
+
+    lognormal = RandomLoad(
+        UDL(magnitude=1.0), magnitude_std=0.3, distribution="lognormal"
+    )
+    result = monte_carlo(beam, [lognormal], samples=50_000, seed=2)
+    assert result.max_moment.min() > 0.0
+    assert np.mean(result.max_moment) == pytest.approx(12.5, rel=0.01)
+
+
+def test_invalid_input():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    with pytest.raises(ValueError):
+        RandomLoad(PointMoment(moment=1.0, location=2.0))
+    with pytest.raises(ValueError):
+        RandomLoad(PointLoad(force=1.0, location=2.0), magnitude_std=-1.0)
+    with pytest.raises(ValueError):
+        RandomLoad(PointLoad(force=-1.0, location=2.0), distribution="lognormal")
+    with pytest.raises(ValueError):
+        outside = RandomLoad(
+            PointLoad(force=1.0, location=2.0), position_range=(0.0, 12.0)
+        )
+        monte_carlo(beam, [outside])
+    with pytest.raises(ValueError):
+        monte_carlo(beam, [], sections=7, resolution=2001)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+from beam_analysis.batch import run_batch
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.loads import PointLoad, UDL
+from beam_analysis.result_cache import ResultCache, analyze, model_hash
+
+
+def make_beam(length=10.0):
+    return Beam(length, [Support(0.0, SupportType.PINNED), Support(length)])
+
+
+LOADS = [PointLoad(force=10.0, location=5.0), UDL(magnitude=2.0, start=0.0, end=4.0)]
+
+
+def test_hash_is_canonical():
+    reordered = Beam(10.0, [Support(10.0), Support(0.0, SupportType.PINNED)])
+    assert model_hash(make_beam(), LOADS) == model_hash(reordered, LOADS[::-1])
+    assert model_hash(make_beam(), LOADS) != model_hash(make_beam(11.0), LOADS)
+    assert model_hash(make_beam(), LOADS) != model_hash(make_beam(), LOADS[:1])
+    assert model_hash(make_beam(), LOADS) != model_hash(make_beam(), LOADS, stations=51)
+
+
+def test_memory_tier_hits_and_lru_eviction():
+    cache = ResultCache(max_entries=2)
+    first = analyze(make_beam(), LOADS, cache=cache)
+    again = analyze(make_beam(), list(LOADS), cache=cache)
+
+    assert again is first
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    analyze(make_beam(11.0), LOADS, cache=cache)
+    analyze(make_beam(12.0), LOADS, cache=cache)  # evicts the 10 m beam
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    analyze(make_beam(), LOADS, cache=cache)
+    assert cache.stats.misses == 4
+
+
+def test_disk_tier_survives_across_caches(tmp_path):
+    path = tmp_path / "results.sqlite"
+    cache = ResultCache(path=path)
+    expected = analyze(make_beam(), LOADS, cache=cache)
+    cache.close()
+
+    reopened = ResultCache(path=path)
+    result = analyze(make_beam(), LOADS, cache=reopened)
+    assert reopened.stats.disk_hits == 1
+    assert result.reactions == expected.reactions
+    assert result.max_moment == expected.max_moment
+    np.testing.assert_array_equal(result.moment, expected.moment)
+
+
+def test_cached_result_matches_analysis():
+    result = analyze(make_beam(), LOADS, stations=11)
+    assert result.reactions[0.0]['fy'] == pytest.approx(5.0 + 8.0 * 8.0 / 10.0)
+    assert result.stations == pytest.approx(np.linspace(0.0, 10.0, 11))
+
+
+def test_batch_reuses_duplicate_models(tmp_path):
+    model = {
+        "length": 10.0,
+        "supports": [{"location": 0.0, "type": "PINNED"}, {"location": 10.0}],
+        "loads": [{"type": "point", "force": 10.0, "location": 5.0}],
+    }
+    path = tmp_path / "cache.sqlite"
+    results = list(run_batch([model] * 5, cache_path=path))
+
+    assert len(results) == 5
+    assert all(r["reactions"] == results[0]["reactions"] for r in results)
+    cache = ResultCache(path=path)
+    assert cache.get(model_hash(make_beam(), [PointLoad(10.0, 5.0)])) is not None
@@ -0,0 +1,154 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.loads import PointLoad, UDL, PointMoment, TrapezoidalLoad
+from beam_analysis.solver import MatrixBeamSolver
+
+
+def test_solver_matches_statics_for_cantilever():
+    beam = Beam(length=5.0, supports=[Support(0.0, SupportType.FIXED)])
+    loads = [PointLoad(force=10.0, location=5.0), PointMoment(moment=5.0, location=2.0)]
+    reactions = MatrixBeamSolver(beam, loads).solve_reactions()
+    assert reactions[0.0]['fy'] == pytest.approx(10.0)
+    # Reaction moment uses the same sign convention as AnalysisEngine
+    assert reactions[0.0]['m'] == pytest.approx(-55.0)
+
+
+def test_propped_cantilever_udl():
+    beam = Beam(
+        length=5.0,
+        supports=[Support(0.0, SupportType.FIXED), Support(5.0, SupportType.ROLLER)],
+    )
+    reactions = MatrixBeamSolver(beam, [UDL(magnitude=10.0)]).solve_reactions()
+    # R_fixed = 5wL/8, R_roller = 3wL/8, M_fixed = -wL^2/8 (hogging)
+    assert reactions[0.0]['fy'] == pytest.approx(31.25)
+    assert reactions[5.0]['fy'] == pytest.approx(18.75)
+    assert reactions[0.0]['m'] == pytest.approx(-31.25)
+
+
+def test_long_continuous_beam():
+    # 2000 equal spans under a full UDL: interior reactions tend to wL
+    n_spans = 2000
+    beam = Beam(
+        length=float(n_spans),
+        supports=[Support(float(i)) for i in range(n_spans + 1)],
+    )
+    reactions = MatrixBeamSolver(beam, [UDL(magnitude=2.0)]).solve_reactions()
+    assert sum(rx['fy'] for rx in reactions.values()) == pytest.approx(2.0 * n_spans)
+    assert reactions[1000.0]['fy'] == pytest.approx(2.0)
+
+
+def test_unstable_beam_raises():
+    beam = Beam(length=10.0, supports=[Support(5.0, SupportType.PINNED)])
+    with pytest.raises(ValueError, match="unstable"):
+        MatrixBeamSolver(beam, [PointLoad(force=1.0, location=2.0)]).solve_reactions()
+
+
+def test_loads_between_nodes_give_exact_reactions():
+    beam = Beam(
+        length=30.0,
+        supports=[
+            Support(0.0),
+            Support(10.0, SupportType.FIXED),
+            Support(22.0),
+            Support(30.0),
+        ],
+    )
+    loads = [
+        PointLoad(force=7.0, location=3.3),
+        UDL(magnitude=4.0, start=2.5, end=17.1),
+        PointMoment(moment=9.0, location=24.2),
+    ]
+    meshed = MatrixBeamSolver(beam, loads).solve_reactions()
+    # Mesh with nodes at the supports and beam ends only
+    coarse = MatrixBeamSolver(beam, []).solve_load_cases([loads])[0]
+    for loc, rx in meshed.items():
+        assert coarse[loc]['fy'] == pytest.approx(rx['fy'])
+        assert coarse[loc]['m'] == pytest.approx(rx['m'], abs=1e-9)
+
+
+def test_natural_modes_of_simple_beam_and_cantilever():
+    E, I, mass = 2.1e8, 8.356e-5, 50.0
+    # f_n = (n pi / L)^2 sqrt(EI / m) / (2 pi), with EI in N m^2
+    simple = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=E, I=I)
+    solver = MatrixBeamSolver(simple, [], max_element_length=0.1)
+    modes = solver.natural_modes(mass, modes=3)
+    exact = [
+        (n * np.pi / 10.0) ** 2 * np.sqrt(E * I * 1e3 / mass) / (2 * np.pi)
+        for n in (1, 2, 3)
+    ]
+    assert modes.frequencies == pytest.approx(exact, rel=1e-6)
+    assert modes.periods[0] == pytest.approx(1.0 / exact[0], rel=1e-6)
+    # Unit peak; the second mode is antisymmetric
+    assert abs(modes.shapes[0](np.array([5.0]))[0]) == pytest.approx(1.0)
+    quarter = abs(modes.shapes[0](np.array([2.5]))[0])
+    assert quarter == pytest.approx(np.sin(np.pi / 4), rel=1e-6)
+    assert modes.shapes[1](np.array([5.0]))[0] == pytest.approx(0.0, abs=1e-9)
+
+    cantilever = Beam(4.0, [Support(0.0, SupportType.FIXED)], E=E, I=I)
+    solver = MatrixBeamSolver(cantilever, [], max_element_length=0.04)
+    modes = solver.natural_modes(mass, modes=2)
+    assert modes.frequencies[0] == pytest.approx(
+        1.875104**2 / 16.0 * np.sqrt(E * I * 1e3 / mass) / (2 * np.pi), rel=1e-6
+    )
+
+
+def test_natural_modes_need_stiffness_and_mass():
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(10.0)])
+    with pytest.raises(ValueError):
+        MatrixBeamSolver(beam, []).natural_modes(50.0)
+    beam = Beam(
+        10.0, [Support(0.0, SupportType.PINNED), Support(10.0)], E=2.1e8, I=1e-4
+    )
+    with pytest.raises(ValueError):
+        MatrixBeamSolver(beam, []).natural_modes(0.0)
+    with pytest.raises(ValueError):
+        MatrixBeamSolver(beam, [], max_element_length=0.0)
+
+
+def test_internal_forces_from_element_end_forces():
+    from beam_analysis.diagram import compile_diagrams
+
+    beam = Beam(10.0, [Support(0.0, SupportType.PINNED), Support(4.0),
+                       Support(10.0, SupportType.FIXED)])
+    loads = [
+        PointLoad(force=10.0, location=3.0), UDL(magnitude=2.0, start=1.0, end=6.0),
+        PointMoment(moment=5.0, location=7.0), PointLoad(force=3.0, location=10.0),
+        TrapezoidalLoad(start_magnitude=4.0, end_magnitude=-1.0, start=5.0, end=9.0),
+    ]
+    solver = MatrixBeamSolver(beam, loads)
+    reactions = solver.solve_reactions()
+    forces = solver.element_end_forces()
+    # Every element is in equilibrium with its own distributed load
+    L = np.diff(solver.nodes)
+    w, slope = -solver._element_distributed_loads().T
+    np.testing.assert_allclose(
+        forces[:, 0] + forces[:, 2], w * L + slope * L**2 / 2.0, atol=1e-9
+    )
+
+    shear, moment = solver.internal_force_diagrams()
+    expected_shear, expected_moment = compile_diagrams(beam, loads, reactions)
+    xs = np.linspace(0.0, 10.0, 401)
+    np.testing.assert_allclose(shear(xs), expected_shear(xs), atol=1e-9)
+    np.testing.assert_allclose(moment(xs), expected_moment(xs), atol=1e-9)
+    assert moment.extremum() == pytest.approx(expected_moment.extremum())
+
+    # The element particular solutions make the deflection exact on any mesh
+    beam = Beam(10.0, beam.supports, E=2.0e8, I=1.0e-4)
+    coarse = MatrixBeamSolver(beam, loads)
+    fine = MatrixBeamSolver(beam, loads, max_element_length=0.5)
+    coarse.solve_reactions()
+    fine.solve_reactions()
+    np.testing.assert_allclose(
+        coarse.deflection_diagram()(xs), fine.deflection_diagram()(xs), atol=1e-12
+    )
+
+
+def test_fixed_end_actions_of_loads_between_nodes():
+    beam = Beam(6.0, [Support(0.0, SupportType.FIXED), Support(6.0, SupportType.FIXED)])
+    solver = MatrixBeamSolver(beam, [])
+    fea = solver.fixed_end_actions([PointLoad(force=12.0, location=3.0)])
+    # Fixed-fixed beam, central load: P/2 and PL/8 at each end
+    assert fea[0] == pytest.approx([-6.0, -9.0, -6.0, 9.0])
+    # Loads on a node act on the node, not on an element
+    assert not MatrixBeamSolver(beam, [PointLoad(12.0, 3.0)]).fixed_end_actions().any()
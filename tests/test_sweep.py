@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+from beam_analysis.beam import Beam, Support, SupportType
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, UDL
+from beam_analysis.sweep import sweep
+
+
+def continuous_beam():
+    return Beam(length=10.0, supports=[
+        Support(0.0, SupportType.PINNED),
+        Support(5.0, SupportType.ROLLER),
+        Support(10.0, SupportType.ROLLER),
+    ])
+
+
+def reference(beam, loads):
+    engine = AnalysisEngine(beam)
+    for load in loads:
+        engine.add_load(load)
+    rx = engine.calculate_reactions()
+    return (
+        engine.get_max_shear_info(),
+        engine.get_max_moment_info(),
+        [[rx[s.location]['fy'], rx[s.location]['m']] for s in beam.supports],
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep_matches_engine(workers):
+    beam = continuous_beam()
+    loads = [
+        PointLoad(force=10.0, location=2.0), UDL(magnitude=2.0, start=1.0, end=3.0)
+    ]
+    result = sweep(
+        beam, loads,
+        support_locations={1: [4.0, 5.0, 6.0]},
+        load_locations={0: np.linspace(0.0, 10.0, 6), 1: [0.0, 7.0]},
+        workers=workers, chunk_size=5,
+    )
+
+    assert result.names == ["support[1]", "load[0]", "load[1]"]
+    assert result.values.shape == (36, 3)
+    assert result.valid.all()
+    for i, (support, point, udl) in enumerate(result.values):
+        variant = Beam(length=10.0, supports=[
+            Support(0.0, SupportType.PINNED),
+            Support(support, SupportType.ROLLER),
+            Support(10.0, SupportType.ROLLER),
+        ])
+        shear, moment, reactions = reference(variant, [
+            PointLoad(force=10.0, location=point),
+            UDL(magnitude=2.0, start=udl, end=udl + 2.0),
+        ])
+        assert result.max_shear[i, 0] == pytest.approx(shear[0])
+        assert result.max_moment[i, 0] == pytest.approx(moment[0])
+        np.testing.assert_allclose(result.reactions[i], reactions, atol=1e-9)
+
+
+def test_sweep_length_of_simple_beam():
+    beam = Beam(length=10.0, supports=[Support(0.0, SupportType.PINNED), Support(2.0)])
+    result = sweep(beam, [UDL(magnitude=1.0)], lengths=[4.0, 6.0, 8.0])
+    # Overhang of a - 2 beyond the second support
+    np.testing.assert_allclose(
+        np.abs(result.max_moment[:, 0]), [2.0, 8.0, 18.0], rtol=1e-9
+    )
+    np.testing.assert_allclose(result.column("length"), [4.0, 6.0, 8.0])
+
+
+def test_invalid_variants_are_flagged():
+    beam = Beam(length=10.0, supports=[Support(0.0, SupportType.PINNED), Support(10.0)])
+    result = sweep(beam, [PointLoad(force=1.0, location=5.0)], lengths=[8.0, 10.0])
+    assert result.valid.tolist() == [False, True]
+    assert np.isnan(result.reactions[0]).all()
+    assert result.reactions[1, :, 0] == pytest.approx([0.5, 0.5])
+
+
+def test_coincident_supports_are_flagged():
+    beam = Beam(length=10.0, supports=[Support(0.0, SupportType.PINNED), Support(10.0)])
+    load = PointLoad(force=-5.0, location=5.0)
+    result = sweep(beam, [load], support_locations={0: [0.0, 5.0, 10.0]})
+    assert result.valid.tolist() == [True, True, False]
+    assert np.isnan(result.reactions[2]).all()
+
+    result = sweep(continuous_beam(), [load], support_locations={1: [0.0, 5.0]})
+    assert result.valid.tolist() == [False, True]
+
+
+def test_unknown_parameters():
+    beam = continuous_beam()
+    with pytest.raises(ValueError, match="Unknown support index"):
+        sweep(beam, [], support_locations={3: [1.0]})
+    with pytest.raises(ValueError, match="Unknown load index"):
+        sweep(beam, [], load_locations={0: [1.0]})
+    with pytest.raises(KeyError):
+        sweep(beam, []).column("length")
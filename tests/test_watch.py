@@ -0,0 +1,99 @@
+import json
+import os
+import pytest
+from typer.testing import CliRunner
+from beam_analysis.cli import app
+from beam_analysis.engine import AnalysisEngine
+from beam_analysis.loads import PointLoad, UDL
+from beam_analysis.watch import ModelWatcher, diff_loads
+
+runner = CliRunner()
+
+MODEL = {
+    "length": 10.0,
+    "supports": [
+        {"location": 0.0, "type": "PINNED"}, {"location": 10.0, "type": "ROLLER"},
+    ],
+    "loads": [
+        {"type": "point", "force": 10.0, "location": 5.0},
+        {"type": "udl", "magnitude": 2.0, "start": 0.0, "end": 4.0},
+    ],
+}
+
+
+def write(path, model, stamp):
+    path.write_text(json.dumps(model))
+    os.utime(path, ns=(stamp, stamp))  # Distinct mtimes on coarse clocks
+
+
+def test_diff_loads_ignores_order():
+    a, b, c = PointLoad(10.0, 5.0), UDL(2.0, 0.0, 4.0), PointLoad(1.0, 1.0)
+    assert diff_loads([a, b, a], [b, a, c]) == ([a], [c])
+
+
+def test_diff_loads_compares_tabulated_samples():
+    from beam_analysis.loads import TabulatedLoad
+    from beam_analysis.model_io import load_from_dict, load_to_dict
+
+    a, b = TabulatedLoad([0.0, 2.0], [1.0, 3.0]), TabulatedLoad([0.0, 2.0], [1.0, 4.0])
+    assert load_from_dict(json.loads(json.dumps(load_to_dict(a)))) == a
+    assert diff_loads([a, b], [load_from_dict(load_to_dict(b))]) == ([a], [])
+
+
+def test_watcher_updates_changed_loads_incrementally(tmp_path, monkeypatch):
+    path = tmp_path / "kiris.json"
+    write(path, MODEL, 1_000_000_000)
+    watcher = ModelWatcher([tmp_path])
+
+    (first,) = watcher.poll()
+    assert first.rebuilt and first.panels[0] == "summary"
+    assert watcher.poll() == []
+
+    # Moving the UDL is one update of the solved engine
+    rebuilds = []
+    get_diagrams = AnalysisEngine.get_diagrams
+    monkeypatch.setattr(AnalysisEngine, "get_diagrams", lambda self: (
+        rebuilds.append(self) or get_diagrams(self)
+    ))
+    moved = dict(MODEL["loads"][1], start=6.0, end=10.0)
+    changed = dict(MODEL, loads=[MODEL["loads"][0], moved])
+    write(path, changed, 2_000_000_000)
+    (update,) = watcher.poll()
+    assert not update.rebuilt
+    assert (update.added, update.removed) == (1, 1)
+    assert update.engine is first.engine and update.engine.solve_count == 1
+    reactions = update.engine.calculate_reactions()
+    assert [rx['fy'] for rx in reactions.values()] == pytest.approx([6.6, 11.4])
+    assert "reactions" in update.panels and "extrema" in update.panels
+    assert rebuilds == []  # The diagrams are only rebuilt to draw the extrema
+
+    # Swapping two loads in the file only reorders the input panels
+    write(path, dict(changed, loads=changed["loads"][::-1]), 3_000_000_000)
+    (update,) = watcher.poll()
+    assert (update.added, update.removed) == (0, 0)
+    assert update.panels == ["summary", "schematic"]
+
+    path.unlink()
+    (update,) = watcher.poll()
+    assert update.deleted
+
+
+def test_watcher_reports_invalid_models(tmp_path):
+    path = tmp_path / "kiris.json"
+    write(path, dict(MODEL, length=-1.0), 1_000_000_000)
+    (update,) = ModelWatcher([path]).poll()
+    assert "Length must be positive" in update.error
+
+    supports = [{"location": 3.0, "type": "PINNED"}, {"location": 3.0}]
+    write(path, dict(MODEL, supports=supports), 2_000_000_000)
+    (update,) = ModelWatcher([path]).poll()
+    assert update.error == "Supports coincide."
+
+
+def test_cli_watch_once(tmp_path):
+    path = tmp_path / "kiris.json"
+    write(path, MODEL, 1_000_000_000)
+    result = runner.invoke(app, ["watch", str(path), "--once"])
+    assert result.exit_code == 0
+    assert "Mesnet Reaksiyonları" in result.output
+    assert "Girdi Özeti" in result.output